@@ -1,4 +1,4 @@
-from pydantic import Field
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,14 +8,83 @@ class Settings(BaseSettings):
     POSTGRES_DB: str
     DB_HOST: str = "db"
     DB_PORT: int = 5432
+    # Full SQLAlchemy URL; overrides the POSTGRES_* / DB_* settings when set
+    DB_URL: str | None = None
+    SQL_ECHO: bool = True
+    # Run `alembic upgrade head` at startup; turn off to migrate as a separate deploy step
+    DB_MIGRATE_ON_STARTUP: bool = True
+    # Connection pool of the async engine; sized for many concurrent requests per worker
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
 
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Users resolved by get_current_user. Logout and account deletion evict
+    # the entry only in the worker that handled them; other workers accept the
+    # revoked token until their entry expires, so the TTL is the revocation
+    # window. 0 turns the cache off.
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 5.0
+    TOKEN_CACHE_SIZE: int = 10000
+
+    # Password hashing: Argon2 cost (memory in KiB) and its process pool.
+    # Requests beyond workers + queue limit get a 503.
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    HASH_WORKERS: int = 2
+    HASH_QUEUE_LIMIT: int = 64
+
+    # List endpoints
+    PAGE_SIZE_DEFAULT: int = 100
+    PAGE_SIZE_MAX: int = 500
+
+    # Operations accepted by one POST /batch
+    BATCH_MAX_OPERATIONS: int = 100
+
+    # Autocomplete: "auto" uses trigram indexes on PostgreSQL and an in-memory trie elsewhere
+    SEARCH_BACKEND: Literal["auto", "database", "trie"] = "auto"
+    AUTOCOMPLETE_LIMIT_DEFAULT: int = 10
+    AUTOCOMPLETE_LIMIT_MAX: int = 50
+
+    # Weekly grid used by the timetable generator
+    TIMETABLE_DAYS: int = 5
+    TIMETABLE_PERIODS_PER_DAY: int = 8
+    SOLVER_TIME_LIMIT_SECONDS: float = 5.0
+    # Portfolio mode: parallel solver runs and the quality that ends it early
+    SOLVER_WORKERS: int = 4
+    SOLVER_PORTFOLIO_SIZE: int = 8
+    SOLVER_TARGET_PENALTY: int = 0
+    REPAIR_TIME_LIMIT_SECONDS: float = 0.5
+    BULK_INSERT_BATCH_SIZE: int = 1000
+    # Row errors listed in a CSV import report; imports commit BULK_INSERT_BATCH_SIZE rows at a time
+    IMPORT_MAX_ERRORS: int = 1000
+    EXPORT_CHUNK_SIZE: int = 1000
+
+    # GET /events: open streams per worker, events buffered per stream
+    # before it is told to resync, and keep-alive interval for idle streams
+    EVENTS_MAX_SUBSCRIBERS: int = 10000
+    EVENTS_QUEUE_SIZE: int = 64
+    EVENTS_HEARTBEAT_SECONDS: float = 15.0
+    # Lifetime of the ?token= stream tokens from POST /events/token
+    EVENTS_TOKEN_EXPIRE_SECONDS: int = 60
+
+    # GET /metrics: scrapers send it as a bearer token; unset, the endpoint is disabled
+    METRICS_TOKEN: str | None = None
+
+    # Background PDF rendering
+    PDF_WORKERS: int = 2
+    PDF_QUEUE_LIMIT: int = 32
+    PDF_CACHE_DIR: str = "pdf_cache"
+    # How long a failed render's error stays readable at /timetable/pdf-jobs/{id}
+    PDF_JOB_TTL_SECONDS: int = 600
 
     # This is not a Pydantic Field, just a property function
     @property
     def DATABASE_URL(self) -> str:
+        if self.DB_URL:
+            return self.DB_URL
         return (
             f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
             f"@{self.DB_HOST}:{self.DB_PORT}/{self.POSTGRES_DB}"
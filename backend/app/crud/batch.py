@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud import classroom, department, faculty, subject, timetable
+from app.models.classroom import Classroom
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.subject import Subject
+from app.models.timetable import Timetable
+from app.schemas.batch import BatchAction, BatchEntity, BatchOperation
+from app.schemas.classroom import ClassroomCreate, ClassroomRead, ClassroomUpdate
+from app.schemas.department import DepartmentCreate, DepartmentRead, DepartmentUpdate
+from app.schemas.faculty import FacultyCreate, FacultyRead, FacultyUpdate
+from app.schemas.subject import SubjectCreate, SubjectRead, SubjectUpdate
+from app.schemas.timetable import TimetableCreate, TimetableRead, TimetableUpdate
+
+# POST /batch: the same service functions the routers call, run in order in
+# one session and committed once. Rows fetched by an earlier operation
+# (FK checks included) come from the session's identity map afterwards.
+
+
+@dataclass(frozen=True)
+class Resource:
+    model: type[SQLModel]
+    create_schema: type[SQLModel]
+    update_schema: type[SQLModel]
+    read_schema: type[SQLModel]
+    load_options: Callable[[], list]
+    create: Callable
+    update: Callable
+    delete: Callable
+    deleted_message: str
+    # Timetable updates and deletes also take the caller's college and 404 outside it
+    scoped: bool = False
+
+
+RESOURCES = {
+    BatchEntity.SUBJECT: Resource(
+        Subject, SubjectCreate, SubjectUpdate, SubjectRead, subject.subject_load_options,
+        subject.create_subject, subject.update_subject, subject.delete_subject,
+        "Subject deleted successfully",
+    ),
+    BatchEntity.FACULTY: Resource(
+        Faculty, FacultyCreate, FacultyUpdate, FacultyRead, faculty.faculty_load_options,
+        faculty.create_faculty, faculty.update_faculty, faculty.delete_faculty,
+        "Faculty deleted successfully",
+    ),
+    BatchEntity.CLASSROOM: Resource(
+        Classroom, ClassroomCreate, ClassroomUpdate, ClassroomRead, classroom.classroom_load_options,
+        classroom.create_classroom, classroom.update_classroom, classroom.delete_classroom,
+        "Classroom deleted successfully",
+    ),
+    BatchEntity.DEPARTMENT: Resource(
+        Department, DepartmentCreate, DepartmentUpdate, DepartmentRead, department.department_load_options,
+        department.create_department, department.update_department, department.delete_department,
+        "Department deleted successfully",
+    ),
+    BatchEntity.TIMETABLE: Resource(
+        Timetable, TimetableCreate, TimetableUpdate, TimetableRead, timetable.timetable_load_options,
+        timetable.create_timetable, timetable.update_timetable, timetable.delete_timetable,
+        "Timetable deleted successfully",
+        scoped=True,
+    ),
+}
+
+
+async def run_operation(db: AsyncSession, operation: BatchOperation, college_id: int | None) -> dict[str, Any]:
+    resource = RESOURCES[operation.entity]
+    if operation.action != BatchAction.CREATE and operation.id is None:
+        raise HTTPException(status_code=422, detail=f"id is required to {operation.action.value}")
+    scope = (college_id,) if resource.scoped else ()
+
+    if operation.action == BatchAction.DELETE:
+        public = await resource.delete(db, operation.id, *scope)
+        return {"message": resource.deleted_message, "data": public.model_dump(mode="json")}
+
+    try:
+        if operation.action == BatchAction.CREATE:
+            data = resource.create_schema.model_validate(operation.data)
+        else:
+            data = resource.update_schema.model_validate(operation.data)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+
+    if operation.action == BatchAction.CREATE:
+        row = await resource.create(db, data, college_id)
+    else:
+        row = await resource.update(db, operation.id, data, *scope)
+    # Serialize now, as the individual call would have, before later operations change the row
+    row = await db.get(resource.model, row.id, options=resource.load_options(), populate_existing=True)
+    return resource.read_schema.model_validate(row).model_dump(mode="json")
+
+
+async def run_batch(db: AsyncSession, operations: list[BatchOperation], college_id: int | None) -> list[dict[str, Any]]:
+    """All operations or none: the first failure rolls back the batch and names its index."""
+    results = []
+    for index, operation in enumerate(operations):
+        try:
+            results.append(await run_operation(db, operation, college_id))
+        except HTTPException as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=e.status_code,
+                detail={"index": index, "detail": e.detail},
+                headers=e.headers,
+            )
+    await db.commit()
+    return results
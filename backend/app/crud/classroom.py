@@ -0,0 +1,81 @@
+from fastapi import HTTPException
+from sqlalchemy.orm import joinedload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud.stats import bump_count, bump_version
+from app.crud.timetable import delete_placements
+from app.database import on_commit
+from app.events.broker import publish_on_commit
+from app.models.classroom import Classroom
+from app.models.department import Department
+from app.models.timetable_entry import TimetableEntry
+from app.schemas.classroom import ClassroomCreate, ClassroomRead, ClassroomUpdate
+from app.search.trie import registry as search_indexes
+
+# Writes stop at a flush; the caller commits (one request or one /batch)
+
+
+def classroom_load_options():
+    # Relationships nested in ClassroomRead, loaded up front instead of per row
+    return [joinedload(Classroom.department)]
+
+
+async def create_classroom(session: AsyncSession, classroom: ClassroomCreate, college_id: int | None) -> Classroom:
+    department = await session.get(Department, classroom.department_id)
+    if not department:
+        raise HTTPException(status_code=404, detail="Department not found")
+
+    existing_classroom = (await session.exec(
+        select(Classroom).where(
+            Classroom.room_no == classroom.room_no,
+            Classroom.department_id == classroom.department_id
+        )
+    )).first()
+    if existing_classroom:
+        raise HTTPException(
+            status_code=400,
+            detail="Classroom with this room number already exists in this department"
+        )
+
+    db_classroom = Classroom.model_validate(classroom)
+    db_classroom.college_id = college_id
+    session.add(db_classroom)
+    await session.exec(bump_count(college_id, Classroom, 1))
+    await session.flush()
+    on_commit(session, search_indexes.upsert, college_id, ("classroom", db_classroom.id, db_classroom.room_no))
+    publish_on_commit(session, college_id, "classroom", "created", id=db_classroom.id)
+    return db_classroom
+
+
+async def update_classroom(session: AsyncSession, classroom_id: int, classroom: ClassroomUpdate) -> Classroom:
+    db_classroom = await session.get(Classroom, classroom_id)
+    if not db_classroom:
+        raise HTTPException(status_code=404, detail="Classroom not found")
+    classroom_data = classroom.model_dump(exclude_unset=True)
+
+    # Ensure department exists if changed
+    if "department_id" in classroom_data:
+        department = await session.get(Department, classroom_data["department_id"])
+        if not department:
+            raise HTTPException(status_code=404, detail="Department not found")
+
+    for field, value in classroom_data.items():
+        setattr(db_classroom, field, value)
+    session.add(db_classroom)
+    await session.exec(bump_version(db_classroom.college_id, Classroom))
+    on_commit(session, search_indexes.upsert, db_classroom.college_id, ("classroom", db_classroom.id, db_classroom.room_no))
+    publish_on_commit(session, db_classroom.college_id, "classroom", "updated", id=db_classroom.id)
+    return db_classroom
+
+
+async def delete_classroom(session: AsyncSession, classroom_id: int) -> ClassroomRead:
+    db_classroom = await session.get(Classroom, classroom_id, options=classroom_load_options())
+    if not db_classroom:
+        raise HTTPException(status_code=404, detail="Classroom not found")
+    classroom_public = ClassroomRead.model_validate(db_classroom)
+    await delete_placements(session, TimetableEntry.classroom_id, db_classroom.id, db_classroom.college_id)
+    await session.delete(db_classroom)
+    await session.exec(bump_count(db_classroom.college_id, Classroom, -1))
+    on_commit(session, search_indexes.remove, db_classroom.college_id, "classroom", db_classroom.id)
+    publish_on_commit(session, db_classroom.college_id, "classroom", "deleted", id=db_classroom.id)
+    return classroom_public
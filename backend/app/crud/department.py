@@ -0,0 +1,56 @@
+from fastapi import HTTPException
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud.stats import bump_count, bump_version
+from app.database import on_commit
+from app.events.broker import publish_on_commit
+from app.models.department import Department
+from app.schemas.department import DepartmentCreate, DepartmentRead, DepartmentUpdate
+from app.search.trie import registry as search_indexes
+
+# Writes stop at a flush; the caller commits (one request or one /batch)
+
+
+def department_load_options():
+    # DepartmentRead nests nothing
+    return []
+
+
+async def create_department(db: AsyncSession, dept: DepartmentCreate, college_id: int | None) -> Department:
+    existing = (await db.exec(select(Department).where(Department.name == dept.name))).first()
+    if existing:
+        raise HTTPException(status_code=400, detail="Department with this name and year already exists")
+
+    db_dept = Department.model_validate(dept)
+    db_dept.college_id = college_id
+    db.add(db_dept)
+    await db.exec(bump_count(college_id, Department, 1))
+    await db.flush()
+    on_commit(db, search_indexes.upsert, college_id, ("department", db_dept.id, db_dept.name))
+    publish_on_commit(db, college_id, "department", "created", id=db_dept.id)
+    return db_dept
+
+
+async def update_department(db: AsyncSession, department_id: int, dept: DepartmentUpdate) -> Department:
+    existing = await db.get(Department, department_id)
+    if not existing:
+        raise HTTPException(status_code=404, detail="Department not found")
+    for field, value in dept.model_dump(exclude_unset=True).items():
+        setattr(existing, field, value)
+    db.add(existing)
+    await db.exec(bump_version(existing.college_id, Department))
+    on_commit(db, search_indexes.upsert, existing.college_id, ("department", existing.id, existing.name))
+    publish_on_commit(db, existing.college_id, "department", "updated", id=existing.id)
+    return existing
+
+
+async def delete_department(db: AsyncSession, department_id: int) -> DepartmentRead:
+    existing = await db.get(Department, department_id)
+    if not existing:
+        raise HTTPException(status_code=404, detail="Department not found")
+    department_public = DepartmentRead.model_validate(existing)
+    await db.delete(existing)
+    await db.exec(bump_count(existing.college_id, Department, -1))
+    on_commit(db, search_indexes.remove, existing.college_id, "department", existing.id)
+    publish_on_commit(db, existing.college_id, "department", "deleted", id=existing.id)
+    return department_public
@@ -1,33 +1,63 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlmodel import Session
-from app.database import get_db
-from .jwt import decode_access_token
-from .user import get_user_by_username, get_user_by_email
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import async_engine, get_async_db
+from .jwt import STREAM_SCOPE, decode_access_token
+from .user import cache_principal, cached_principal, get_user_by_username, get_user_by_email
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    session: Session = Depends(get_db)
+    session: AsyncSession = Depends(get_async_db)
 ):
     payload = decode_access_token(token)
 
-    if not payload:
+    # Stream tokens open GET /events and nothing else
+    if not payload or payload.get("scope") is not None:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    return await principal_of(payload, session)
+
+
+async def principal_of(payload: dict, session: AsyncSession):
     email = payload.get("sub")
     token_version = payload.get("token_version")
 
     if email is None or token_version is None:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = get_user_by_email(session, email)
+    user = cached_principal(email)
 
-    if not user:
-        raise HTTPException(status_code=401, detail="User no longer exists")
+    # Token versions only grow: a newer token than the snapshot means it is stale
+    if user is None or user.token_version < token_version:
+        db_user = await get_user_by_email(session, email)
+        if not db_user:
+            raise HTTPException(status_code=401, detail="User no longer exists")
+        user = cache_principal(db_user)
 
     if user.token_version != token_version:
         raise HTTPException(status_code=401, detail="Token revoked")
 
     return user
+
+
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
+
+async def get_stream_user(
+    token: str | None = Query(default=None),
+    bearer: str | None = Depends(optional_oauth2_scheme),
+):
+    # EventSource can't set headers, so it sends a stream token from
+    # POST /events/token as ?token= instead; query strings end up in access
+    # logs, so API tokens aren't accepted there.
+    # The session is closed before the stream starts: an open stream holds no connection.
+    if not (bearer or token):
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        if bearer:
+            return await get_current_user(bearer, session)
+        payload = decode_access_token(token)
+        if not payload or payload.get("scope") != STREAM_SCOPE:
+            raise HTTPException(status_code=401, detail="Invalid token")
+        return await principal_of(payload, session)
@@ -0,0 +1,84 @@
+from fastapi import Request, Response
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud.stats import COUNTERS
+from app.models.classroom import Classroom
+from app.models.college_stats import CollegeStats
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.subject import Subject
+from app.models.timetable import Timetable
+
+# Strong ETags for the per-college collections, computed from a single
+# indexed lookup so an unchanged resource is answered with 304 before the
+# main query runs. Read schemas nest related rows (a subject carries its
+# faculty and department), so a collection's tag covers those too.
+
+DEPENDS_ON = {
+    Department: (Department,),
+    Faculty: (Faculty, Department),
+    Classroom: (Classroom, Department),
+    Subject: (Subject, Faculty, Department),
+    Timetable: (Faculty, Department),
+}
+
+# Revalidate on every use; the tag makes that cheap
+CACHE_CONTROL = "private, no-cache"
+
+
+def _version_columns(model):
+    return [getattr(CollegeStats, f"{COUNTERS[m]}_version") for m in DEPENDS_ON[model]]
+
+
+async def collection_etag(db: AsyncSession, college_id: int | None, model) -> str | None:
+    """Tag of one college's collection, or None for colleges without a stats row."""
+    if college_id is None:
+        return None
+    # The key column keeps rows as tuples even for a single version column
+    stamp = (await db.exec(
+        select(CollegeStats.college_id, *_version_columns(model)).where(CollegeStats.college_id == college_id)
+    )).first()
+    if stamp is None:
+        return None
+    _, *versions = stamp
+    return f'"{model.__tablename__}-{college_id}-{"-".join(map(str, versions))}"'
+
+
+async def timetable_etag(db: AsyncSession, college_id: int | None) -> str | None:
+    # Entry writes touch updated_at too, so this also changes with the entries
+    stamp = (await db.exec(
+        select(func.count(Timetable.id), func.max(Timetable.updated_at), *_version_columns(Timetable))
+        .select_from(Timetable)
+        .outerjoin(CollegeStats, CollegeStats.college_id == Timetable.college_id)
+        .where(Timetable.college_id == college_id)
+        .group_by(*_version_columns(Timetable))
+    )).first()
+    if stamp is None:
+        return f'"timetable-{college_id}-0"'
+    count, last_update, *versions = stamp
+    if None in versions:
+        return None
+    return f'"timetable-{college_id}-{count}-{_stamp(last_update)}-{"-".join(map(str, versions))}"'
+
+
+def entries_etag(timetable: Timetable) -> str:
+    return f'"entries-{timetable.id}-{_stamp(timetable.updated_at)}"'
+
+
+def _stamp(value) -> str:
+    return f"{value.timestamp():.6f}" if value is not None else "0"
+
+
+def not_modified(request: Request, response: Response, etag: str | None) -> Response | None:
+    """Set the validator headers; return a 304 to send instead if the client's copy is current."""
+    if etag is None:
+        return None
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    candidates = request.headers.get("if-none-match")
+    if candidates is None:
+        return None
+    tags = {tag.strip().removeprefix("W/") for tag in candidates.split(",")}
+    if etag in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    return None
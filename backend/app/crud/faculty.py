@@ -0,0 +1,60 @@
+from fastapi import HTTPException
+from sqlalchemy.orm import joinedload
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud.stats import bump_count, bump_version
+from app.crud.timetable import delete_placements
+from app.database import on_commit
+from app.events.broker import publish_on_commit
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.timetable_entry import TimetableEntry
+from app.schemas.faculty import FacultyCreate, FacultyRead, FacultyUpdate
+from app.search.trie import registry as search_indexes
+
+# Writes stop at a flush; the caller commits (one request or one /batch)
+
+
+def faculty_load_options():
+    # Relationships nested in FacultyRead, loaded up front instead of per row
+    return [joinedload(Faculty.department)]
+
+
+async def create_faculty(db: AsyncSession, faculty: FacultyCreate, college_id: int | None) -> Faculty:
+    if not await db.get(Department, faculty.department_id):
+        raise HTTPException(status_code=404, detail="Department not found")
+    db_faculty = Faculty.model_validate(faculty)
+    db_faculty.college_id = college_id
+    db.add(db_faculty)
+    await db.exec(bump_count(college_id, Faculty, 1))
+    await db.flush()
+    on_commit(db, search_indexes.upsert, college_id, ("faculty", db_faculty.id, db_faculty.name))
+    publish_on_commit(db, college_id, "faculty", "created", id=db_faculty.id)
+    return db_faculty
+
+
+async def update_faculty(db: AsyncSession, faculty_id: int, faculty: FacultyUpdate) -> Faculty:
+    db_faculty = await db.get(Faculty, faculty_id)
+    if not db_faculty:
+        raise HTTPException(status_code=404, detail="Faculty not found")
+    if not await db.get(Department, faculty.department_id):
+        raise HTTPException(status_code=404, detail="Department not found")
+    for field, value in faculty.model_dump(exclude_unset=True).items():
+        setattr(db_faculty, field, value)
+    db.add(db_faculty)
+    await db.exec(bump_version(db_faculty.college_id, Faculty))
+    on_commit(db, search_indexes.upsert, db_faculty.college_id, ("faculty", db_faculty.id, db_faculty.name))
+    publish_on_commit(db, db_faculty.college_id, "faculty", "updated", id=db_faculty.id)
+    return db_faculty
+
+
+async def delete_faculty(db: AsyncSession, faculty_id: int) -> FacultyRead:
+    db_faculty = await db.get(Faculty, faculty_id, options=faculty_load_options())
+    if not db_faculty:
+        raise HTTPException(status_code=404, detail="Faculty not found")
+    faculty_public = FacultyRead.model_validate(db_faculty)
+    await delete_placements(db, TimetableEntry.faculty_id, db_faculty.id, db_faculty.college_id)
+    await db.delete(db_faculty)
+    await db.exec(bump_count(db_faculty.college_id, Faculty, -1))
+    on_commit(db, search_indexes.remove, db_faculty.college_id, "faculty", db_faculty.id)
+    publish_on_commit(db, db_faculty.college_id, "faculty", "deleted", id=db_faculty.id)
+    return faculty_public
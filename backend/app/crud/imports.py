@@ -0,0 +1,154 @@
+import csv
+import io
+from typing import BinaryIO
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, select
+from app.config import settings
+from app.crud.stats import bump_count
+from app.events.broker import publish_on_commit
+from app.models.classroom import Classroom
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.subject import Subject
+from app.schemas.classroom import ClassroomCreate
+from app.schemas.faculty import FacultyCreate
+from app.schemas.imports import ImportReport, ImportRowError
+from app.schemas.subject import SubjectCreate
+
+# CSV bulk import: rows are read one at a time from the upload, validated
+# against the Create schema and against foreign keys loaded once per
+# import, and inserted in batches of BULK_INSERT_BATCH_SIZE, one
+# transaction per batch. Bad rows are reported, not fatal.
+
+
+def _ids(db: Session, model, college_id: int | None) -> set[int]:
+    return set(db.exec(select(model.id).where(model.college_id == college_id)).all())
+
+
+class Importer:
+    model = None
+    schema = None
+
+    def __init__(self, db: Session, college_id: int | None):
+        self.college_id = college_id
+        self.departments = _ids(db, Department, college_id)
+
+    def check(self, item) -> list[str]:
+        """Foreign-key and uniqueness errors of a validated row; accepting it reserves any unique keys."""
+        if item.department_id not in self.departments:
+            return [f"department_id: department {item.department_id} not found"]
+        return []
+
+
+class FacultyImporter(Importer):
+    model = Faculty
+    schema = FacultyCreate
+
+
+class SubjectImporter(Importer):
+    model = Subject
+    schema = SubjectCreate
+
+    def __init__(self, db: Session, college_id: int | None):
+        super().__init__(db, college_id)
+        self.faculties = _ids(db, Faculty, college_id)
+
+    def check(self, item) -> list[str]:
+        errors = super().check(item)
+        if item.faculty_id not in self.faculties:
+            errors.append(f"faculty_id: faculty {item.faculty_id} not found")
+        return errors
+
+
+class ClassroomImporter(Importer):
+    model = Classroom
+    schema = ClassroomCreate
+
+    def __init__(self, db: Session, college_id: int | None):
+        super().__init__(db, college_id)
+        self.rooms = set(db.exec(
+            select(Classroom.room_no, Classroom.department_id)
+            .where(Classroom.department_id.in_(self.departments))
+        ).all())
+
+    def check(self, item) -> list[str]:
+        errors = super().check(item)
+        if errors:
+            return errors
+        room = (item.room_no, item.department_id)
+        if room in self.rooms:
+            return [f"room_no: room {item.room_no} already exists in this department"]
+        self.rooms.add(room)
+        return []
+
+
+def import_csv(db: Session, importer: Importer, upload: BinaryIO) -> ImportReport:
+    report = ImportReport()
+    reader = csv.DictReader(io.TextIOWrapper(upload, encoding="utf-8-sig", newline=""))
+    try:
+        columns = set(reader.fieldnames or [])
+    except (UnicodeDecodeError, csv.Error):
+        raise HTTPException(status_code=400, detail="Upload is not a UTF-8 CSV file")
+    missing = [name for name in importer.schema.model_fields if name not in columns]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Missing CSV columns: {', '.join(missing)}")
+
+    batch, lines = [], []
+    while True:
+        try:
+            row = next(reader, None)
+        except (UnicodeDecodeError, csv.Error) as e:
+            _fail(report, reader.line_num, [f"unreadable CSV, import stopped: {e}"])
+            break
+        if row is None:
+            break
+
+        line = reader.line_num
+        try:
+            item = importer.schema.model_validate(
+                {key: value.strip() for key, value in row.items() if key is not None and value is not None}
+            )
+        except ValidationError as e:
+            _fail(report, line, [
+                f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors()
+            ])
+            continue
+        errors = importer.check(item)
+        if errors:
+            _fail(report, line, errors)
+            continue
+
+        batch.append({**item.model_dump(), "college_id": importer.college_id})
+        lines.append(line)
+        if len(batch) >= settings.BULK_INSERT_BATCH_SIZE:
+            _flush(db, importer, batch, lines, report)
+            batch, lines = [], []
+
+    if batch:
+        _flush(db, importer, batch, lines, report)
+    return report
+
+
+def _flush(db: Session, importer: Importer, batch: list[dict], lines: list[int], report: ImportReport):
+    try:
+        db.exec(insert(importer.model), params=batch)
+        db.exec(bump_count(importer.college_id, importer.model, len(batch)))
+        publish_on_commit(db, importer.college_id, importer.model.__tablename__, "imported", count=len(batch))
+        db.commit()
+    except SQLAlchemyError as e:
+        # A concurrent write can still violate a constraint; the whole batch is rolled back
+        db.rollback()
+        reason = f"batch rejected by the database: {type(e.__cause__ or e).__name__}"
+        for line in lines:
+            _fail(report, line, [reason])
+        return
+    report.created += len(batch)
+
+
+def _fail(report: ImportReport, line: int, errors: list[str]):
+    report.failed += 1
+    if len(report.errors) < settings.IMPORT_MAX_ERRORS:
+        report.errors.append(ImportRowError(row=line, errors=errors))
@@ -1,8 +1,13 @@
 # app/crud/jwt.py
+import hashlib
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 from uuid import uuid4
 from app.config import settings
+from app.crud.cache import TTLCache
+
+# Verified payloads, keyed by the token's SHA-256 and kept until its `exp`
+token_cache = TTLCache(settings.TOKEN_CACHE_SIZE, settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
@@ -19,12 +24,31 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
         algorithm=settings.ALGORITHM
     )
 
+# `scope` claim of tokens that only open GET /events; API tokens carry none
+STREAM_SCOPE = "events"
+
+def create_stream_token(user) -> str:
+    return create_access_token(
+        {"sub": user.email, "token_version": user.token_version, "scope": STREAM_SCOPE},
+        timedelta(seconds=settings.EVENTS_TOKEN_EXPIRE_SECONDS),
+    )
+
 def decode_access_token(token: str) -> dict | None:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return dict(payload)
+
     try:
-        return jwt.decode(
+        payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
     except JWTError:
+        # Failures aren't cached, so garbage tokens can't fill the cache
         return None
+
+    if isinstance(payload.get("exp"), (int, float)):
+        token_cache.put(key, payload, expires_at=payload["exp"])
+    return dict(payload)
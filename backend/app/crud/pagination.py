@@ -0,0 +1,26 @@
+from fastapi import Query, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config import settings
+
+
+class PageParams:
+    """Keyset pagination on the primary key: pass the X-Next-After header back as `after`."""
+
+    def __init__(
+        self,
+        limit: int = Query(default=settings.PAGE_SIZE_DEFAULT, ge=1),
+        after: int | None = Query(default=None, ge=0),
+    ):
+        # Larger requests are clamped rather than rejected
+        self.limit = min(limit, settings.PAGE_SIZE_MAX)
+        self.after = after
+
+
+async def fetch_page(db: AsyncSession, query, id_column, page: PageParams, response: Response):
+    if page.after is not None:
+        query = query.where(id_column > page.after)
+    rows = (await db.exec(query.order_by(id_column).limit(page.limit + 1))).all()
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        response.headers["X-Next-After"] = str(rows[-1].id)
+    return rows
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from fastapi import HTTPException
+from passlib.context import CryptContext
+from app.config import settings
+
+# Argon2 is deliberately slow, so it runs in its own small process pool
+# instead of the request threadpool; a login burst then queues here rather
+# than starving every other endpoint.
+
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
+
+_executor: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+_in_flight = 0
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=settings.HASH_WORKERS)
+        return _executor
+
+
+def shutdown_executor():
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def _hash(password: str) -> str:
+    # Argon2 doesn't have the 72-byte limitation, so we can hash the full password
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+async def _run(fn, *args):
+    global _in_flight
+    executor = get_executor()
+    with _lock:
+        if _in_flight >= settings.HASH_WORKERS + settings.HASH_QUEUE_LIMIT:
+            raise HTTPException(
+                status_code=503,
+                detail="Too many sign-ins in progress, try again later",
+                headers={"Retry-After": "1"},
+            )
+        _in_flight += 1
+    try:
+        future = executor.submit(fn, *args)
+    except BaseException:
+        _release()
+        raise
+    # Released when the worker finishes, even if the request was cancelled
+    future.add_done_callback(_release)
+    return await asyncio.wrap_future(future)
+
+
+def _release(*_):
+    global _in_flight
+    with _lock:
+        _in_flight -= 1
+
+
+async def hash_password(password: str) -> str:
+    return await _run(_hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _run(_verify, plain_password, hashed_password)
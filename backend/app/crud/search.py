@@ -0,0 +1,94 @@
+from sqlalchemy import String, case, literal, union_all
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config import settings
+from app.crud.stats import COUNTERS
+from app.models.classroom import Classroom
+from app.models.college_stats import CollegeStats
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.subject import Subject
+from app.search.indexes import search_key
+from app.search.trie import CONTAINS_MIN_LENGTH, SearchIndex, normalize, registry as search_indexes
+
+# Autocomplete type -> (model, searched column)
+AUTOCOMPLETE_COLUMNS = {
+    "subject": (Subject, Subject.name),
+    "faculty": (Faculty, Faculty.name),
+    "department": (Department, Department.name),
+    "classroom": (Classroom, Classroom.room_no),
+}
+
+
+def escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def use_trie(db: AsyncSession) -> bool:
+    if settings.SEARCH_BACKEND == "auto":
+        return db.bind.dialect.name != "postgresql"
+    return settings.SEARCH_BACKEND == "trie"
+
+
+def autocomplete_query(college_id: int | None, query: str, limit: int, types: set[str] | None = None):
+    """Top `limit` names containing `query`, prefix matches first; served by the trigram indexes."""
+    query = normalize(query)
+    pattern = escape_like(query)
+    # Too short for the trigram index to narrow anything down; prefix matches only
+    match = f"%{pattern}%" if len(query) >= CONTAINS_MIN_LENGTH else f"{pattern}%"
+    parts = []
+    for type_, (model, column) in AUTOCOMPLETE_COLUMNS.items():
+        if types and type_ not in types:
+            continue
+        key = search_key(column)
+        rank = case((key.like(f"{pattern}%", escape="\\"), 0), else_=1)
+        parts.append(
+            select(
+                literal(type_, String).label("type"),
+                model.id.label("id"),
+                column.label("name"),
+                rank.label("rank"),
+                key.label("key"),
+            )
+            .where(model.college_id == college_id, key.like(match, escape="\\"))
+            .order_by(rank, key, model.id)
+            .limit(limit)
+            .subquery()
+        )
+    matches = union_all(*(select(part) for part in parts)).subquery()
+    return (
+        select(matches.c.type, matches.c.id, matches.c.name)
+        .order_by(matches.c.rank, matches.c.key, matches.c.type, matches.c.id)
+        .limit(limit)
+    )
+
+
+async def search_stamp(db: AsyncSession, college_id: int | None) -> int | None:
+    """Sum of the searchable collections' versions, or None for colleges without a stats row."""
+    versions = (await db.exec(
+        select(*(getattr(CollegeStats, f"{COUNTERS[model]}_version") for model, _ in AUTOCOMPLETE_COLUMNS.values()))
+        .where(CollegeStats.college_id == college_id)
+    )).first()
+    return sum(versions) if versions is not None else None
+
+
+async def build_search_index(db: AsyncSession, college_id: int | None) -> SearchIndex:
+    rows = union_all(*(
+        select(literal(type_, String), model.id, column).where(model.college_id == college_id)
+        for type_, (model, column) in AUTOCOMPLETE_COLUMNS.items()
+    ))
+    return SearchIndex([tuple(row) for row in (await db.exec(rows)).all()])
+
+
+async def autocomplete(db: AsyncSession, college_id: int | None, query: str, limit: int, types: set[str] | None = None) -> list[tuple]:
+    if not use_trie(db):
+        return [tuple(row) for row in (await db.exec(autocomplete_query(college_id, query, limit, types))).all()]
+
+    # One primary-key lookup tells whether another worker wrote since the index was built
+    stamp = await search_stamp(db, college_id)
+    index = search_indexes.get(college_id, stamp)
+    if index is None:
+        generation = search_indexes.generation(college_id)
+        index = await build_search_index(db, college_id)
+        search_indexes.put(college_id, index, generation, stamp)
+    return index.search(query, limit, types)
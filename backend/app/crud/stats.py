@@ -0,0 +1,87 @@
+from sqlalchemy import literal
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import func, select, update
+from app.models.classroom import Classroom
+from app.models.college_stats import CollegeStats
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.subject import Subject
+
+# Statement builders only, so the same helpers serve Session and AsyncSession:
+#     db.exec(bump_count(...))  /  await db.exec(bump_count(...))
+# Run the bump in the same transaction as the insert or delete it counts.
+
+COUNTERS = {
+    Subject: "subjects",
+    Faculty: "faculties",
+    Classroom: "classrooms",
+    Department: "departments",
+}
+
+
+def bump_count(college_id: int | None, model, delta: int = 1):
+    """Count an insert (delta > 0) or delete (delta < 0); also bumps the collection's version."""
+    column = COUNTERS[model]
+    version = f"{column}_version"
+    return (
+        update(CollegeStats)
+        .where(CollegeStats.college_id == college_id)
+        .values({
+            column: getattr(CollegeStats, column) + delta,
+            version: getattr(CollegeStats, version) + 1,
+        })
+    )
+
+
+def bump_version(college_id: int | None, model):
+    """Record an in-place update, which changes no count."""
+    version = f"{COUNTERS[model]}_version"
+    return (
+        update(CollegeStats)
+        .where(CollegeStats.college_id == college_id)
+        .values({version: getattr(CollegeStats, version) + 1})
+    )
+
+
+INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _counts(college_id: int | None):
+    return [
+        select(func.count())
+        .select_from(model)
+        .where(model.college_id == college_id)
+        .scalar_subquery()
+        .label(column)
+        for model, column in COUNTERS.items()
+    ]
+
+
+def bump_timetables(college_id: int | None):
+    """Record a change to the occupancy of the college's timetables; returns the new version."""
+    return (
+        update(CollegeStats)
+        .where(CollegeStats.college_id == college_id)
+        .values(timetables_version=CollegeStats.timetables_version + 1)
+        .returning(CollegeStats.timetables_version)
+    )
+
+
+def aggregate_counts(college_id: int | None):
+    """All four counts for one college in a single query; used when no stats row exists."""
+    return select(*_counts(college_id))
+
+
+def seed_counts(college_id: int, dialect: str):
+    """Create a missing stats row from the live counts in one statement.
+
+    Counting and inserting in one INSERT ... SELECT leaves no gap for a
+    create or delete to land in unrecorded, and a row another request
+    seeded first is left alone.
+    """
+    columns = ["college_id", *COUNTERS.values()]
+    return (
+        INSERTS[dialect](CollegeStats)
+        .from_select(columns, select(literal(college_id), *_counts(college_id)))
+        .on_conflict_do_nothing(index_elements=["college_id"])
+    )
@@ -0,0 +1,68 @@
+from fastapi import HTTPException
+from sqlalchemy.orm import joinedload
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.crud.stats import bump_count, bump_version
+from app.crud.timetable import delete_placements
+from app.database import on_commit
+from app.events.broker import publish_on_commit
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.subject import Subject
+from app.models.timetable_entry import TimetableEntry
+from app.schemas.subject import SubjectCreate, SubjectRead, SubjectUpdate
+from app.search.trie import registry as search_indexes
+
+# Writes stop at a flush; the caller commits (one request or one /batch)
+
+
+def subject_load_options():
+    # Relationships nested in SubjectRead, loaded up front instead of per row
+    return [
+        joinedload(Subject.faculty).joinedload(Faculty.department),
+        joinedload(Subject.department),
+    ]
+
+
+async def create_subject(db: AsyncSession, subject: SubjectCreate, college_id: int | None) -> Subject:
+    if not await db.get(Faculty, subject.faculty_id):
+        raise HTTPException(status_code=404, detail="Faculty not found")
+    if not await db.get(Department, subject.department_id):
+        raise HTTPException(status_code=404, detail="Department not found")
+    db_subject = Subject.model_validate(subject)
+    db_subject.college_id = college_id
+    db.add(db_subject)
+    await db.exec(bump_count(college_id, Subject, 1))
+    await db.flush()
+    on_commit(db, search_indexes.upsert, college_id, ("subject", db_subject.id, db_subject.name))
+    publish_on_commit(db, college_id, "subject", "created", id=db_subject.id)
+    return db_subject
+
+
+async def update_subject(db: AsyncSession, subject_id: int, subject: SubjectUpdate) -> Subject:
+    db_subject = await db.get(Subject, subject_id)
+    if not db_subject:
+        raise HTTPException(status_code=404, detail="Subject not found")
+    if not await db.get(Faculty, subject.faculty_id):
+        raise HTTPException(status_code=404, detail="Faculty not found")
+    if not await db.get(Department, subject.department_id):
+        raise HTTPException(status_code=404, detail="Department not found")
+    for field, value in subject.model_dump(exclude_unset=True).items():
+        setattr(db_subject, field, value)
+    db.add(db_subject)
+    await db.exec(bump_version(db_subject.college_id, Subject))
+    on_commit(db, search_indexes.upsert, db_subject.college_id, ("subject", db_subject.id, db_subject.name))
+    publish_on_commit(db, db_subject.college_id, "subject", "updated", id=db_subject.id)
+    return db_subject
+
+
+async def delete_subject(db: AsyncSession, subject_id: int) -> SubjectRead:
+    db_subject = await db.get(Subject, subject_id, options=subject_load_options())
+    if not db_subject:
+        raise HTTPException(status_code=404, detail="Subject not found")
+    subject_public = SubjectRead.model_validate(db_subject)
+    await delete_placements(db, TimetableEntry.subject_id, db_subject.id, db_subject.college_id)
+    await db.delete(db_subject)
+    await db.exec(bump_count(db_subject.college_id, Subject, -1))
+    on_commit(db, search_indexes.remove, db_subject.college_id, "subject", db_subject.id)
+    publish_on_commit(db, db_subject.college_id, "subject", "deleted", id=db_subject.id)
+    return subject_public
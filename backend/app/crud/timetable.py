@@ -0,0 +1,446 @@
+from datetime import datetime, timezone
+from fastapi import HTTPException
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config import settings
+from app.database import on_commit
+from app.crud.stats import COUNTERS, bump_timetables
+from app.events.broker import publish_on_commit
+from app.models.college_stats import CollegeStats
+from app.models.timetable import SemesterEnum, Timetable
+from app.models.timetable_entry import TimetableEntry
+from app.models.subject import Subject
+from app.models.classroom import Classroom
+from app.models.faculty import Faculty
+from app.models.department import Department
+from app.scheduler.solver import Lesson, Placement, Problem
+from app.scheduler.occupancy import OccupancyIndex, registry as occupancy
+from app.schemas.timetable import TimetableCreate, TimetableRead, TimetableUpdate
+
+
+def concurrent_timetable_ids(timetable: Timetable):
+    # Odd and even semesters of every department run side by side
+    same_parity = [s for s in SemesterEnum if s % 2 == timetable.semester % 2]
+    return select(Timetable.id).where(
+        Timetable.college_id == timetable.college_id,
+        Timetable.academic_year == timetable.academic_year,
+        Timetable.semester.in_(same_parity),
+    )
+
+
+def get_entries(db: Session, timetable_id: int):
+    return db.exec(
+        select(TimetableEntry)
+        .where(TimetableEntry.timetable_id == timetable_id)
+        .order_by(TimetableEntry.day, TimetableEntry.period)
+    ).all()
+
+
+def term_of(timetable: Timetable) -> tuple:
+    return (timetable.academic_year, timetable.semester % 2)
+
+
+def occupancy_version(db: Session, college_id: int | None) -> int | None:
+    # A primary-key lookup; None (no stats row) disables caching
+    return db.exec(
+        select(CollegeStats.timetables_version).where(CollegeStats.college_id == college_id)
+    ).first()
+
+
+def bump_occupancy(db: Session, college_id: int | None) -> int | None:
+    """Bump timetables_version in the current transaction; the new version, if the college has one."""
+    return db.exec(bump_timetables(college_id)).scalar_one_or_none()
+
+
+def get_occupancy(db: Session, timetable: Timetable) -> OccupancyIndex:
+    """Occupancy index of the timetable's term, built lazily with a single query."""
+    term = term_of(timetable)
+    stamp = occupancy_version(db, timetable.college_id)
+    index = occupancy.get(timetable.college_id, term)
+    if index is not None and stamp is not None and index.stamp == stamp:
+        return index
+
+    rows = db.exec(
+        select(
+            TimetableEntry.timetable_id,
+            TimetableEntry.faculty_id,
+            TimetableEntry.classroom_id,
+            TimetableEntry.day,
+            TimetableEntry.period,
+        ).where(TimetableEntry.timetable_id.in_(concurrent_timetable_ids(timetable)))
+    ).all()
+    by_timetable = {}
+    for timetable_id, *entry in rows:
+        by_timetable.setdefault(timetable_id, []).append(entry)
+
+    index = OccupancyIndex(settings.TIMETABLE_DAYS, settings.TIMETABLE_PERIODS_PER_DAY)
+    for timetable_id, entries in by_timetable.items():
+        index.replace_timetable(timetable_id, entries)
+    index.stamp = stamp
+    occupancy.put(timetable.college_id, term, index)
+    return index
+
+
+def build_problem(
+    db: Session,
+    timetables: list[Timetable],
+    lectures_per_subject: int,
+    subject_lectures: dict[int, int] | None = None,
+) -> Problem:
+    """Solver input for timetables of one college term; each timetable is a group."""
+    subject_lectures = subject_lectures or {}
+    department_ids = {t.department_id for t in timetables}
+    college_id = timetables[0].college_id
+
+    subjects = db.exec(
+        select(Subject).where(Subject.department_id.in_(department_ids))
+    ).all()
+    department_rooms = {}
+    for room_id, department_id in db.exec(
+        select(Classroom.id, Classroom.department_id).where(Classroom.department_id.in_(department_ids))
+    ).all():
+        department_rooms.setdefault(department_id, []).append(room_id)
+    if len(department_rooms) < len(department_ids):
+        # Departments without their own rooms share the college's
+        college_rooms = list(db.exec(
+            select(Classroom.id).where(Classroom.college_id == college_id)
+        ).all())
+    else:
+        college_rooms = []
+
+    faculty_busy, room_busy = get_occupancy(db, timetables[0]).busy_masks(
+        exclude=[t.id for t in timetables]
+    )
+    lessons = []
+    rooms = {}
+    for timetable in timetables:
+        rooms[timetable.id] = department_rooms.get(timetable.department_id, college_rooms)
+        for subject in subjects:
+            if subject.department_id != timetable.department_id:
+                continue
+            count = subject_lectures.get(subject.id, lectures_per_subject)
+            if count > 0:
+                lessons.append(Lesson(
+                    subject_id=subject.id,
+                    faculty_id=subject.faculty_id,
+                    group_id=timetable.id,
+                    count=count,
+                ))
+    return Problem(
+        days=settings.TIMETABLE_DAYS,
+        periods=settings.TIMETABLE_PERIODS_PER_DAY,
+        lessons=lessons,
+        rooms=rooms,
+        faculty_busy=faculty_busy,
+        room_busy=room_busy,
+    )
+
+
+def replace_entries(db: Session, timetables: list[Timetable], placements: list[Placement]):
+    """Replace the entries of every given timetable in a single transaction."""
+    index = get_occupancy(db, timetables[0])
+    by_timetable = {t.id: [] for t in timetables}
+    for p in placements:
+        by_timetable[p.group_id].append(p)
+
+    db.exec(delete(TimetableEntry).where(TimetableEntry.timetable_id.in_(by_timetable)))
+    rows = [
+        {
+            "timetable_id": timetable.id,
+            "college_id": timetable.college_id,
+            "subject_id": p.subject_id,
+            "faculty_id": p.faculty_id,
+            "classroom_id": p.classroom_id,
+            "day": p.day,
+            "period": p.period,
+        }
+        for timetable in timetables
+        for p in by_timetable[timetable.id]
+    ]
+    if rows:
+        # Executemany on an insert() is sent as batched multi-row INSERTs
+        db.exec(
+            insert(TimetableEntry),
+            params=rows,
+            execution_options={"insertmanyvalues_page_size": settings.BULK_INSERT_BATCH_SIZE},
+        )
+
+    # Entry writes count as a change to the timetable itself
+    now = datetime.now(timezone.utc)
+    for timetable in timetables:
+        timetable.updated_at = now
+        db.add(timetable)
+    version = bump_occupancy(db, timetables[0].college_id)
+    publish_on_commit(db, timetables[0].college_id, "timetable", "entries", ids=list(by_timetable))
+    db.commit()
+
+    for timetable_id, entries in by_timetable.items():
+        index.replace_timetable(
+            timetable_id,
+            ((p.faculty_id, p.classroom_id, p.day, p.period) for p in entries),
+        )
+    if version is not None:
+        occupancy.advance(timetables[0].college_id, term_of(timetables[0]), index, version)
+
+
+def drop_timetable(db: Session, timetable: Timetable):
+    """Delete a timetable and its entries without committing; its occupancy goes with the commit."""
+    index = get_occupancy(db, timetable)
+    timetable_id, college_id, term = timetable.id, timetable.college_id, term_of(timetable)
+    db.delete(timetable)
+    db.flush()
+    version = bump_occupancy(db, college_id)
+    on_commit(db, _drop_occupancy, index, timetable_id, college_id, term, version)
+    publish_on_commit(db, college_id, "timetable", "deleted", id=timetable_id)
+
+
+def _drop_occupancy(index: OccupancyIndex, timetable_id: int, college_id: int | None, term: tuple, version: int | None):
+    index.drop_timetable(timetable_id)
+    if version is not None:
+        occupancy.advance(college_id, term, index, version)
+
+
+def apply_moves(db: Session, timetable: Timetable, entries: list[TimetableEntry], placements: list[Placement], moved: list[int]):
+    """Write only the moved entries back, in one transaction."""
+    index = get_occupancy(db, timetable)
+    # Park moved rows on unique negative periods first so that swaps never
+    # trip uq_timetable_entry_slot halfway through the flush
+    for i in moved:
+        entries[i].period = -entries[i].id
+        db.add(entries[i])
+    db.flush()
+    for i in moved:
+        p = placements[i]
+        entries[i].day = p.day
+        entries[i].period = p.period
+        entries[i].classroom_id = p.classroom_id
+        db.add(entries[i])
+    timetable.updated_at = datetime.now(timezone.utc)
+    db.add(timetable)
+    version = bump_occupancy(db, timetable.college_id)
+    publish_on_commit(db, timetable.college_id, "timetable", "entries", ids=[timetable.id])
+    db.commit()
+
+    index.replace_timetable(
+        timetable.id,
+        ((p.faculty_id, p.classroom_id, p.day, p.period) for p in placements),
+    )
+    if version is not None:
+        occupancy.advance(timetable.college_id, term_of(timetable), index, version)
+
+
+def missing_ids(db: Session, model, ids: set[int], college_id: int | None) -> list[int]:
+    """Ids from `ids` with no row of `model` in the college, in one query."""
+    if not ids:
+        return []
+    found = set(db.exec(
+        select(model.id).where(model.id.in_(ids), model.college_id == college_id)
+    ).all())
+    return sorted(ids - found)
+
+
+def subject_faculty_map(db: Session, subject_ids: set[int]) -> dict[int, int]:
+    return dict(db.exec(
+        select(Subject.id, Subject.faculty_id).where(Subject.id.in_(subject_ids))
+    ).all())
+
+
+def find_clashes(db: Session, timetable: Timetable, placements: list[Placement]) -> list[dict]:
+    """Entries whose faculty or classroom is already busy in another timetable of the term."""
+    index = get_occupancy(db, timetable)
+    faculty_busy, room_busy = index.busy_masks(exclude=[timetable.id])
+    clashes = []
+    for p in placements:
+        bit = 1 << index.slot(p.day, p.period)
+        if faculty_busy.get(p.faculty_id, 0) & bit:
+            clashes.append({"day": p.day, "period": p.period, "faculty_id": p.faculty_id})
+        if room_busy.get(p.classroom_id, 0) & bit:
+            clashes.append({"day": p.day, "period": p.period, "classroom_id": p.classroom_id})
+    return clashes
+
+
+def pdf_version(db: Session, timetable: Timetable) -> tuple:
+    """What a rendered PDF shows: the entries, and the names of the rows they point at."""
+    # Renames bump the collection versions but not the timetable's updated_at
+    versions = db.exec(
+        select(*(getattr(CollegeStats, f"{column}_version") for column in COUNTERS.values()))
+        .where(CollegeStats.college_id == timetable.college_id)
+    ).first()
+    return (timetable.updated_at, *(versions or ()))
+
+
+def pdf_payload(db: Session, timetable: Timetable) -> dict:
+    """Everything the PDF renderer needs, as plain data, in two queries."""
+    department = db.get(Department, timetable.department_id)
+    rows = db.exec(
+        select(
+            TimetableEntry.day,
+            TimetableEntry.period,
+            Subject.name,
+            Faculty.name,
+            Classroom.building_name,
+            Classroom.room_no,
+        )
+        .join(Subject, Subject.id == TimetableEntry.subject_id)
+        .join(Faculty, Faculty.id == TimetableEntry.faculty_id)
+        .join(Classroom, Classroom.id == TimetableEntry.classroom_id)
+        .where(TimetableEntry.timetable_id == timetable.id)
+    ).all()
+    return {
+        "title": f"{department.name} - Year {department.year}",
+        "subtitle": f"Academic year {timetable.academic_year}, semester {int(timetable.semester)}",
+        "days": settings.TIMETABLE_DAYS,
+        "periods": settings.TIMETABLE_PERIODS_PER_DAY,
+        "entries": [
+            {
+                "day": day,
+                "period": period,
+                "subject": subject,
+                "faculty": faculty,
+                "room": f"{building} {room_no}",
+            }
+            for day, period, subject, faculty, building, room_no in rows
+        ],
+    }
+
+
+# Timetable CRUD for the async routers and /batch. Writes stop at a flush;
+# the caller commits.
+
+DUPLICATE_TERM = "Timetable for this department, academic year and semester already exists"
+
+
+def timetable_load_options():
+    # Relationships nested in TimetableRead, loaded up front instead of per row
+    return [
+        joinedload(Timetable.department),
+        joinedload(Timetable.class_coordinator).joinedload(Faculty.department),
+    ]
+
+
+async def _owned_timetable(db: AsyncSession, timetable_id: int, college_id: int | None, **kwargs) -> Timetable:
+    db_timetable = await db.get(Timetable, timetable_id, **kwargs)
+    if not db_timetable or db_timetable.college_id != college_id:
+        raise HTTPException(status_code=404, detail="Timetable not found")
+    return db_timetable
+
+
+async def create_timetable(db: AsyncSession, timetable: TimetableCreate, college_id: int | None) -> Timetable:
+    # Validate department exists
+    department = await db.get(Department, timetable.department_id)
+    if not department:
+        raise HTTPException(status_code=404, detail="Department not found")
+
+    # Validate class coordinator exists
+    coordinator = await db.get(Faculty, timetable.class_coordinator_id)
+    if not coordinator:
+        raise HTTPException(status_code=404, detail="Class coordinator not found")
+
+    # Check unique constraint before inserting
+    existing = (await db.exec(
+        select(Timetable).where(
+            Timetable.department_id == timetable.department_id,
+            Timetable.academic_year == timetable.academic_year,
+            Timetable.semester == timetable.semester,
+        )
+    )).first()
+    if existing:
+        raise HTTPException(status_code=400, detail=DUPLICATE_TERM)
+
+    # Create timetable with auto-assigned college_id
+    db_timetable = Timetable.model_validate(timetable)
+    db_timetable.college_id = college_id
+    db.add(db_timetable)
+    await _flush_unique(db)
+    publish_on_commit(db, college_id, "timetable", "created", id=db_timetable.id)
+    return db_timetable
+
+
+async def update_timetable(
+    db: AsyncSession, timetable_id: int, timetable: TimetableUpdate, college_id: int | None
+) -> Timetable:
+    db_timetable = await _owned_timetable(db, timetable_id, college_id)
+    timetable_data = timetable.model_dump(exclude_unset=True)
+
+    # Validate department if being updated
+    if "department_id" in timetable_data:
+        department = await db.get(Department, timetable_data["department_id"])
+        if not department:
+            raise HTTPException(status_code=404, detail="Department not found")
+
+        # Check unique constraint for new department/year/semester combination
+        new_dept_id = timetable_data.get("department_id", db_timetable.department_id)
+        new_year = timetable_data.get("academic_year", db_timetable.academic_year)
+        new_semester = timetable_data.get("semester", db_timetable.semester)
+
+        existing = (await db.exec(
+            select(Timetable).where(
+                Timetable.department_id == new_dept_id,
+                Timetable.academic_year == new_year,
+                Timetable.semester == new_semester,
+                Timetable.id != timetable_id,
+            )
+        )).first()
+        if existing:
+            raise HTTPException(status_code=400, detail=DUPLICATE_TERM)
+
+    # Validate coordinator if being updated
+    if "class_coordinator_id" in timetable_data:
+        coordinator = await db.get(Faculty, timetable_data["class_coordinator_id"])
+        if not coordinator:
+            raise HTTPException(status_code=404, detail="Class coordinator not found")
+
+    # Apply updates
+    for field, value in timetable_data.items():
+        setattr(db_timetable, field, value)
+    # Set here rather than by onupdate: the database clock may only have second precision
+    db_timetable.updated_at = datetime.now(timezone.utc)
+
+    db.add(db_timetable)
+    await _flush_unique(db)
+    # The timetable may move to another term; rebuild occupancy lazily
+    await db.exec(bump_timetables(db_timetable.college_id))
+    on_commit(db, occupancy.invalidate, db_timetable.college_id)
+    publish_on_commit(db, db_timetable.college_id, "timetable", "updated", id=db_timetable.id)
+    return db_timetable
+
+
+async def delete_timetable(db: AsyncSession, timetable_id: int, college_id: int | None) -> TimetableRead:
+    db_timetable = await _owned_timetable(db, timetable_id, college_id, options=timetable_load_options())
+    timetable_public = TimetableRead.model_validate(db_timetable)
+    # Shares the sync path with the occupancy index bookkeeping
+    await db.run_sync(drop_timetable, db_timetable)
+    return timetable_public
+
+
+async def delete_placements(db: AsyncSession, column, row_id: int, college_id: int | None):
+    """Remove the entries that place a subject, teacher or room about to be deleted.
+
+    Run before deleting the row itself: the entries reference it, so the
+    delete would otherwise fail (PostgreSQL) or leave orphans (SQLite).
+    """
+    timetable_ids = (await db.exec(
+        select(TimetableEntry.timetable_id).where(column == row_id).distinct()
+    )).all()
+    if not timetable_ids:
+        return
+    await db.exec(delete(TimetableEntry).where(column == row_id))
+    await db.exec(
+        update(Timetable)
+        .where(Timetable.id.in_(timetable_ids))
+        .values(updated_at=datetime.now(timezone.utc))
+    )
+    await db.exec(bump_timetables(college_id))
+    on_commit(db, occupancy.invalidate, college_id)
+    publish_on_commit(db, college_id, "timetable", "entries", ids=list(timetable_ids))
+
+
+async def _flush_unique(db: AsyncSession):
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=DUPLICATE_TERM)
@@ -1,18 +1,23 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate
-from passlib.context import CryptContext
+from app.crud.cache import TTLCache
+from app.crud.passwords import hash_password, verify_password  # noqa: F401  (verify_password re-exported for app.routers.auth)
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Column snapshots of authenticated users, keyed by email. Other worker
+# processes only see an invalidation once their entry expires, so the TTL
+# bounds how long a revoked token keeps working there (see config).
+principal_cache = TTLCache(settings.PRINCIPAL_CACHE_SIZE, settings.PRINCIPAL_CACHE_TTL_SECONDS)
 
-def get_user_by_username(db: Session, username: str):
+async def get_user_by_username(db: AsyncSession, username: str):
     statement = select(User).where(User.username == username)
-    result = db.exec(statement).first()
+    result = (await db.exec(statement)).first()
     return result
 
-def create_user(db: Session, user: UserCreate, role_id: int | None = None, college_id: int | None = None):
-    # Argon2 doesn't have the 72-byte limitation, so we can hash the full password
-    hashed_password = pwd_context.hash(user.password)
+async def create_user(db: AsyncSession, user: UserCreate, role_id: int | None = None, college_id: int | None = None):
+    hashed_password = await hash_password(user.password)
     db_user = User(
         username=user.username,
         email=user.email,
@@ -22,13 +27,24 @@ def create_user(db: Session, user: UserCreate, role_id: int | None = None, colle
         college_id=college_id
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
-def verify_password(plain_password, hashed_password):
-    # Argon2 can handle full password without truncation
-    return pwd_context.verify(plain_password, hashed_password)
-def get_user_by_email(session: Session, email: str):
+async def get_user_by_email(session: AsyncSession, email: str):
     statement = select(User).where(User.email == email)
-    return session.exec(statement).first()
\ No newline at end of file
+    return (await session.exec(statement)).first()
+
+
+def cache_principal(user: User) -> User:
+    snapshot = user.model_dump()
+    principal_cache.put(user.email, snapshot)
+    return User(**snapshot)
+
+def cached_principal(email: str) -> User | None:
+    snapshot = principal_cache.get(email)
+    # A fresh detached copy per request, so callers can't mutate the cached one
+    return User(**snapshot) if snapshot is not None else None
+
+def invalidate_principal(*emails: str):
+    principal_cache.invalidate(*emails)
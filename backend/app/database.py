@@ -1,11 +1,134 @@
+import os
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.pool import QueuePool
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.config import settings
 
-engine = create_engine(settings.DATABASE_URL, echo=True)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
 
-def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
+
+def async_database_url(url: str) -> str:
+    """Same database as `url`, through its asyncio driver (asyncpg / aiosqlite)."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend!r}")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def pool_options(url: str) -> dict:
+    """Pool sizing for `url`, if its dialect pools connections in a queue.
+
+    In-memory SQLite gets a StaticPool, which rejects these arguments.
+    """
+    parsed = make_url(url)
+    if not issubclass(parsed.get_dialect().get_pool_class(parsed), QueuePool):
+        return {}
+    return {"pool_size": settings.DB_POOL_SIZE, "max_overflow": settings.DB_MAX_OVERFLOW}
+
+
+engine = create_engine(settings.DATABASE_URL, echo=settings.SQL_ECHO)
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    echo=settings.SQL_ECHO,
+    **pool_options(async_database_url(settings.DATABASE_URL)),
+)
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+BASELINE_REVISION = "0001"
+
+
+def migrate(bind=None):
+    """Apply pending migrations; on an up-to-date database that is one query, with no reflection.
+
+    A database built by the create_all() this replaces has tables but no
+    alembic_version: it is stamped with the baseline first (see
+    migrations/env.py). The revisions after the baseline skip the tables and
+    indexes create_all() went on to build, so such a database upgrades
+    whichever commit created it.
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(ALEMBIC_INI)
+    config.attributes["baseline"] = BASELINE_REVISION
+    with (bind or engine).connect() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+        connection.commit()
+
+
+def rebuild_schema(bind=None):
+    """Drop every table and migrate the empty database to head; for benchmarks and checks.
+
+    Call once every model is imported, so that drop_all() sees all tables.
+    """
+    bind = bind or engine
+    SQLModel.metadata.drop_all(bind)
+    with bind.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE IF EXISTS alembic_version")
+    migrate(bind)
 
 def get_db():
     with Session(engine) as session:
         yield session
+
+async def get_async_db():
+    # Loaded attributes stay usable after commit; async sessions can't lazy-load them back
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+def on_commit(db, fn, *args):
+    """Call fn(*args) once db's transaction commits; dropped if it rolls back.
+
+    For in-memory side effects of a write (search and occupancy indexes),
+    so that service functions can leave committing to their caller.
+    Arguments are captured now: no SQL can run from the hook.
+    """
+    db.info.setdefault("on_commit", []).append((fn, args))
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _run_on_commit(session):
+    for fn, args in session.info.pop("on_commit", []):
+        fn(*args)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _drop_on_commit(session):
+    session.info.pop("on_commit", None)
+
+
+class QueryCounter:
+    """Counts SQL statements sent through the sync and async engines while the block is active.
+
+        with QueryCounter() as counter:
+            client.get("/subject/")
+        assert counter.count <= 3
+    """
+
+    def __init__(self, *targets):
+        self.targets = targets or (engine, async_engine.sync_engine)
+        self.count = 0
+        self.statements = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self):
+        for target in self.targets:
+            event.listen(target, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        for target in self.targets:
+            event.remove(target, "before_cursor_execute", self._on_execute)
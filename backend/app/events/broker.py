@@ -0,0 +1,164 @@
+import asyncio
+import json
+from typing import Optional
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from app.config import settings
+from app.database import on_commit
+
+# Change notifications per college, fanned out to the GET /events streams
+# connected to this worker process. Each stream reads from its own bounded
+# queue; a stream that falls behind has its backlog replaced by a single
+# "resync" event instead of holding up the writer or growing without bound.
+# Events don't cross worker processes: a client only hears about writes
+# handled by the worker it is connected to.
+
+PING = b": ping\n\n"
+RESYNC = b"event: resync\ndata: {}\n\n"
+CLOSED = None
+
+
+class Subscriber:
+    __slots__ = ("college_id", "queue", "dropped")
+
+    def __init__(self, college_id: int | None, queue_size: int):
+        self.college_id = college_id
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self.dropped = 0
+
+
+class EventBroker:
+    def __init__(self):
+        self._subscribers: dict[int | None, set[Subscriber]] = {}
+        self._count = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    @property
+    def subscribers(self) -> int:
+        return self._count
+
+    def subscribe(self, college_id: int | None) -> Subscriber:
+        """Register a stream, or refuse it with 503 once this worker is full; call from the event loop.
+
+        The check and the count happen together, so concurrent requests
+        can't all pass the check before any of them is counted.
+        """
+        if self._count >= settings.EVENTS_MAX_SUBSCRIBERS:
+            raise HTTPException(
+                status_code=503,
+                detail="Too many open event streams, try again later",
+                headers={"Retry-After": "5"},
+            )
+        self._count += 1
+        subscriber = Subscriber(college_id, settings.EVENTS_QUEUE_SIZE)
+        self._subscribers.setdefault(college_id, set()).add(subscriber)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._heartbeat = loop.create_task(self._ping())
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        streams = self._subscribers.get(subscriber.college_id)
+        if streams is None or subscriber not in streams:
+            return
+        streams.discard(subscriber)
+        if not streams:
+            del self._subscribers[subscriber.college_id]
+        self._count -= 1
+
+    def publish(self, college_id: int | None, event: dict):
+        """Queue `event` for every stream of the college; safe from any thread."""
+        if not self._subscribers.get(college_id) or self._loop is None:
+            return
+        # Encoded once here and shared by every stream
+        message = f"event: {event['entity']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n".encode()
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._fan_out(college_id, message)
+        else:
+            # Sync endpoints commit from the threadpool
+            try:
+                self._loop.call_soon_threadsafe(self._fan_out, college_id, message)
+            except RuntimeError:
+                pass  # loop already closed: the app is shutting down
+
+    def _fan_out(self, college_id: int | None, message: bytes):
+        for subscriber in self._subscribers.get(college_id, ()):
+            self._offer(subscriber, message)
+
+    def _offer(self, subscriber: Subscriber, message: Optional[bytes]):
+        try:
+            subscriber.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Whatever is pending is stale anyway; the client refetches once instead
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+                subscriber.dropped += 1
+            subscriber.queue.put_nowait(RESYNC if message is not CLOSED else CLOSED)
+
+    async def _ping(self):
+        # One timer for all streams; only idle ones need a keep-alive
+        while True:
+            await asyncio.sleep(settings.EVENTS_HEARTBEAT_SECONDS)
+            for streams in list(self._subscribers.values()):
+                for subscriber in streams:
+                    if subscriber.queue.empty():
+                        subscriber.queue.put_nowait(PING)
+
+    async def close(self):
+        """End every open stream.
+
+        uvicorn waits for open responses before running shutdown handlers,
+        so deployments should also set --timeout-graceful-shutdown.
+        """
+        for streams in list(self._subscribers.values()):
+            for subscriber in streams:
+                self._offer(subscriber, CLOSED)
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+        self._loop = self._heartbeat = None
+
+
+broker = EventBroker()
+
+
+async def stream(subscriber: Subscriber):
+    """Server-sent events for one client, until it disconnects or the app shuts down."""
+    try:
+        yield b"retry: 5000\n\n"
+        while True:
+            message = await subscriber.queue.get()
+            if message is CLOSED:
+                return
+            yield message
+    finally:
+        broker.unsubscribe(subscriber)
+
+
+class EventStreamResponse(StreamingResponse):
+    """stream(subscriber) as text/event-stream; frees the subscriber's slot when the response ends.
+
+    stream()'s finally only runs once the generator has started, which
+    never happens for a client that goes away before the first chunk.
+    """
+    media_type = "text/event-stream"
+
+    def __init__(self, subscriber: Subscriber, headers: dict[str, str] | None = None):
+        super().__init__(stream(subscriber), headers=headers)
+        self.subscriber = subscriber
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            broker.unsubscribe(self.subscriber)
+
+
+def publish_on_commit(db, college_id: int | None, entity: str, action: str, **fields):
+    """Announce a write to the college's streams once db's transaction commits."""
+    on_commit(db, broker.publish, college_id, {"entity": entity, "action": action, **fields})
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
-from app.database import create_db_and_tables
+from app.config import settings
+from app.database import async_engine, migrate
 from app.routers import college
 from app.routers import  department
 from app.routers import  classroom
@@ -10,7 +11,17 @@ from app.routers import  timetable
 from app.routers import auth
 from app.routers import user
 from app.routers import dashboard
+from app.routers import export
+from app.routers import search
+from app.routers import batch
+from app.routers import reports
+from app.routers import events
+from app.routers import metrics
 from app.middleware import add_timing_middleware  
+from app.scheduler.portfolio import shutdown_executor
+from app.reports.pdf_jobs import shutdown_executor as shutdown_pdf_executor
+from app.crud.passwords import shutdown_executor as shutdown_hash_executor
+from app.events.broker import broker
 from fastapi.middleware.cors import CORSMiddleware
 app = FastAPI()
 
@@ -23,12 +34,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-After"],
 )
 
-# Create tables at startup
+# Bring the schema up to date at startup; no create_all(), so no reflection
 @app.on_event("startup")
 def on_startup():
-    create_db_and_tables()
+    if settings.DB_MIGRATE_ON_STARTUP:
+        migrate()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    shutdown_executor()
+    shutdown_pdf_executor()
+    shutdown_hash_executor()
+    await broker.close()
+    await async_engine.dispose()
 
 # Register routers
 app.include_router(auth.router, prefix="/auth", tags=["User"])
@@ -40,4 +61,10 @@ app.include_router(role.router, prefix="/roles", tags=["Roles"])
 app.include_router(subject.router, prefix="/subject", tags=["Subject"])
 app.include_router(timetable.router, prefix="/timetable", tags=["Timetable"])
 app.include_router(user.router, prefix="/user", tags=["User"])
-app.include_router(dashboard.router)
\ No newline at end of file
+app.include_router(dashboard.router)
+app.include_router(export.router, prefix="/export", tags=["Export"])
+app.include_router(search.router, prefix="/search", tags=["Search"])
+app.include_router(batch.router, prefix="/batch", tags=["Batch"])
+app.include_router(reports.router, prefix="/reports", tags=["Reports"])
+app.include_router(events.router, prefix="/events", tags=["Events"])
+app.include_router(metrics.router)
@@ -0,0 +1,214 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+import anyio.to_thread
+from sqlalchemy import event
+from app.database import async_engine, engine
+
+# Request and SQL metrics of this worker process, rendered in the Prometheus
+# text format by GET /metrics. TimingMiddleware records one observation per
+# request; SQL statements are timed by engine events and charged both to
+# the statement's operation and to the request that ran it. With several
+# uvicorn workers each one keeps its own counters, so scrape every worker
+# (or run one per container) rather than a load-balanced address.
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+UNMATCHED = "unmatched"
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...]):
+        self.name, self.help, self.labels = name, help, labels
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, key: tuple, amount: float = 1):
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_labels(self.labels, key)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...], buckets: tuple):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        # Per label set: a count per bucket (non-cumulative, +Inf last), then the sum
+        self.values: dict[tuple, tuple[list[int], list[float]]] = {}
+
+    def observe(self, key: tuple, value: float):
+        entry = self.values.get(key)
+        if entry is None:
+            entry = self.values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = entry
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, (counts, total) in sorted(self.values.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                le = bound if bound == "+Inf" else _number(bound)
+                lines.append(f"{self.name}_bucket{_labels((*self.labels, 'le'), (*key, le))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, key)} {_number(total[0])}")
+            lines.append(f"{self.name}_count{_labels(self.labels, key)} {cumulative}")
+        return lines
+
+
+def _labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class RequestSQL:
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+
+# SQL run on behalf of the current request; copied into threadpool workers
+# with the rest of the context, so sync endpoints are charged too
+request_sql: ContextVar[Optional[RequestSQL]] = ContextVar("request_sql", default=None)
+
+
+class Metrics:
+    def __init__(self):
+        # Updated from the event loop and from threadpool workers
+        self._lock = threading.Lock()
+        self._in_flight: dict[int, dict] = {}
+        self.requests = Counter(
+            "http_requests_total", "Requests answered, by route template and status.",
+            ("method", "route", "status"),
+        )
+        self.duration = Histogram(
+            "http_request_duration_seconds", "Time from receiving a request to the end of its response.",
+            ("method", "route"), DURATION_BUCKETS,
+        )
+        self.request_statements = Histogram(
+            "http_request_sql_statements", "SQL statements executed per request.",
+            ("method", "route"), STATEMENT_BUCKETS,
+        )
+        self.request_sql_seconds = Histogram(
+            "http_request_sql_seconds", "Time spent executing SQL per request.",
+            ("method", "route"), DURATION_BUCKETS,
+        )
+        self.statements = Histogram(
+            "db_statement_duration_seconds", "SQL statement execution time, by leading keyword.",
+            ("operation",), DURATION_BUCKETS,
+        )
+
+    def request_started(self, scope) -> RequestSQL:
+        with self._lock:
+            self._in_flight[id(scope)] = scope
+        return RequestSQL()
+
+    def request_finished(self, scope, status: int, duration: float, sql: RequestSQL):
+        key = (scope["method"], route_of(scope))
+        with self._lock:
+            self._in_flight.pop(id(scope), None)
+            self.requests.inc((*key, status))
+            self.duration.observe(key, duration)
+            self.request_statements.observe(key, sql.statements)
+            self.request_sql_seconds.observe(key, sql.seconds)
+
+    def statement_finished(self, statement: str, duration: float):
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+        sql = request_sql.get()
+        with self._lock:
+            self.statements.observe((operation,), duration)
+            if sql is not None:
+                sql.statements += 1
+                sql.seconds += duration
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format; call from the event loop."""
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        with self._lock:
+            in_flight: dict[tuple, int] = {}
+            for scope in self._in_flight.values():
+                key = (scope["method"], route_of(scope))
+                in_flight[key] = in_flight.get(key, 0) + 1
+            lines = [
+                "# HELP http_requests_in_flight Requests being handled, by route template.",
+                "# TYPE http_requests_in_flight gauge",
+                *(f"http_requests_in_flight{_labels(('method', 'route'), key)} {count}"
+                  for key, count in sorted(in_flight.items())),
+                *self.requests.render(),
+                *self.duration.render(),
+                *self.request_statements.render(),
+                *self.request_sql_seconds.render(),
+                *self.statements.render(),
+            ]
+        # Sync endpoints and dependencies share this pool; waiting tasks mean it is saturated
+        lines += [
+            "# HELP threadpool_threads_limit Threads the request threadpool may use.",
+            "# TYPE threadpool_threads_limit gauge",
+            f"threadpool_threads_limit {_number(limiter.total_tokens)}",
+            "# HELP threadpool_threads_busy Threadpool threads running a task.",
+            "# TYPE threadpool_threads_busy gauge",
+            f"threadpool_threads_busy {limiter.borrowed_tokens}",
+            "# HELP threadpool_tasks_waiting Tasks queued for a threadpool thread.",
+            "# TYPE threadpool_tasks_waiting gauge",
+            f"threadpool_tasks_waiting {limiter.statistics().tasks_waiting}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def route_of(scope) -> str:
+    """Path template of the matched route (/subject/{subject_id}), so each route is one series."""
+    route = scope.get("route")
+    template = getattr(route, "path_format", None)
+    if template is None:
+        return UNMATCHED
+    # Routes of an included router may carry only their own part of the path;
+    # whatever precedes it in the request path is the router's prefix
+    try:
+        own = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    path = scope["path"]
+    return path[:len(path) - len(own)] + template if path.endswith(own) else template
+
+
+metrics = Metrics()
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("metrics_started")
+    if started:
+        metrics.statement_finished(statement, time.perf_counter() - started.pop())
+
+
+def _on_error(exception_context):
+    # after_cursor_execute doesn't fire for a failed statement
+    connection = exception_context.connection
+    started = connection.info.get("metrics_started") if connection is not None else None
+    if started:
+        metrics.statement_finished(exception_context.statement or "", time.perf_counter() - started.pop())
+
+
+for _target in (engine, async_engine.sync_engine):
+    event.listen(_target, "before_cursor_execute", _before_execute)
+    event.listen(_target, "after_cursor_execute", _after_execute)
+    event.listen(_target, "handle_error", _on_error)
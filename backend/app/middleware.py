@@ -1,6 +1,8 @@
+import re
 import time
 import logging
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
+from app.metrics import metrics, request_sql
 
 logging.basicConfig(
     level=logging.INFO,
@@ -8,20 +10,71 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def add_timing_middleware(app: FastAPI):
-    @app.middleware("http")
-    async def log_request_time(request: Request, call_next):
+
+class RedactTokens(logging.Filter):
+    """Masks ?token= values (GET /events?token=...) in uvicorn's access log lines."""
+
+    pattern = re.compile(r"([?&]token=)[^&\s]*")
+
+    def filter(self, record):
+        if isinstance(record.args, tuple):
+            record.args = tuple(
+                self.pattern.sub(r"\1[redacted]", arg) if isinstance(arg, str) else arg
+                for arg in record.args
+            )
+        return True
+
+
+# uvicorn configures its loggers before importing the app, so this sticks
+logging.getLogger("uvicorn.access").addFilter(RedactTokens())
+
+
+class TimingMiddleware:
+    """Logs each request and sets X-Process-Time, measured up to the response headers.
+
+    Also feeds app.metrics: the full request duration, status and the SQL
+    the request ran, labelled with the matched route template.
+
+    Plain ASGI rather than @app.middleware("http"): that wrapper adds a task
+    group and memory streams to every request, which long-lived event
+    streams would hold for as long as they are open.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start = time.perf_counter()
-        response = await call_next(request)
-        duration = time.perf_counter() - start
-
-        logger.info(
-            "method=%s path=%s status=%s duration=%.4fs",
-            request.method,
-            request.url.path,
-            response.status_code,
-            duration
-        )
-
-        response.headers["X-Process-Time"] = f"{duration:.4f}s"
-        return response
+        sql = metrics.request_started(scope)
+        token = request_sql.set(sql)
+        status = 500
+
+        async def send_timed(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                duration = time.perf_counter() - start
+                # The path only: query strings can carry ?token=
+                logger.info(
+                    "method=%s path=%s status=%s duration=%.4fs",
+                    scope["method"],
+                    scope["path"],
+                    message["status"],
+                    duration
+                )
+                message["headers"] = [*message.get("headers", []), (b"x-process-time", f"{duration:.4f}s".encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            request_sql.reset(token)
+            metrics.request_finished(scope, status, time.perf_counter() - start, sql)
+
+
+def add_timing_middleware(app: FastAPI):
+    app.add_middleware(TimingMiddleware)
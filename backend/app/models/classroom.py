@@ -1,9 +1,16 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional, List
 # from .department import Department
 
 
 class Classroom(SQLModel, table=True):
+    # Tenant lists page by id; build_problem() looks rooms up per department
+    __table_args__ = (
+        Index("ix_classroom_college_id_id", "college_id", "id"),
+        Index("ix_classroom_department_id", "department_id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     building_name: str
     room_no: str
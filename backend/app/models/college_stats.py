@@ -0,0 +1,23 @@
+from sqlmodel import SQLModel, Field
+
+
+class CollegeStats(SQLModel, table=True):
+    """Row counts per college, kept in step with every create and delete.
+
+    The *_version columns go up on every write to the collection and feed
+    the ETags of its list and detail endpoints. timetables_version goes up
+    whenever timetable entries change, or a timetable changes term or is
+    deleted, and tells each worker's occupancy indexes they are stale.
+    """
+    __tablename__ = "college_stats"
+
+    college_id: int = Field(foreign_key="college.id", primary_key=True, ondelete="CASCADE")
+    subjects: int = Field(default=0, nullable=False)
+    faculties: int = Field(default=0, nullable=False)
+    classrooms: int = Field(default=0, nullable=False)
+    departments: int = Field(default=0, nullable=False)
+    subjects_version: int = Field(default=0, nullable=False)
+    faculties_version: int = Field(default=0, nullable=False)
+    classrooms_version: int = Field(default=0, nullable=False)
+    departments_version: int = Field(default=0, nullable=False)
+    timetables_version: int = Field(default=0, nullable=False)
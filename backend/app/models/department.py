@@ -1,8 +1,14 @@
 from typing import Optional, List
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 
 
 class Department(SQLModel, table=True):
+    # List queries filter on the tenant and page by id
+    __table_args__ = (
+        Index("ix_department_college_id_id", "college_id", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
     year: int
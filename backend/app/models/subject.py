@@ -1,8 +1,17 @@
 from typing import Optional
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 
 
 class Subject(SQLModel, table=True):
+    # Tenant lists page by id; the workload report counts subjects per
+    # teacher and build_problem() loads them per department
+    __table_args__ = (
+        Index("ix_subject_college_id_id", "college_id", "id"),
+        Index("ix_subject_college_id_faculty_id", "college_id", "faculty_id"),
+        Index("ix_subject_department_id", "department_id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
     faculty_id: int = Field(foreign_key="faculty.id")
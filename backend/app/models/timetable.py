@@ -2,7 +2,7 @@ from typing import Optional
 from enum import IntEnum
 from sqlmodel import SQLModel, Field, Relationship
 from datetime import datetime
-from sqlalchemy import Column, DateTime, UniqueConstraint, func
+from sqlalchemy import Column, DateTime, Index, UniqueConstraint, func
 
 
 class SemesterEnum(IntEnum):
@@ -20,6 +20,9 @@ class Timetable(SQLModel, table=True):
     __tablename__ = "timetable"
     __table_args__ = (
         UniqueConstraint('department_id', 'academic_year', 'semester', name='uq_department_academic_year_semester'),
+        # Tenant lists page by id; concurrent_timetable_ids() looks up a college's term
+        Index('ix_timetable_college_id_id', 'college_id', 'id'),
+        Index('ix_timetable_college_id_term', 'college_id', 'academic_year', 'semester'),
     )
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -41,3 +44,7 @@ class Timetable(SQLModel, table=True):
     college: "College" = Relationship(back_populates="timetables")
     department: "Department" = Relationship(back_populates="timetables")
     class_coordinator: "Faculty" = Relationship(back_populates="timetables")
+    entries: list["TimetableEntry"] = Relationship(
+        back_populates="timetable",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+    )
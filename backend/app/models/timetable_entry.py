@@ -0,0 +1,25 @@
+from typing import Optional
+from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import UniqueConstraint
+
+
+class TimetableEntry(SQLModel, table=True):
+    __tablename__ = "timetable_entry"
+    __table_args__ = (
+        UniqueConstraint('timetable_id', 'day', 'period', name='uq_timetable_entry_slot'),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    timetable_id: int = Field(foreign_key="timetable.id", index=True)
+    college_id: Optional[int] = Field(default=None, foreign_key="college.id")
+    subject_id: int = Field(foreign_key="subject.id")
+    faculty_id: int = Field(foreign_key="faculty.id")
+    classroom_id: int = Field(foreign_key="classroom.id")
+    day: int
+    period: int
+
+    # Relationships
+    timetable: "Timetable" = Relationship(back_populates="entries")
+    subject: "Subject" = Relationship()
+    faculty: "Faculty" = Relationship()
+    classroom: "Classroom" = Relationship()
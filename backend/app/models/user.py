@@ -1,9 +1,14 @@
 # app/models/user.py
 from typing import Optional
 from sqlmodel import SQLModel, Field,Relationship
+from sqlalchemy import Index
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
+    # List queries filter on the tenant and page by id
+    __table_args__ = (
+        Index("ix_users_college_id_id", "college_id", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     username: str = Field(index=True, unique=True)
@@ -0,0 +1,55 @@
+import io
+import os
+from xml.sax.saxutils import escape
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def render_timetable_pdf(data: dict) -> bytes:
+    """Render a weekly grid. `data` is plain (picklable) so this can run in a worker process."""
+    styles = getSampleStyleSheet()
+    cell = styles["BodyText"]
+    cell.fontSize = 8
+    cell.leading = 10
+
+    days, periods = data["days"], data["periods"]
+    grid = [[""] * periods for _ in range(days)]
+    for entry in data["entries"]:
+        # Paragraph text is markup; names are escaped so "<" and "&" print as typed
+        grid[entry["day"]][entry["period"]] = Paragraph(
+            f"<b>{escape(entry['subject'])}</b><br/>{escape(entry['faculty'])}<br/>{escape(entry['room'])}", cell
+        )
+
+    rows = [[""] + [f"P{p + 1}" for p in range(periods)]]
+    rows += [[DAY_NAMES[d]] + grid[d] for d in range(days)]
+    table = Table(rows, repeatRows=1)
+    table.setStyle(TableStyle([
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("BACKGROUND", (0, 0), (0, -1), colors.lightgrey),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ]))
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=landscape(A4), title=data["title"])
+    doc.build([
+        Paragraph(escape(data["title"]), styles["Title"]),
+        Paragraph(escape(data["subtitle"]), styles["Normal"]),
+        Spacer(1, 12),
+        table,
+    ])
+    return buffer.getvalue()
+
+
+def render_to_file(data: dict, path: str) -> str:
+    pdf = render_timetable_pdf(data)
+    # Write-then-rename so readers never see a half written file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(pdf)
+    os.replace(tmp_path, path)
+    return path
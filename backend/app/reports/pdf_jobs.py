@@ -0,0 +1,117 @@
+import glob
+import hashlib
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+from fastapi import HTTPException
+from app.config import settings
+from app.reports.pdf import render_to_file
+
+# Rendered PDFs are cached on disk as "<timetable id>-<digest of its version>.pdf",
+# so a timetable that has not changed is never rendered twice and the cache
+# is shared by every worker process of the app. The version covers the
+# entries and the names they show (see crud.timetable.pdf_version). Failed
+# jobs are remembered for PDF_JOB_TTL_SECONDS so clients can read the error.
+
+_executor: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+_jobs: dict[str, dict] = {}
+KEY_PATTERN = re.compile(r"(\d+)-[0-9a-f]{16}")
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=settings.PDF_WORKERS)
+        return _executor
+
+
+def shutdown_executor():
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def cache_key(timetable_id: int, version: tuple) -> str:
+    digest = hashlib.sha256(repr(version).encode()).hexdigest()[:16]
+    return f"{timetable_id}-{digest}"
+
+
+def timetable_of(key: str) -> Optional[int]:
+    """Timetable a job id was issued for, or None if it isn't a job id at all."""
+    match = KEY_PATTERN.fullmatch(key)
+    return int(match.group(1)) if match else None
+
+
+def cache_path(key: str) -> str:
+    return os.path.join(settings.PDF_CACHE_DIR, f"{key}.pdf")
+
+
+def _prune(now: float):
+    # Called with _lock held; only failed jobs carry an expiry
+    for key in [key for key, job in _jobs.items() if job.get("expires", now) < now]:
+        del _jobs[key]
+
+
+def job_status(key: str) -> Optional[dict]:
+    if os.path.exists(cache_path(key)):
+        return {"job_id": key, "status": "done", "error": None}
+    with _lock:
+        _prune(time.monotonic())
+        job = _jobs.get(key)
+        if job is None:
+            return None
+        future = job.get("future")
+        status = job["status"]
+        if status == "queued" and future is not None and future.running():
+            status = "running"
+        return {"job_id": key, "status": status, "error": job["error"]}
+
+
+def submit_render(key: str, timetable_id: int, data: dict) -> dict:
+    """Queue a render unless the PDF is cached or already being rendered."""
+    status = job_status(key)
+    if status and status["status"] != "failed":
+        return status
+
+    os.makedirs(settings.PDF_CACHE_DIR, exist_ok=True)
+    executor = get_executor()
+    with _lock:
+        active = sum(1 for job in _jobs.values() if job["status"] == "queued")
+        if active >= settings.PDF_QUEUE_LIMIT:
+            raise HTTPException(
+                status_code=503,
+                detail="PDF renderer is busy, try again later",
+                headers={"Retry-After": "5"},
+            )
+        future = executor.submit(render_to_file, data, cache_path(key))
+        _jobs[key] = {"status": "queued", "timetable_id": timetable_id, "error": None, "future": future}
+    future.add_done_callback(lambda f: _finished(key, timetable_id, f))
+    return {"job_id": key, "status": "queued", "error": None}
+
+
+def _finished(key: str, timetable_id: int, future: Future):
+    error = None if future.cancelled() else future.exception()
+    with _lock:
+        if error is None and not future.cancelled():
+            # The file on disk is the record of a finished job
+            _jobs.pop(key, None)
+        else:
+            _jobs[key] = {
+                "status": "failed", "timetable_id": timetable_id, "error": str(error or "cancelled"),
+                "future": None, "expires": time.monotonic() + settings.PDF_JOB_TTL_SECONDS,
+            }
+    if error is None and not future.cancelled():
+        # Drop renders of older versions of the same timetable
+        for path in glob.glob(os.path.join(settings.PDF_CACHE_DIR, f"{timetable_id}-*.pdf")):
+            if path != cache_path(key):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from itertools import chain
+import numpy as np
+from sqlmodel import Session, select
+from app.config import settings
+from app.crud.timetable import concurrent_timetable_ids
+from app.models.classroom import Classroom
+from app.models.timetable import SemesterEnum, Timetable
+from app.models.timetable_entry import TimetableEntry
+
+# Room utilization for one term, computed on a room x day x period grid.
+# Loading takes two queries; everything after that is array arithmetic.
+
+
+@dataclass
+class RoomGrid:
+    room_ids: np.ndarray      # (rooms,) sorted
+    room_nos: list[str]
+    capacity: np.ndarray      # (rooms,)
+    building: np.ndarray      # (rooms,) index into `buildings`
+    buildings: list[str]
+    occupied: np.ndarray      # (rooms, days, periods) bool
+
+
+def load_room_grid(db: Session, college_id: int | None, academic_year: str, semester: SemesterEnum) -> RoomGrid:
+    rooms = db.exec(
+        select(Classroom.id, Classroom.room_no, Classroom.building_name, Classroom.capacity)
+        .where(Classroom.college_id == college_id)
+        .order_by(Classroom.id)
+    ).all()
+    term = Timetable(college_id=college_id, academic_year=academic_year, semester=semester)
+    entries = db.exec(
+        select(TimetableEntry.classroom_id, TimetableEntry.day, TimetableEntry.period)
+        .where(TimetableEntry.timetable_id.in_(concurrent_timetable_ids(term)))
+    ).all()
+    return build_room_grid(rooms, entries, settings.TIMETABLE_DAYS, settings.TIMETABLE_PERIODS_PER_DAY)
+
+
+def build_room_grid(rooms, entries, days: int, periods: int) -> RoomGrid:
+    """`rooms` as (id, room_no, building_name, capacity) sorted by id; `entries` as (classroom_id, day, period)."""
+    room_ids = np.fromiter((r[0] for r in rooms), dtype=np.int64, count=len(rooms))
+    buildings, building = np.unique(np.array([r[2] for r in rooms], dtype=object), return_inverse=True)
+    capacity = np.fromiter((r[3] for r in rooms), dtype=np.int64, count=len(rooms))
+
+    occupied = np.zeros((len(rooms), days, periods), dtype=bool)
+    if len(entries) and len(rooms):
+        # fromiter over the flattened rows; np.array() would probe every Row for the array protocol
+        classroom, day, period = np.fromiter(
+            chain.from_iterable(entries), dtype=np.int64, count=3 * len(entries)
+        ).reshape(-1, 3).T
+        row = np.searchsorted(room_ids, classroom)
+        # Rooms of other colleges and slots outside the configured week are ignored
+        keep = (
+            (row < len(room_ids))
+            & (room_ids[np.minimum(row, len(room_ids) - 1)] == classroom)
+            & (day >= 0) & (day < days) & (period >= 0) & (period < periods)
+        )
+        occupied[row[keep], day[keep], period[keep]] = True
+
+    return RoomGrid(
+        room_ids=room_ids,
+        room_nos=[r[1] for r in rooms],
+        capacity=capacity,
+        building=building.reshape(-1),
+        buildings=[str(b) for b in buildings],
+        occupied=occupied,
+    )
+
+
+def room_utilization(grid: RoomGrid, peaks: int = 5) -> dict:
+    rooms, days, periods = grid.occupied.shape
+    slots = days * periods
+
+    used = grid.occupied.sum(axis=(1, 2))
+    free = slots - used
+    idle_seats = grid.capacity * free
+
+    # Rooms in use per slot, and the busiest slots first (earliest on ties)
+    in_use = grid.occupied.sum(axis=0)
+    order = np.argsort(-in_use.ravel(), kind="stable")[:peaks]
+    peak_day, peak_period = np.divmod(order, periods)
+
+    nb = len(grid.buildings)
+    b_rooms = np.bincount(grid.building, minlength=nb)
+    b_used = np.bincount(grid.building, weights=used, minlength=nb)
+    b_idle = np.bincount(grid.building, weights=idle_seats, minlength=nb)
+    b_seats = np.bincount(grid.building, weights=grid.capacity * slots, minlength=nb)
+
+    total_seats = int(grid.capacity.sum()) * slots
+    return {
+        "rooms": rooms,
+        "slots_per_week": slots,
+        "utilization": _ratio(used.sum(), rooms * slots),
+        "seat_utilization": _ratio(total_seats - idle_seats.sum(), total_seats),
+        "idle_seat_periods": int(idle_seats.sum()),
+        "by_room": [
+            {
+                "classroom_id": room_id,
+                "room_no": room_no,
+                "building_name": grid.buildings[b],
+                "capacity": cap,
+                "used_slots": u,
+                "utilization": round(u / slots, 4) if slots else 0.0,
+                "idle_seat_periods": idle,
+            }
+            for room_id, room_no, b, cap, u, idle in zip(
+                grid.room_ids.tolist(), grid.room_nos, grid.building.tolist(),
+                grid.capacity.tolist(), used.tolist(), idle_seats.tolist(),
+            )
+        ],
+        "by_building": [
+            {
+                "building_name": name,
+                "rooms": int(n),
+                "used_slots": int(u),
+                "utilization": _ratio(u, n * slots),
+                "seat_utilization": _ratio(seats - idle, seats),
+                "idle_seat_periods": int(idle),
+            }
+            for name, n, u, idle, seats in zip(grid.buildings, b_rooms, b_used, b_idle, b_seats)
+        ],
+        "by_period": [_ratio(n, rooms * days) for n in in_use.sum(axis=0).tolist()],
+        "peak_slots": [
+            {"day": d, "period": p, "rooms_in_use": int(in_use[d, p]), "utilization": _ratio(in_use[d, p], rooms)}
+            for d, p in zip(peak_day.tolist(), peak_period.tolist())
+        ],
+    }
+
+
+def _ratio(part, whole) -> float:
+    return round(float(part) / float(whole), 4) if whole else 0.0
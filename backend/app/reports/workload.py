@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from itertools import chain
+import numpy as np
+from sqlmodel import Session, func, select
+from app.config import settings
+from app.crud.timetable import concurrent_timetable_ids
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.subject import Subject
+from app.models.timetable import SemesterEnum, Timetable
+from app.models.timetable_entry import TimetableEntry
+
+# Faculty workload for one term on a faculty x day x period matrix of
+# lecture counts (above 1 only when a teacher is double-booked). Loading
+# takes three queries; the metrics are array operations over the matrix.
+
+
+@dataclass
+class LoadMatrix:
+    faculty_ids: np.ndarray   # (faculty,) sorted
+    names: list[str]
+    department: np.ndarray    # (faculty,) index into `department_ids`
+    department_ids: np.ndarray
+    department_names: list[str]
+    subjects: np.ndarray      # (faculty,) subjects assigned through Subject.faculty_id
+    load: np.ndarray          # (faculty, days, periods) lectures per slot
+
+
+def load_matrix(db: Session, college_id: int | None, academic_year: str, semester: SemesterEnum) -> LoadMatrix:
+    faculty = db.exec(
+        select(Faculty.id, Faculty.name, Faculty.department_id, Department.name)
+        .join(Department, Department.id == Faculty.department_id)
+        .where(Faculty.college_id == college_id)
+        .order_by(Faculty.id)
+    ).all()
+    # Counted on its own: an outer join would group every faculty row through subject
+    subjects = db.exec(
+        select(Subject.faculty_id, func.count(Subject.id))
+        .where(Subject.college_id == college_id)
+        .group_by(Subject.faculty_id)
+    ).all()
+    term = Timetable(college_id=college_id, academic_year=academic_year, semester=semester)
+    entries = db.exec(
+        select(TimetableEntry.faculty_id, TimetableEntry.day, TimetableEntry.period)
+        .where(TimetableEntry.timetable_id.in_(concurrent_timetable_ids(term)))
+    ).all()
+    return build_load_matrix(
+        faculty, subjects, entries, settings.TIMETABLE_DAYS, settings.TIMETABLE_PERIODS_PER_DAY
+    )
+
+
+def build_load_matrix(faculty, subjects, entries, days: int, periods: int) -> LoadMatrix:
+    """`faculty` as (id, name, department_id, department_name) sorted by id, `subjects` as
+    (faculty_id, count) and `entries` as (faculty_id, day, period)."""
+    count = len(faculty)
+    faculty_ids = np.fromiter((f[0] for f in faculty), dtype=np.int64, count=count)
+    department_ids, first, department = np.unique(
+        np.fromiter((f[2] for f in faculty), dtype=np.int64, count=count),
+        return_index=True, return_inverse=True,
+    )
+
+    assigned = np.zeros(count, dtype=np.int64)
+    if len(subjects) and count:
+        teacher, n = np.fromiter(
+            chain.from_iterable(subjects), dtype=np.int64, count=2 * len(subjects)
+        ).reshape(-1, 2).T
+        row, keep = _rows(faculty_ids, teacher)
+        assigned[row[keep]] = n[keep]
+
+    load = np.zeros((count, days, periods), dtype=np.int16)
+    if len(entries) and count:
+        teacher, day, period = np.fromiter(
+            chain.from_iterable(entries), dtype=np.int64, count=3 * len(entries)
+        ).reshape(-1, 3).T
+        row, keep = _rows(faculty_ids, teacher)
+        keep &= (day >= 0) & (day < days) & (period >= 0) & (period < periods)
+        # add.at counts repeated (teacher, day, period) triples, so clashes show up as 2+
+        np.add.at(load, (row[keep], day[keep], period[keep]), 1)
+
+    return LoadMatrix(
+        faculty_ids=faculty_ids,
+        names=[f[1] for f in faculty],
+        department=department.reshape(-1),
+        department_ids=department_ids,
+        department_names=[faculty[i][3] for i in first.tolist()],
+        subjects=assigned,
+        load=load,
+    )
+
+
+def _rows(faculty_ids: np.ndarray, teacher: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Matrix row of each teacher id, and which ids belong to the college at all."""
+    row = np.searchsorted(faculty_ids, teacher)
+    keep = (row < len(faculty_ids)) & (faculty_ids[np.minimum(row, len(faculty_ids) - 1)] == teacher)
+    return row, keep
+
+
+def longest_streaks(busy: np.ndarray) -> np.ndarray:
+    """Longest run of consecutive busy periods within any one day, per faculty."""
+    # Running count of busy periods, minus its value at the last free period
+    running = np.cumsum(busy, axis=2)
+    reset = np.maximum.accumulate(np.where(busy, 0, running), axis=2)
+    return (running - reset).max(axis=(1, 2))
+
+
+def idle_gaps(busy: np.ndarray) -> np.ndarray:
+    """Free periods between a teacher's first and last lecture of each day, summed over the week."""
+    periods = busy.shape[2]
+    taught = busy.any(axis=2)
+    first = busy.argmax(axis=2)
+    last = periods - 1 - busy[:, :, ::-1].argmax(axis=2)
+    span = np.where(taught, last - first + 1, 0)
+    return (span - busy.sum(axis=2)).sum(axis=1)
+
+
+def faculty_workload(matrix: LoadMatrix) -> dict:
+    busy = matrix.load > 0
+    weekly = matrix.load.sum(axis=(1, 2))
+    daily_peak = matrix.load.sum(axis=2).max(axis=1)
+    streaks = longest_streaks(busy)
+    gaps = idle_gaps(busy)
+    clashes = (matrix.load - 1).clip(min=0).sum(axis=(1, 2))
+
+    # Per-department spread of weekly hours; imbalance is the coefficient of variation
+    nd = len(matrix.department_ids)
+    members = np.bincount(matrix.department, minlength=nd)
+    total = np.bincount(matrix.department, weights=weekly, minlength=nd)
+    squares = np.bincount(matrix.department, weights=weekly.astype(np.float64) ** 2, minlength=nd)
+    mean = np.divide(total, members, out=np.zeros(nd), where=members > 0)
+    std = np.sqrt(np.maximum(np.divide(squares, members, out=np.zeros(nd), where=members > 0) - mean ** 2, 0))
+    imbalance = np.divide(std, mean, out=np.zeros(nd), where=mean > 0)
+    highest = np.full(nd, np.iinfo(np.int64).min)
+    lowest = np.full(nd, np.iinfo(np.int64).max)
+    np.maximum.at(highest, matrix.department, weekly)
+    np.minimum.at(lowest, matrix.department, weekly)
+
+    return {
+        "faculty": len(matrix.faculty_ids),
+        "total_hours": int(weekly.sum()),
+        "by_faculty": [
+            {
+                "faculty_id": faculty_id,
+                "name": name,
+                "department_id": int(matrix.department_ids[d]),
+                "subjects": s,
+                "weekly_hours": w,
+                "peak_daily_hours": p,
+                "longest_streak": k,
+                "idle_gaps": g,
+                "clashes": c,
+            }
+            for faculty_id, name, d, s, w, p, k, g, c in zip(
+                matrix.faculty_ids.tolist(), matrix.names, matrix.department.tolist(),
+                matrix.subjects.tolist(), weekly.tolist(), daily_peak.tolist(),
+                streaks.tolist(), gaps.tolist(), clashes.tolist(),
+            )
+        ],
+        "by_department": [
+            {
+                "department_id": department_id,
+                "name": name,
+                "faculty": n,
+                "mean_hours": round(m, 2),
+                "std_hours": round(sd, 2),
+                "min_hours": lo,
+                "max_hours": hi,
+                "imbalance": round(cv, 4),
+            }
+            for department_id, name, n, m, sd, lo, hi, cv in zip(
+                matrix.department_ids.tolist(), matrix.department_names, members.tolist(),
+                mean.tolist(), std.tolist(), lowest.tolist(), highest.tolist(), imbalance.tolist(),
+            )
+        ],
+    }
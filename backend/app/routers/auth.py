@@ -1,10 +1,11 @@
 # app/routes/auth.py
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
-from app.database import get_db
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import get_async_db
 from app.schemas.user import UserCreate
-from app.crud.user import get_user_by_username, create_user, verify_password ,get_user_by_email
-from app.crud.jwt import create_access_token
+from app.crud.user import get_user_by_username, create_user, verify_password ,get_user_by_email, principal_cache
+from app.crud.jwt import create_access_token, token_cache
+from app.crud.deps import get_current_user
 from app.crud.role import get_role_by_id, create_role
 
 
@@ -14,25 +15,29 @@ from fastapi import Depends
 router = APIRouter()
 
 @router.post("/register")
-def register(user: UserCreate, session: Session = Depends(get_db)):
-    db_user = get_user_by_username(session, user.username)
+async def register(user: UserCreate, session: AsyncSession = Depends(get_async_db)):
+    db_user = await get_user_by_username(session, user.username)
     if db_user:
         raise HTTPException(status_code=400, detail="Username already registered")
-    if get_user_by_email(session, user.email):
+    if await get_user_by_email(session, user.email):
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    return create_user(session, user, role_id=None, college_id=user.college_id)
+    # Hand the connection back to the pool while the password is hashed
+    await session.close()
+
+    return await create_user(session, user, role_id=None, college_id=user.college_id)
 
     
 
 @router.post("/login")
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    session: Session = Depends(get_db)
+    session: AsyncSession = Depends(get_async_db)
 ):
-    db_user = get_user_by_email(session, form_data.username)
+    db_user = await get_user_by_email(session, form_data.username)
+    await session.close()
 
-    if not db_user or not verify_password(
+    if not db_user or not await verify_password(
         form_data.password, db_user.hashed_password
     ):
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -49,3 +54,11 @@ def login(
         "token_type": "bearer"
     }
 
+
+@router.get("/cache-stats")
+def auth_cache_stats(current_user=Depends(get_current_user)):
+    """Hit/miss counters of this worker's token and principal caches."""
+    return {
+        "tokens": token_cache.stats(),
+        "principals": principal_cache.stats(),
+    }
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import get_async_db
+from app.crud.batch import run_batch
+from app.crud.deps import get_current_user
+from app.schemas.batch import BatchRequest, BatchResponse
+
+router = APIRouter()
+
+
+@router.post("/", response_model=BatchResponse)
+async def batch(
+    batch: BatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    """Run create/update/delete operations in order, in a single transaction.
+
+    Each result is what the individual call would have returned. On the
+    first failing operation nothing is written, and the error's detail
+    is {"index": <operation>, "detail": <the individual call's detail>}.
+    """
+    return BatchResponse(results=await run_batch(db, batch.operations, current_user.college_id))
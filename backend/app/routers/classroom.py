@@ -1,49 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, UploadFile
 from sqlmodel import Session, func, or_, select
-from app.database import get_db
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import get_async_db, get_db
 from app.models.classroom import Classroom
-from app.models.department import Department
 from app.schemas.classroom import ClassroomCreate, ClassroomRead, ClassroomUpdate,DeleteClassroomResponse
 from app.schemas.utils import DeleteResponse
+from app.schemas.imports import ImportReport
+from app.crud import classroom as classroom_crud
 from app.crud.deps import get_current_user
+from app.crud.pagination import PageParams, fetch_page
+from app.crud.imports import ClassroomImporter, import_csv
+from app.crud.etag import collection_etag, not_modified
+from app.crud.classroom import classroom_load_options
+from app.search.trie import registry as search_indexes
 
 router = APIRouter()
 
 @router.post("/", response_model=ClassroomRead)
-def create_classroom(classroom: ClassroomCreate, session: Session = Depends(get_db),current_user = Depends(get_current_user)):
-    # Check if department exists
-    department = session.get(Department, classroom.department_id)
-    if not department:
-        raise HTTPException(status_code=404, detail="Department not found")
+async def create_classroom(classroom: ClassroomCreate, session: AsyncSession = Depends(get_async_db),current_user = Depends(get_current_user)):
+    db_classroom = await classroom_crud.create_classroom(session, classroom, current_user.college_id)
+    await session.commit()
+    # Reload with nested relationships; an async session can't lazy-load them while serializing
+    return await session.get(Classroom, db_classroom.id, options=classroom_load_options(), populate_existing=True)
 
-    existing_classroom = session.exec(
-        select(Classroom).where(
-            Classroom.room_no == classroom.room_no,
-            Classroom.department_id == classroom.department_id
-        )
-    ).first()
-
-    if existing_classroom:
-        raise HTTPException(
-            status_code=400,
-            detail="Classroom with this room number already exists in this department"
-        )
-        
-    db_classroom = Classroom.model_validate(classroom)
-    db_classroom.college_id = current_user.college_id
-    
-    session.add(db_classroom)
-    session.commit()
-    session.refresh(db_classroom)
-    return db_classroom
+@router.post("/import", response_model=ImportReport)
+def import_classrooms(file: UploadFile, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
+    """Bulk create from a CSV upload with columns: building_name, room_no, capacity, department_id."""
+    report = import_csv(db, ClassroomImporter(db, current_user.college_id), file.file)
+    if report.created:
+        search_indexes.invalidate(current_user.college_id)
+    return report
 
 @router.get("/", response_model=list[ClassroomRead])
-def get_classrooms(
-    session: Session = Depends(get_db),
+async def get_classrooms(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
     search_text: str | None = None,
+    page: PageParams = Depends(),
 ):
-    query = select(Classroom).where(
+    etag = await collection_etag(session, current_user.college_id, Classroom)
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    query = select(Classroom).options(*classroom_load_options()).where(
         Classroom.college_id == current_user.college_id
     )
 
@@ -51,55 +52,37 @@ def get_classrooms(
         search = f"{search_text.strip().lower()}%"
         query = query.where(
             or_(
-                func.lower(Classroom.room_no).like(search),
-                func.lower(Classroom.building_name).like(search),
+                func.trim(func.lower(Classroom.room_no)).like(search),
+                func.trim(func.lower(Classroom.building_name)).like(search),
             )
         )
 
-    classrooms = session.exec(query).all()
-    return classrooms
+    return await fetch_page(session, query, Classroom.id, page, response)
 
 @router.get("/{classroom_id}", response_model=ClassroomRead)
-def get_classroom_by_id(classroom_id: int, session: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    db_classroom = session.get(Classroom, classroom_id)
+async def get_classroom_by_id(classroom_id: int, request: Request, response: Response, session: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    etag = await collection_etag(session, current_user.college_id, Classroom)
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    db_classroom = await session.get(Classroom, classroom_id, options=classroom_load_options())
     if not db_classroom:
         raise HTTPException(status_code=404, detail="Classroom not found")
     return db_classroom
 
 @router.put("/{classroom_id}", response_model=ClassroomRead)
-def update_classroom(classroom_id: int, classroom: ClassroomUpdate, session: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    db_classroom = session.get(Classroom, classroom_id)
-    if not db_classroom:
-        raise HTTPException(status_code=404, detail="Classroom not found")
-    classroom_data = classroom.model_dump(exclude_unset=True)
-    
-    # Ensure department exists if changed
-    if "department_id" in classroom_data:
-        department = session.get(Department, classroom_data["department_id"])
-        if not department:
-            raise HTTPException(status_code=404, detail="Department not found")
-    
-    for field, value in classroom_data.items():
-        setattr(db_classroom, field, value)
-    session.add(db_classroom)
-    session.commit()
-    session.refresh(db_classroom)
-    return db_classroom
+async def update_classroom(classroom_id: int, classroom: ClassroomUpdate, session: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    db_classroom = await classroom_crud.update_classroom(session, classroom_id, classroom)
+    await session.commit()
+    return await session.get(Classroom, db_classroom.id, options=classroom_load_options(), populate_existing=True)
 @router.delete("/{classroom_id}", response_model=DeleteClassroomResponse)
-def delete_classroom(
+async def delete_classroom(
     classroom_id: int,
-    session: Session = Depends(get_db),
+    session: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user)
 ):
-    db_classroom = session.get(Classroom, classroom_id)
-    if not db_classroom:
-        raise HTTPException(status_code=404, detail="Classroom not found")
-
-    
-    classroom_public = ClassroomRead.model_validate(db_classroom)
-
-    session.delete(db_classroom)
-    session.commit()
+    classroom_public = await classroom_crud.delete_classroom(session, classroom_id)
+    await session.commit()
 
     return DeleteClassroomResponse(
         message="Classroom deleted successfully",
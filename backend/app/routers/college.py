@@ -1,34 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, func, select
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlmodel import delete, func, select
 from typing import List
-from app.database import get_db
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import get_async_db
 from app.models.college import College
+from app.models.college_stats import CollegeStats
 from app.schemas.college import CollegeCreate, CollegeRead, CollegeUpdate, DeleteCollegeResponse
 from app.crud.deps import get_current_user
+from app.crud.pagination import PageParams, fetch_page
 
 router = APIRouter()
 
 
 @router.post("/", response_model=CollegeRead)
-def create_college(college: CollegeCreate, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    existing = db.exec(select(College).where(College.name == college.name)).first()
+async def create_college(college: CollegeCreate, db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user)):
+    existing = (await db.exec(select(College).where(College.name == college.name))).first()
     if existing:
         raise HTTPException(status_code=400, detail="College with this name already exists")
 
     db_college = College.model_validate(college)
     db.add(db_college)
-    db.commit()
-    db.refresh(db_college)
+    await db.flush()
+    db.add(CollegeStats(college_id=db_college.id))
+    await db.commit()
+    await db.refresh(db_college)
     return db_college
 
 
 @router.get("/", response_model=List[CollegeRead])
-def get_colleges(
-    db: Session = Depends(get_db),
+async def get_colleges(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
     name: str | None = None,
+    page: PageParams = Depends(),
 ):
-    query = select(College)
+    query = select(College).where(College.id == current_user.college_id)
 
     if name:
         query = query.where(
@@ -36,28 +43,30 @@ def get_colleges(
             .like(f"{name.strip().lower()}%")
         )
 
-    colleges = db.exec(query).all()
-    return colleges
+    return await fetch_page(db, query, College.id, page, response)
 
 
 @router.get("/public", response_model=List[CollegeRead])
-def get_colleges_public(db: Session = Depends(get_db)):
+async def get_colleges_public(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    page: PageParams = Depends(),
+):
     """Public endpoint for registration dropdown — no auth required."""
-    colleges = db.exec(select(College)).all()
-    return colleges
+    return await fetch_page(db, select(College), College.id, page, response)
 
 
 @router.get("/{college_id}", response_model=CollegeRead)
-def get_college_by_id(college_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    college = db.get(College, college_id)
+async def get_college_by_id(college_id: int, db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user)):
+    college = await db.get(College, college_id)
     if not college:
         raise HTTPException(status_code=404, detail="College not found")
     return college
 
 
 @router.put("/{college_id}", response_model=CollegeRead)
-def update_college(college_id: int, college: CollegeUpdate, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    existing = db.get(College, college_id)
+async def update_college(college_id: int, college: CollegeUpdate, db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user)):
+    existing = await db.get(College, college_id)
     if not existing:
         raise HTTPException(status_code=404, detail="College not found")
 
@@ -66,18 +75,19 @@ def update_college(college_id: int, college: CollegeUpdate, db: Session = Depend
         setattr(existing, field, value)
 
     db.add(existing)
-    db.commit()
-    db.refresh(existing)
+    await db.commit()
+    await db.refresh(existing)
     return existing
 
 
 @router.delete("/{college_id}", response_model=DeleteCollegeResponse)
-def delete_college(college_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    existing = db.get(College, college_id)
+async def delete_college(college_id: int, db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user)):
+    existing = await db.get(College, college_id)
     if not existing:
         raise HTTPException(status_code=404, detail="College not found")
 
     college_public = CollegeRead.model_validate(existing)
-    db.delete(existing)
-    db.commit()
+    await db.exec(delete(CollegeStats).where(CollegeStats.college_id == college_id))
+    await db.delete(existing)
+    await db.commit()
     return DeleteCollegeResponse(message="College deleted successfully", data=college_public)
@@ -1,30 +1,41 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.database import get_db
-from app.models.subject import Subject
-from app.models.faculty import Faculty
-from app.models.classroom import Classroom
-from app.models.department import Department
+from app.database import get_async_db
+from app.models.college_stats import CollegeStats
 from app.crud.deps import get_current_user
+from app.crud.stats import aggregate_counts, seed_counts
 from app.schemas.dashboard import DashboardReadStats
 
 router = APIRouter()
 @router.get("/stats")
-def get_dashboard_stats(
-    db: Session = Depends(get_db),
+async def get_dashboard_stats(
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user)
 ):
+    college_id = current_user.college_id
     try:
-        return DashboardReadStats(
-            total_subjects = db.exec(select(func.count(Subject.id))).one(),
-            total_faculties = db.exec(select(func.count(Faculty.id))).one(),
-            total_classrooms = db.exec(select(func.count(Classroom.id))).one(),
-            total_departments = db.exec(select(func.count(Department.id))).one()
-        )
+        stats = await db.get(CollegeStats, college_id) if college_id is not None else None
+        if stats is None:
+            if college_id is None:
+                return _read((await db.exec(aggregate_counts(college_id))).one()._asdict())
+            # No counters yet (college created before they existed): count once and store them
+            await db.exec(seed_counts(college_id, db.bind.dialect.name))
+            await db.commit()
+            stats = await db.get(CollegeStats, college_id)
+        return _read(stats.model_dump())
 
-    except Exception as e:
+    except Exception:
         raise HTTPException(
             status_code=500,
             detail="Failed to fetch dashboard statistics"
         )
+
+
+def _read(counts: dict) -> DashboardReadStats:
+    return DashboardReadStats(
+        total_subjects=counts["subjects"],
+        total_faculties=counts["faculties"],
+        total_classrooms=counts["classrooms"],
+        total_departments=counts["departments"],
+    )
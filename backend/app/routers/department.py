@@ -1,35 +1,39 @@
 # app/routes/department.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, func, select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlmodel import func, select
 from typing import List
-from app.database import get_db
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import get_async_db
 from app.models.department import Department
 from app.schemas.department import DepartmentCreate, DepartmentRead, DepartmentUpdate, DeleteDepartmentResponse
 from app.schemas.utils import DeleteResponse
+from app.crud import department as department_crud
 from app.crud.deps import get_current_user
+from app.crud.pagination import PageParams, fetch_page
+from app.crud.etag import collection_etag, not_modified
 
 router = APIRouter()
 
 @router.post("/", response_model=DepartmentRead)
-def create_department(dept: DepartmentCreate, db: Session = Depends(get_db),current_user = Depends(get_current_user)):
-    # Optional: Check if already exists
-    existing = db.exec(select(Department).where(Department.name == dept.name)).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Department with this name and year already exists")
-    
-    db_dept = Department.model_validate(dept)
-    db_dept.college_id = current_user.college_id
-    db.add(db_dept)
-    db.commit()
-    db.refresh(db_dept)
+async def create_department(dept: DepartmentCreate, db: AsyncSession = Depends(get_async_db),current_user = Depends(get_current_user)):
+    db_dept = await department_crud.create_department(db, dept, current_user.college_id)
+    await db.commit()
+    await db.refresh(db_dept)
     return db_dept
 
 @router.get("/", response_model=List[DepartmentRead])
-def get_departments(
-    db: Session = Depends(get_db),
+async def get_departments(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
     name: str | None = None,  
+    page: PageParams = Depends(),
 ):
+    etag = await collection_etag(db, current_user.college_id, Department)
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
     query = select(Department).where(
         Department.college_id == current_user.college_id
     )
@@ -40,40 +44,30 @@ def get_departments(
             .like(f"{name.strip().lower()}%")
         )
 
-    departments = db.exec(query).all()
-    return departments
+    return await fetch_page(db, query, Department.id, page, response)
 
 @router.get("/{department_id}", response_model=DepartmentRead)
-def get_department_by_id(department_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    dept = db.get(Department, department_id)
+async def get_department_by_id(department_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    etag = await collection_etag(db, current_user.college_id, Department)
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    dept = await db.get(Department, department_id)
     if not dept:
         raise HTTPException(status_code=404, detail="Department not found")
     return dept
 
 @router.put("/{department_id}", response_model=DepartmentRead)
-def update_department(department_id: int, dept: DepartmentUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    existing = db.get(Department, department_id)
-    if not existing:
-        raise HTTPException(status_code=404, detail="Department not found")
-    
-    dept_data = dept.model_dump(exclude_unset=True)
-    for field, value in dept_data.items():
-        setattr(existing, field, value)
-    
-    db.add(existing)
-    db.commit()
-    db.refresh(existing)
+async def update_department(department_id: int, dept: DepartmentUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    existing = await department_crud.update_department(db, department_id, dept)
+    await db.commit()
+    await db.refresh(existing)
     return existing
 
 @router.delete("/{department_id}", response_model = DeleteDepartmentResponse)
-def delete_department(department_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    existing = db.get(Department, department_id)
-    if not existing:
-        raise HTTPException(status_code=404, detail="Department not found")
-    
-    department_public = DepartmentRead.model_validate(existing)
-    db.delete(existing)
-    db.commit()
+async def delete_department(department_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    department_public = await department_crud.delete_department(db, department_id)
+    await db.commit()
     return DeleteDepartmentResponse(message="Department deleted successfully",
                           data=department_public
     )
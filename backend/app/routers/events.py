@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends
+from app.config import settings
+from app.crud.deps import get_current_user, get_stream_user
+from app.crud.jwt import create_stream_token
+from app.events.broker import EventStreamResponse, broker
+
+router = APIRouter()
+
+
+@router.post("/token")
+async def stream_token(current_user=Depends(get_current_user)):
+    """Short-lived token for `GET /events?token=`, for clients (EventSource) that can't send headers.
+
+    It only opens the event stream, so a copy left in a proxy or access log
+    is no use once it expires and never grants the rest of the API.
+    """
+    return {
+        "token": create_stream_token(current_user),
+        "token_type": "bearer",
+        "expires_in": settings.EVENTS_TOKEN_EXPIRE_SECONDS,
+    }
+
+
+@router.get("/")
+async def stream_events(current_user=Depends(get_stream_user)):
+    """Server-sent events for writes to the caller's college.
+
+    Each event is named after the entity written (`timetable`, `subject`, ...)
+    and carries `{"entity", "action", ...}` with the ids involved; `resync`
+    means events were dropped and lists should be fetched again.
+    """
+    # Takes the slot now, so the capacity check counts this stream at once
+    subscriber = broker.subscribe(current_user.college_id)
+    return EventStreamResponse(
+        subscriber,
+        # Proxies must neither cache nor buffer the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
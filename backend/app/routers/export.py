@@ -0,0 +1,102 @@
+import csv
+import io
+import json
+from enum import Enum
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session, select
+from app.config import settings
+from app.database import engine
+from app.models.classroom import Classroom
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.subject import Subject
+from app.models.timetable import Timetable
+from app.models.timetable_entry import TimetableEntry
+from app.crud.deps import get_current_user
+
+router = APIRouter()
+
+EXPORTABLE = {
+    "timetables": Timetable,
+    "timetable-entries": TimetableEntry,
+    "subjects": Subject,
+    "faculties": Faculty,
+    "classrooms": Classroom,
+    "departments": Department,
+}
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+def _plain(value):
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def _stream_rows(model, college_id: int | None):
+    """Yield chunks of rows from a server-side cursor, in primary key order."""
+    columns = list(model.__table__.columns)
+    query = (
+        select(*columns)
+        .where(model.college_id == college_id)
+        .order_by(model.id)
+        .execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+    )
+    # The request's session is closed before the body is streamed, so the
+    # generator owns its own
+    with Session(engine) as session:
+        result = session.exec(query)
+        for chunk in result.partitions():
+            yield [c.name for c in columns], chunk
+
+
+def _csv_body(model, college_id: int | None):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header_sent = False
+    for header, chunk in _stream_rows(model, college_id):
+        if not header_sent:
+            writer.writerow(header)
+            header_sent = True
+        writer.writerows([_plain(v) for v in row] for row in chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if not header_sent:
+        yield ",".join(c.name for c in model.__table__.columns) + "\r\n"
+
+
+def _ndjson_body(model, college_id: int | None):
+    for header, chunk in _stream_rows(model, college_id):
+        yield "".join(
+            json.dumps(dict(zip(header, map(_plain, row)))) + "\n" for row in chunk
+        )
+
+
+@router.get("/{entity}")
+def export_entity(
+    entity: str,
+    format: ExportFormat = ExportFormat.CSV,
+    current_user=Depends(get_current_user),
+):
+    model = EXPORTABLE.get(entity)
+    if model is None:
+        raise HTTPException(status_code=404, detail="Unknown export entity")
+
+    if format == ExportFormat.CSV:
+        body, media_type = _csv_body(model, current_user.college_id), "text/csv"
+    else:
+        body, media_type = _ndjson_body(model, current_user.college_id), "application/x-ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{format.value}"'},
+    )
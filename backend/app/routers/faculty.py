@@ -1,33 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, UploadFile
 from sqlmodel import Session, func, select
 from typing import List
-from app.database import get_db
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import get_async_db, get_db
 from app.models.faculty import Faculty
-from app.models.department import Department
 from app.schemas.faculty import FacultyCreate, FacultyRead, FacultyUpdate, DeleteFacultyResponse
 from app.schemas.utils import DeleteResponse
+from app.schemas.imports import ImportReport
+from app.crud import faculty as faculty_crud
 from app.crud.deps import get_current_user
+from app.crud.pagination import PageParams, fetch_page
+from app.crud.imports import FacultyImporter, import_csv
+from app.crud.etag import collection_etag, not_modified
+from app.crud.faculty import faculty_load_options
+from app.search.trie import registry as search_indexes
 
 router = APIRouter()
 
 @router.post("/", response_model=FacultyRead)
-def create_faculty(faculty: FacultyCreate, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    if not db.get(Department, faculty.department_id):
-        raise HTTPException(status_code=404, detail="Department not found")
-    db_faculty = Faculty.model_validate(faculty)
-    db_faculty.college_id = current_user.college_id
-    db.add(db_faculty)
-    db.commit()
-    db.refresh(db_faculty)
-    return db_faculty
+async def create_faculty(faculty: FacultyCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    db_faculty = await faculty_crud.create_faculty(db, faculty, current_user.college_id)
+    await db.commit()
+    # Reload with nested relationships; an async session can't lazy-load them while serializing
+    return await db.get(Faculty, db_faculty.id, options=faculty_load_options(), populate_existing=True)
+
+@router.post("/import", response_model=ImportReport)
+def import_faculties(file: UploadFile, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
+    """Bulk create from a CSV upload with columns: name, department_id."""
+    report = import_csv(db, FacultyImporter(db, current_user.college_id), file.file)
+    if report.created:
+        search_indexes.invalidate(current_user.college_id)
+    return report
 
 @router.get("/", response_model=List[FacultyRead])
-def get_faculties(
-    db: Session = Depends(get_db),
+async def get_faculties(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
     name: str | None = None,
+    page: PageParams = Depends(),
 ):
-    query = select(Faculty).where(
+    etag = await collection_etag(db, current_user.college_id, Faculty)
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    query = select(Faculty).options(*faculty_load_options()).where(
         Faculty.college_id == current_user.college_id
     )
 
@@ -37,43 +55,29 @@ def get_faculties(
             .like(f"{name.strip().lower()}%")
         )
 
-    faculties = db.exec(query).all()
-    return faculties
+    return await fetch_page(db, query, Faculty.id, page, response)
 
 @router.get("/{faculty_id}", response_model=FacultyRead)
-def get_faculty_by_id(faculty_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    db_faculty = db.get(Faculty, faculty_id)
+async def get_faculty_by_id(faculty_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    etag = await collection_etag(db, current_user.college_id, Faculty)
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    db_faculty = await db.get(Faculty, faculty_id, options=faculty_load_options())
     if not db_faculty:
         raise HTTPException(status_code=404, detail="Faculty not found")
     return db_faculty
 
 @router.put("/{faculty_id}", response_model=FacultyRead)
-def update_faculty(faculty_id: int, faculty: FacultyUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    db_faculty = db.get(Faculty, faculty_id)
-    if not db_faculty:
-        raise HTTPException(status_code=404, detail="Faculty not found")
-    if not db.get(Department, faculty.department_id):
-        raise HTTPException(status_code=404, detail="Department not found")
-    faculty_data = faculty.model_dump(exclude_unset=True)
-    for field, value in faculty_data.items():
-        setattr(db_faculty, field, value)
-    
-    db.add(db_faculty)
-    db.commit()
-    db.refresh(db_faculty)
-    return db_faculty
+async def update_faculty(faculty_id: int, faculty: FacultyUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    db_faculty = await faculty_crud.update_faculty(db, faculty_id, faculty)
+    await db.commit()
+    return await db.get(Faculty, db_faculty.id, options=faculty_load_options(), populate_existing=True)
 
 @router.delete("/{faculty_id}", response_model=DeleteFacultyResponse)
-def delete_faculty(faculty_id: int, db: Session = Depends(get_db), _current_user = Depends(get_current_user)): # noqa: B008
-    db_faculty = db.get(Faculty, faculty_id)
-    if not db_faculty:
-        raise HTTPException(status_code=404, detail="Faculty not found")
-    
-    faculty_public = FacultyRead.model_validate(db_faculty)
-    db.delete(db_faculty)
-    db.commit()
+async def delete_faculty(faculty_id: int, db: AsyncSession = Depends(get_async_db), _current_user = Depends(get_current_user)): # noqa: B008
+    faculty_public = await faculty_crud.delete_faculty(db, faculty_id)
+    await db.commit()
     return DeleteFacultyResponse(message="Faculty deleted successfully",
                           data= faculty_public
                     )
-
-
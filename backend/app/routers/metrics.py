@@ -0,0 +1,20 @@
+import secrets
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from app.config import settings
+from app.metrics import metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse, tags=["Metrics"])
+async def get_metrics(request: Request):
+    """Request, SQL and threadpool metrics of this worker in the Prometheus text format."""
+    # Route names and traffic aren't for everyone: no token configured, no metrics
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=403, detail="Metrics are disabled; set METRICS_TOKEN to enable them")
+    # A static scrape token rather than a user JWT, which would expire
+    authorization = request.headers.get("authorization", "")
+    if not secrets.compare_digest(authorization.encode(), f"Bearer {settings.METRICS_TOKEN}".encode()):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
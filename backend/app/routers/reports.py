@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+from app.database import get_db
+from app.crud.deps import get_current_user
+from app.models.timetable import SemesterEnum
+from app.reports.utilization import load_room_grid, room_utilization
+from app.reports.workload import faculty_workload, load_matrix
+from app.schemas.reports import FacultyWorkloadReport, RoomUtilizationReport
+
+router = APIRouter()
+
+
+@router.get("/rooms", response_model=RoomUtilizationReport)
+def get_room_utilization(
+    academic_year: str,
+    semester: SemesterEnum,
+    peaks: int = Query(default=5, ge=1, le=40),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Room usage over the term of `academic_year` and `semester` (all semesters of the same parity)."""
+    grid = load_room_grid(db, current_user.college_id, academic_year, semester)
+    return RoomUtilizationReport(
+        academic_year=academic_year,
+        semester=semester,
+        **room_utilization(grid, peaks),
+    )
+
+
+@router.get("/faculty-workload", response_model=FacultyWorkloadReport)
+def get_faculty_workload(
+    academic_year: str,
+    semester: SemesterEnum,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Teaching load per teacher and its spread within each department, over the same term as /rooms."""
+    matrix = load_matrix(db, current_user.college_id, academic_year, semester)
+    return FacultyWorkloadReport(
+        academic_year=academic_year,
+        semester=semester,
+        **faculty_workload(matrix),
+    )
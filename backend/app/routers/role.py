@@ -1,27 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, func, select
-from app.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import get_async_db
 from app.models.roles import Role
 from app.schemas.role import RoleCreate, RoleRead, DeleteRoleResponse
 from app.crud.deps import get_current_user
+from app.crud.pagination import PageParams, fetch_page
 
 router = APIRouter()
 
 
 @router.post("/", response_model=RoleRead)
-def add_role(role: RoleCreate, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+async def add_role(role: RoleCreate, db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user)):
     db_role = Role(role_name=role.role_name)
     db.add(db_role)
-    db.commit()
-    db.refresh(db_role)
+    await db.commit()
+    await db.refresh(db_role)
     return db_role
 
 
 @router.get("/", response_model=list[RoleRead])
-def read_roles(
-    db: Session = Depends(get_db),
+async def read_roles(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
     name: str | None = None,
+    page: PageParams = Depends(),
 ):
     query = select(Role)
 
@@ -31,25 +35,24 @@ def read_roles(
             .like(f"{name.strip().lower()}%")
         )
 
-    roles = db.exec(query).all()
-    return roles
+    return await fetch_page(db, query, Role.id, page, response)
 
 
 @router.get("/{role_id}", response_model=RoleRead)
-def read_role(role_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    role = db.get(Role, role_id)
+async def read_role(role_id: int, db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user)):
+    role = await db.get(Role, role_id)
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
     return role
 
 
 @router.delete("/{role_id}", response_model=DeleteRoleResponse)
-def remove_role(role_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    role = db.get(Role, role_id)
+async def remove_role(role_id: int, db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user)):
+    role = await db.get(Role, role_id)
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
 
     role_public = RoleRead.model_validate(role)
-    db.delete(role)
-    db.commit()
+    await db.delete(role)
+    await db.commit()
     return DeleteRoleResponse(message="Role deleted successfully", data=role_public)
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List
+from app.config import settings
+from app.database import get_async_db
+from app.schemas.search import SearchHit, SearchType
+from app.crud.deps import get_current_user
+from app.crud.search import autocomplete
+
+router = APIRouter()
+
+
+@router.get("/autocomplete", response_model=List[SearchHit])
+async def autocomplete_names(
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=settings.AUTOCOMPLETE_LIMIT_DEFAULT, ge=1),
+    types: List[SearchType] | None = Query(default=None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    """Names starting with `q` across subjects, faculty, departments and classrooms, then (for 3+ characters) names containing it."""
+    if not q.strip():
+        return []
+    rows = await autocomplete(
+        db,
+        current_user.college_id,
+        q,
+        min(limit, settings.AUTOCOMPLETE_LIMIT_MAX),
+        {t.value for t in types} if types else None,
+    )
+    return [SearchHit(type=type_, id=id_, name=name) for type_, id_, name in rows]
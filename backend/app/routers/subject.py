@@ -1,36 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, UploadFile
 from sqlmodel import Session, func, select
 from typing import List
-from app.database import get_db
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import get_async_db, get_db
 from app.models.subject import Subject
-from app.models.faculty import Faculty
-from app.models.department import Department
 from app.schemas.subject import SubjectCreate, SubjectRead, SubjectUpdate, DeleteSubjectResponse
 from app.schemas.utils import DeleteResponse
+from app.schemas.imports import ImportReport
+from app.crud import subject as subject_crud
 from app.crud.deps import get_current_user
+from app.crud.pagination import PageParams, fetch_page
+from app.crud.imports import SubjectImporter, import_csv
+from app.crud.etag import collection_etag, not_modified
+from app.crud.subject import subject_load_options
+from app.search.trie import registry as search_indexes
 
 router = APIRouter()
 
 @router.post("/", response_model=SubjectRead)
-def create_subject(subject: SubjectCreate, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    if not db.get(Faculty, subject.faculty_id):
-        raise HTTPException(status_code=404, detail="Faculty not found")
-    if not db.get(Department, subject.department_id):
-        raise HTTPException(status_code=404, detail="Department not found")
-    db_subject = Subject.model_validate(subject)
-    db_subject.college_id = current_user.college_id
-    db.add(db_subject)
-    db.commit()
-    db.refresh(db_subject)
-    return db_subject
+async def create_subject(subject: SubjectCreate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    db_subject = await subject_crud.create_subject(db, subject, current_user.college_id)
+    await db.commit()
+    # Reload with nested relationships; an async session can't lazy-load them while serializing
+    return await db.get(Subject, db_subject.id, options=subject_load_options(), populate_existing=True)
+
+@router.post("/import", response_model=ImportReport)
+def import_subjects(file: UploadFile, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
+    """Bulk create from a CSV upload with columns: name, faculty_id, department_id."""
+    report = import_csv(db, SubjectImporter(db, current_user.college_id), file.file)
+    if report.created:
+        search_indexes.invalidate(current_user.college_id)
+    return report
 
 @router.get("/", response_model=List[SubjectRead])
-def get_subjects(
-    db: Session = Depends(get_db),
+async def get_subjects(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
     name: str | None = None,
+    page: PageParams = Depends(),
 ):
-    query = select(Subject).where(
+    etag = await collection_etag(db, current_user.college_id, Subject)
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    query = select(Subject).options(*subject_load_options()).where(
         Subject.college_id == current_user.college_id
     )
 
@@ -40,46 +55,30 @@ def get_subjects(
             .like(f"{name.strip().lower()}%")
         )
 
-    subjects = db.exec(query).all()
-    return subjects
+    return await fetch_page(db, query, Subject.id, page, response)
 
 
 @router.get("/{subject_id}", response_model=SubjectRead)
-def get_subject_by_id(subject_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    db_subject = db.get(Subject, subject_id)
+async def get_subject_by_id(subject_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    etag = await collection_etag(db, current_user.college_id, Subject)
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    db_subject = await db.get(Subject, subject_id, options=subject_load_options())
     if not db_subject:
         raise HTTPException(status_code=404, detail="Subject not found")
     return db_subject
 
 @router.put("/{subject_id}", response_model=SubjectRead)
-def update_subject(subject_id: int, subject: SubjectUpdate, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    db_subject = db.get(Subject, subject_id)
-    if not db_subject:
-        raise HTTPException(status_code=404, detail="Subject not found")
-    if not db.get(Faculty, subject.faculty_id):
-        raise HTTPException(status_code=404, detail="Faculty not found")
-    if not db.get(Department, subject.department_id):
-        raise HTTPException(status_code=404, detail="Department not found")
-    subject_data = subject.model_dump(exclude_unset=True)
-    for field, value in subject_data.items():
-        setattr(db_subject, field, value)
-    
-    db.add(db_subject)
-    db.commit()
-    db.refresh(db_subject)
-    return db_subject
+async def update_subject(subject_id: int, subject: SubjectUpdate, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    db_subject = await subject_crud.update_subject(db, subject_id, subject)
+    await db.commit()
+    return await db.get(Subject, db_subject.id, options=subject_load_options(), populate_existing=True)
 
 @router.delete("/{subject_id}", response_model=DeleteSubjectResponse)
-def delete_subject(subject_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    db_subject = db.get(Subject, subject_id)
-    if not db_subject:
-        raise HTTPException(status_code=404, detail="Subject not found")
-    
-    subject_public = SubjectRead.model_validate(db_subject)
-    db.delete(db_subject)
-    db.commit()
+async def delete_subject(subject_id: int, db: AsyncSession = Depends(get_async_db), current_user = Depends(get_current_user)):
+    subject_public = await subject_crud.delete_subject(db, subject_id)
+    await db.commit()
     return DeleteSubjectResponse(message="Subject deleted successfully",
                           data=subject_public
                         )
-
-
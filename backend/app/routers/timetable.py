@@ -1,85 +1,112 @@
-from fastapi import APIRouter, Depends, HTTPException
+import os
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import FileResponse
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
-from app.database import get_db
-from app.models.timetable import Timetable
-from app.models.department import Department
+from app.database import get_async_db, get_db
+from app.models.timetable import SemesterEnum, Timetable
 from app.models.faculty import Faculty
+from app.models.subject import Subject
+from app.models.classroom import Classroom
 from app.schemas.timetable import (
     TimetableCreate,
     TimetableRead,
     TimetableUpdate,
     DeleteTimetableResponse,
+    TimetableEntryCreate,
+    TimetableEntryRead,
+    TimetableGenerateRequest,
+    TimetableGenerateResponse,
+    UnplacedLessonRead,
+    SlotRead,
+    SolverMode,
+    TermGenerateRequest,
+    TermGenerateResponse,
+    TermTimetableSummary,
+    TimetableRepairRequest,
+    TimetableRepairResponse,
+    PdfJobRead,
 )
+from app.crud import timetable as timetable_crud
 from app.crud.deps import get_current_user
-from sqlalchemy.exc import IntegrityError
+from app.crud.etag import entries_etag, not_modified, timetable_etag
+from app.crud.pagination import PageParams, fetch_page
+from app.crud.timetable import (
+    apply_moves,
+    build_problem,
+    find_clashes,
+    get_entries,
+    get_occupancy,
+    missing_ids,
+    pdf_payload,
+    pdf_version,
+    replace_entries,
+    subject_faculty_map,
+    timetable_load_options,
+)
+from app.scheduler.solver import Placement, solve
+from app.scheduler.portfolio import solve_portfolio
+from app.scheduler.decompose import solve_decomposed
+from app.scheduler.repair import repair_placements
+from app.reports.pdf_jobs import (
+    cache_key as pdf_cache_key,
+    cache_path as pdf_cache_path,
+    job_status as pdf_job_status,
+    submit_render,
+    timetable_of as pdf_job_timetable,
+)
+from app.config import settings
 
 router = APIRouter()
 
-
 @router.post("/", response_model=TimetableRead)
-def create_timetable(
+async def create_timetable(
     timetable: TimetableCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    # Validate department exists
-    department = db.get(Department, timetable.department_id)
-    if not department:
-        raise HTTPException(status_code=404, detail="Department not found")
-
-    # Validate class coordinator exists
-    coordinator = db.get(Faculty, timetable.class_coordinator_id)
-    if not coordinator:
-        raise HTTPException(status_code=404, detail="Class coordinator not found")
-
-    # Check unique constraint before inserting
-    existing = db.exec(
-        select(Timetable).where(
-            Timetable.department_id == timetable.department_id,
-            Timetable.academic_year == timetable.academic_year,
-            Timetable.semester == timetable.semester,
-        )
-    ).first()
-    if existing:
-        raise HTTPException(
-            status_code=400,
-            detail="Timetable for this department, academic year and semester already exists",
-        )
-
-    # Create timetable with auto-assigned college_id
-    db_timetable = Timetable.model_validate(timetable)
-    db_timetable.college_id = current_user.college_id
-
-    try:
-        db.add(db_timetable)
-        db.commit()
-        db.refresh(db_timetable)
-        return db_timetable
-    except IntegrityError:
-        db.rollback()
-        raise HTTPException(
-            status_code=400,
-            detail="Timetable for this department, academic year and semester already exists",
-        )
+    db_timetable = await timetable_crud.create_timetable(db, timetable, current_user.college_id)
+    await db.commit()
+    # Reload with nested relationships; an async session can't lazy-load them while serializing
+    return await db.get(
+        Timetable, db_timetable.id, options=timetable_load_options(), populate_existing=True
+    )
 
 
 @router.get("/", response_model=List[TimetableRead])
-def get_timetables(
-    db: Session = Depends(get_db), current_user=Depends(get_current_user)
+async def get_timetables(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+    page: PageParams = Depends(),
 ):
-    return db.exec(
-        select(Timetable).where(Timetable.college_id == current_user.college_id)
-    ).all()
+    etag = await timetable_etag(db, current_user.college_id)
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    query = (
+        select(Timetable)
+        .options(*timetable_load_options())
+        .where(Timetable.college_id == current_user.college_id)
+    )
+    return await fetch_page(db, query, Timetable.id, page, response)
 
 
 @router.get("/{timetable_id}", response_model=TimetableRead)
-def get_timetable_by_id(
+async def get_timetable_by_id(
     timetable_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    db_timetable = db.get(Timetable, timetable_id)
+    etag = await timetable_etag(db, current_user.college_id)
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    db_timetable = await db.get(Timetable, timetable_id, options=timetable_load_options())
     if not db_timetable or db_timetable.college_id != current_user.college_id:
         raise HTTPException(status_code=404, detail="Timetable not found")
 
@@ -87,9 +114,38 @@ def get_timetable_by_id(
 
 
 @router.put("/{timetable_id}", response_model=TimetableRead)
-def update_timetable(
+async def update_timetable(
     timetable_id: int,
     timetable: TimetableUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    db_timetable = await timetable_crud.update_timetable(db, timetable_id, timetable, current_user.college_id)
+    await db.commit()
+    return await db.get(
+        Timetable, db_timetable.id, options=timetable_load_options(), populate_existing=True
+    )
+
+
+@router.delete("/{timetable_id}", response_model=DeleteTimetableResponse)
+async def delete_timetable(
+    timetable_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    timetable_public = await timetable_crud.delete_timetable(db, timetable_id, current_user.college_id)
+    await db.commit()
+
+    return DeleteTimetableResponse(
+        message="Timetable deleted successfully", data=timetable_public
+    )
+
+
+@router.get("/{timetable_id}/entries", response_model=List[TimetableEntryRead])
+def get_timetable_entries(
+    timetable_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
@@ -97,70 +153,281 @@ def update_timetable(
     if not db_timetable or db_timetable.college_id != current_user.college_id:
         raise HTTPException(status_code=404, detail="Timetable not found")
 
-    timetable_data = timetable.model_dump(exclude_unset=True)
-
-    # Validate department if being updated
-    if "department_id" in timetable_data:
-        department = db.get(Department, timetable_data["department_id"])
-        if not department:
-            raise HTTPException(status_code=404, detail="Department not found")
-
-        # Check unique constraint for new department/year/semester combination
-        new_dept_id = timetable_data.get("department_id", db_timetable.department_id)
-        new_year = timetable_data.get("academic_year", db_timetable.academic_year)
-        new_semester = timetable_data.get("semester", db_timetable.semester)
-
-        existing = db.exec(
-            select(Timetable).where(
-                Timetable.department_id == new_dept_id,
-                Timetable.academic_year == new_year,
-                Timetable.semester == new_semester,
-                Timetable.id != timetable_id,
-            )
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=400,
-                detail="Timetable for this department, academic year and semester already exists",
-            )
+    # Entry writes touch updated_at, so the timetable row alone tags its entries
+    unchanged = not_modified(request, response, entries_etag(db_timetable))
+    if unchanged:
+        return unchanged
+
+    return get_entries(db, timetable_id)
+
+
+@router.put("/{timetable_id}/entries", response_model=List[TimetableEntryRead])
+def replace_timetable_entries(
+    timetable_id: int,
+    entries: List[TimetableEntryCreate],
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    db_timetable = db.get(Timetable, timetable_id)
+    if not db_timetable or db_timetable.college_id != current_user.college_id:
+        raise HTTPException(status_code=404, detail="Timetable not found")
+
+    slots = {(e.day, e.period) for e in entries}
+    if len(slots) != len(entries):
+        raise HTTPException(status_code=400, detail="Duplicate day/period in timetable entries")
+
+    # Set-based FK validation: one query per referenced table
+    subject_ids = {e.subject_id for e in entries}
+    missing = missing_ids(db, Subject, subject_ids, current_user.college_id)
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Subject not found: {missing}")
+    subject_faculty = subject_faculty_map(db, subject_ids)
 
-    # Validate coordinator if being updated
-    if "class_coordinator_id" in timetable_data:
-        coordinator = db.get(Faculty, timetable_data["class_coordinator_id"])
-        if not coordinator:
-            raise HTTPException(status_code=404, detail="Class coordinator not found")
-
-    # Apply updates
-    for field, value in timetable_data.items():
-        setattr(db_timetable, field, value)
-
-    try:
-        db.add(db_timetable)
-        db.commit()
-        db.refresh(db_timetable)
-        return db_timetable
-    except IntegrityError:
-        db.rollback()
-        raise HTTPException(
-            status_code=400,
-            detail="Timetable for this department, academic year and semester already exists",
+    placements = [
+        Placement(
+            subject_id=e.subject_id,
+            faculty_id=e.faculty_id if e.faculty_id is not None else subject_faculty[e.subject_id],
+            group_id=timetable_id,
+            classroom_id=e.classroom_id,
+            day=e.day,
+            period=e.period,
         )
+        for e in entries
+    ]
+    missing = missing_ids(db, Faculty, {p.faculty_id for p in placements}, current_user.college_id)
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Faculty not found: {missing}")
+    missing = missing_ids(db, Classroom, {p.classroom_id for p in placements}, current_user.college_id)
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Classroom not found: {missing}")
 
+    clashes = find_clashes(db, db_timetable, placements)
+    if clashes:
+        raise HTTPException(status_code=409, detail={"message": "Timetable entries clash with other timetables", "clashes": clashes})
 
-@router.delete("/{timetable_id}", response_model=DeleteTimetableResponse)
-def delete_timetable(
+    replace_entries(db, [db_timetable], placements)
+    return get_entries(db, timetable_id)
+
+
+@router.get("/{timetable_id}/free-slots", response_model=List[SlotRead])
+def get_free_slots(
     timetable_id: int,
+    faculty_id: int | None = None,
+    classroom_id: int | None = None,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     db_timetable = db.get(Timetable, timetable_id)
     if not db_timetable or db_timetable.college_id != current_user.college_id:
         raise HTTPException(status_code=404, detail="Timetable not found")
+    if faculty_id is None and classroom_id is None:
+        raise HTTPException(status_code=422, detail="Pass faculty_id, classroom_id or both")
 
-    timetable_public = TimetableRead.model_validate(db_timetable)
-    db.delete(db_timetable)
-    db.commit()
+    index = get_occupancy(db, db_timetable)
+    return [
+        SlotRead(day=day, period=period)
+        for day, period in index.free_slots(faculty_id, classroom_id, timetable_id=timetable_id)
+    ]
 
-    return DeleteTimetableResponse(
-        message="Timetable deleted successfully", data=timetable_public
+
+@router.post("/{timetable_id}/generate", response_model=TimetableGenerateResponse)
+def generate_timetable(
+    timetable_id: int,
+    options: TimetableGenerateRequest,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    db_timetable = db.get(Timetable, timetable_id)
+    if not db_timetable or db_timetable.college_id != current_user.college_id:
+        raise HTTPException(status_code=404, detail="Timetable not found")
+
+    problem = build_problem(
+        db, [db_timetable], options.lectures_per_subject, options.subject_lectures
     )
+    if not problem.lessons:
+        raise HTTPException(status_code=400, detail="Department has no subjects to schedule")
+    if not problem.rooms[db_timetable.id]:
+        raise HTTPException(status_code=400, detail="No classrooms available for this department")
+
+    if options.mode == SolverMode.PORTFOLIO:
+        solution = solve_portfolio(problem, seed=options.seed)
+    else:
+        solution = solve(problem, seed=options.seed, time_limit=settings.SOLVER_TIME_LIMIT_SECONDS)
+    replace_entries(db, [db_timetable], solution.placements)
+
+    return TimetableGenerateResponse(
+        timetable_id=timetable_id,
+        entries=[TimetableEntryRead.model_validate(e) for e in get_entries(db, timetable_id)],
+        unplaced=[
+            UnplacedLessonRead(subject_id=l.subject_id, faculty_id=l.faculty_id, missing=l.count)
+            for l in solution.unplaced
+        ],
+        penalty=solution.penalty,
+        solve_time_ms=solution.elapsed * 1000,
+        strategy=solution.strategy,
+        seed=solution.seed,
+    )
+
+
+@router.post("/generate", response_model=TermGenerateResponse)
+def generate_term(
+    options: TermGenerateRequest,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    same_parity = [s for s in SemesterEnum if s % 2 == options.semester % 2]
+    timetables = db.exec(
+        select(Timetable).where(
+            Timetable.college_id == current_user.college_id,
+            Timetable.academic_year == options.academic_year,
+            Timetable.semester.in_(same_parity),
+        )
+    ).all()
+    if not timetables:
+        raise HTTPException(status_code=404, detail="No timetables found for this term")
+
+    problem = build_problem(
+        db, timetables, options.lectures_per_subject, options.subject_lectures
+    )
+    solution, parts = solve_decomposed(
+        problem, seed=options.seed, time_limit=settings.SOLVER_TIME_LIMIT_SECONDS
+    )
+    replace_entries(db, timetables, solution.placements)
+
+    placed, unplaced = {}, {}
+    for p in solution.placements:
+        placed[p.group_id] = placed.get(p.group_id, 0) + 1
+    for l in solution.unplaced:
+        unplaced.setdefault(l.group_id, []).append(
+            UnplacedLessonRead(subject_id=l.subject_id, faculty_id=l.faculty_id, missing=l.count)
+        )
+
+    return TermGenerateResponse(
+        timetables=[
+            TermTimetableSummary(
+                timetable_id=t.id,
+                entries=placed.get(t.id, 0),
+                unplaced=unplaced.get(t.id, []),
+            )
+            for t in timetables
+        ],
+        components=len(parts),
+        largest_component=max((len(part) for part in parts), default=0),
+        penalty=solution.penalty,
+        solve_time_ms=solution.elapsed * 1000,
+    )
+
+
+@router.post("/{timetable_id}/repair", response_model=TimetableRepairResponse)
+def repair_timetable(
+    timetable_id: int,
+    request: TimetableRepairRequest,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    db_timetable = db.get(Timetable, timetable_id)
+    if not db_timetable or db_timetable.college_id != current_user.college_id:
+        raise HTTPException(status_code=404, detail="Timetable not found")
+    if request.faculty_id is None and request.classroom_id is None:
+        raise HTTPException(status_code=400, detail="Either faculty_id or classroom_id is required")
+
+    days = request.days if request.days is not None else range(settings.TIMETABLE_DAYS)
+    periods = request.periods if request.periods is not None else range(settings.TIMETABLE_PERIODS_PER_DAY)
+    blocked = 0
+    for day in days:
+        for period in periods:
+            blocked |= 1 << (day * settings.TIMETABLE_PERIODS_PER_DAY + period)
+
+    problem = build_problem(db, [db_timetable], 0)
+    if request.faculty_id is not None:
+        problem.faculty_busy[request.faculty_id] = problem.faculty_busy.get(request.faculty_id, 0) | blocked
+    if request.classroom_id is not None:
+        problem.room_busy[request.classroom_id] = problem.room_busy.get(request.classroom_id, 0) | blocked
+
+    entries = list(get_entries(db, timetable_id))
+    current = [
+        Placement(e.subject_id, e.faculty_id, timetable_id, e.classroom_id, e.day, e.period)
+        for e in entries
+    ]
+    affected = [
+        i for i, e in enumerate(entries)
+        if blocked >> (e.day * settings.TIMETABLE_PERIODS_PER_DAY + e.period) & 1
+        and (e.faculty_id == request.faculty_id or e.classroom_id == request.classroom_id)
+    ]
+
+    result = repair_placements(
+        problem, current, affected,
+        seed=request.seed, time_limit=settings.REPAIR_TIME_LIMIT_SECONDS,
+    )
+    # Read before apply_moves() commits: the commit expires the entries, and
+    # reading them afterwards would reload each one with its own query
+    ids = [e.id for e in entries]
+    if result.moved:
+        apply_moves(db, db_timetable, entries, result.placements, result.moved)
+
+    moved = [result.placements[i] for i in result.moved]
+    return TimetableRepairResponse(
+        timetable_id=timetable_id,
+        affected=len(affected),
+        moved=len(result.moved),
+        unresolved=[ids[i] for i in result.unresolved],
+        entries=[
+            TimetableEntryRead(
+                id=ids[i], day=p.day, period=p.period,
+                subject_id=p.subject_id, faculty_id=p.faculty_id, classroom_id=p.classroom_id,
+            )
+            for i, p in zip(result.moved, moved)
+        ],
+        repair_time_ms=result.elapsed * 1000,
+    )
+
+
+@router.post("/{timetable_id}/pdf", response_model=PdfJobRead, status_code=202)
+def render_timetable_pdf(
+    timetable_id: int,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    db_timetable = db.get(Timetable, timetable_id)
+    if not db_timetable or db_timetable.college_id != current_user.college_id:
+        raise HTTPException(status_code=404, detail="Timetable not found")
+
+    key = pdf_cache_key(timetable_id, pdf_version(db, db_timetable))
+    status = pdf_job_status(key)
+    if status and status["status"] == "done":
+        # Unchanged since the last render: served straight from the cache
+        response.status_code = 200
+        return status
+    if status and status["status"] != "failed":
+        return status
+    return submit_render(key, timetable_id, pdf_payload(db, db_timetable))
+
+
+@router.get("/pdf-jobs/{job_id}", response_model=PdfJobRead)
+def get_pdf_job(job_id: str, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    # Job ids name the timetable; other colleges' jobs look the same as missing ones
+    timetable_id = pdf_job_timetable(job_id)
+    db_timetable = db.get(Timetable, timetable_id) if timetable_id is not None else None
+    if not db_timetable or db_timetable.college_id != current_user.college_id:
+        raise HTTPException(status_code=404, detail="PDF job not found")
+    status = pdf_job_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="PDF job not found")
+    return status
+
+
+@router.get("/{timetable_id}/pdf")
+def download_timetable_pdf(
+    timetable_id: int,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    db_timetable = db.get(Timetable, timetable_id)
+    if not db_timetable or db_timetable.college_id != current_user.college_id:
+        raise HTTPException(status_code=404, detail="Timetable not found")
+
+    path = pdf_cache_path(pdf_cache_key(timetable_id, pdf_version(db, db_timetable)))
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="PDF has not been rendered for the current version")
+    return FileResponse(path, media_type="application/pdf", filename=f"timetable-{timetable_id}.pdf")
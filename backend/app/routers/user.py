@@ -1,20 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, func, select
-from app.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import get_async_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserOut, UserUpdate, DeleteUserResponse
 from app.schemas.utils import DeleteResponse
 from app.crud.deps import get_current_user
+from app.crud.pagination import PageParams, fetch_page
+from app.crud.user import invalidate_principal
 
 router = APIRouter()
 
 @router.get("/", response_model=list[UserOut])
-def get_users(
-    session: Session = Depends(get_db),
+async def get_users(
+    response: Response,
+    session: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
     name: str | None = None,
+    page: PageParams = Depends(),
 ):
-    query = select(User)
+    query = select(User).where(User.college_id == current_user.college_id)
 
     if name:
         query = query.where(
@@ -22,50 +27,56 @@ def get_users(
             .like(f"{name.strip().lower()}%")
         )
 
-    users = session.exec(query).all()
-    return users
+    return await fetch_page(session, query, User.id, page, response)
 
 @router.get("/me", response_model=UserOut)
-def get_current_user_info(current_user=Depends(get_current_user)):
+async def get_current_user_info(current_user=Depends(get_current_user)):
     if not current_user:
         raise HTTPException(status_code=404, detail="User not found")
     return current_user
 
 @router.patch("/me", response_model=UserOut)
-def update_current_user(
+async def update_current_user(
     user: UserUpdate,
-    session: Session = Depends(get_db),
+    session: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    if not current_user:
+    # current_user is a cached snapshot, not a row in this session
+    db_user = await session.get(User, current_user.id)
+    if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
 
     user_data = user.model_dump(exclude_unset=True)
 
     for field, value in user_data.items():
-        setattr(current_user, field, value)
+        setattr(db_user, field, value)
 
-    session.add(current_user)
-    session.commit()
-    session.refresh(current_user)
+    session.add(db_user)
+    await session.commit()
+    await session.refresh(db_user)
+    invalidate_principal(current_user.email, db_user.email)
 
-    return current_user
+    return db_user
 
 @router.delete("/me", response_model=DeleteUserResponse)
-def delete_current_user(
-    session: Session = Depends(get_db),
+async def delete_current_user(
+    session: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    user_public = UserOut.model_validate(current_user)
+    db_user = await session.get(User, current_user.id)
+    if not db_user:
+        raise HTTPException(status_code=404, detail="User not found")
+    user_public = UserOut.model_validate(db_user)
 
     # 🔐 invalidate all tokens
-    current_user.token_version += 1
-    session.add(current_user)
-    session.commit()
+    db_user.token_version += 1
+    session.add(db_user)
+    await session.commit()
+    invalidate_principal(db_user.email)
 
     # delete user
-    session.delete(current_user)
-    session.commit()
+    await session.delete(db_user)
+    await session.commit()
 
     return DeleteUserResponse(
         message="User deleted successfully",
@@ -73,37 +84,40 @@ def delete_current_user(
     )
 
 @router.get("/{user_id}", response_model=UserOut)
-def get_user_by_id(user_id: int, session: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    db_user = session.get(User, user_id)
+async def get_user_by_id(user_id: int, session: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user)):
+    db_user = await session.get(User, user_id)
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
     return db_user
 
 @router.put("/{user_id}", response_model=UserOut)
-def update_user(user_id: int, user: UserUpdate, session: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    db_user = session.get(User, user_id)
+async def update_user(user_id: int, user: UserUpdate, session: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user)):
+    db_user = await session.get(User, user_id)
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    old_email = db_user.email
     user_data = user.model_dump(exclude_unset=True)
     for field, value in user_data.items():
         setattr(db_user, field, value)
 
     session.add(db_user)
-    session.commit()
-    session.refresh(db_user)
+    await session.commit()
+    await session.refresh(db_user)
+    invalidate_principal(old_email, db_user.email)
     return db_user
 
 @router.delete("/{user_id}", response_model=DeleteUserResponse)
-def delete_user(user_id: int, session: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    db_user = session.get(User, user_id)
+async def delete_user(user_id: int, session: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user)):
+    db_user = await session.get(User, user_id)
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
     
     user_public = UserOut.model_validate(db_user)
     
-    session.delete(db_user)
-    session.commit()
+    await session.delete(db_user)
+    await session.commit()
+    invalidate_principal(user_public.email)
     return DeleteUserResponse(message="User deleted successfully",
                               data=user_public
                            )
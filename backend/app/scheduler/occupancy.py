@@ -0,0 +1,155 @@
+import threading
+from typing import Iterable, Optional
+from app.scheduler.solver import iter_bits
+
+# One index per (college, term). A term is an academic year plus semester
+# parity: every timetable in it competes for the same faculty and rooms.
+
+
+class OccupancyIndex:
+    def __init__(self, days: int, periods: int):
+        self.days = days
+        self.periods = periods
+        self.full_mask = (1 << (days * periods)) - 1
+        self.faculty: dict[int, int] = {}
+        self.rooms: dict[int, int] = {}
+        # Per-timetable contributions, so one timetable can be swapped out
+        self._by_timetable: dict[int, tuple[dict[int, int], dict[int, int]]] = {}
+        self.stamp = None
+        self.lock = threading.RLock()
+
+    def slot(self, day: int, period: int) -> int:
+        return day * self.periods + period
+
+    def faculty_busy(self, faculty_id: int, day: int, period: int) -> bool:
+        return bool(self.faculty.get(faculty_id, 0) >> self.slot(day, period) & 1)
+
+    def room_busy(self, classroom_id: int, day: int, period: int) -> bool:
+        return bool(self.rooms.get(classroom_id, 0) >> self.slot(day, period) & 1)
+
+    def free_mask(
+        self,
+        faculty_id: Optional[int] = None,
+        classroom_id: Optional[int] = None,
+        exclude_timetable: Optional[int] = None,
+        timetable_id: Optional[int] = None,
+    ) -> int:
+        """Slots where neither the teacher nor the room is booked and, given
+        `timetable_id`, that timetable's own group has no lecture."""
+        if exclude_timetable is not None or timetable_id is not None:
+            with self.lock:
+                return self._free_mask(faculty_id, classroom_id, exclude_timetable, timetable_id)
+        return self._free_mask(faculty_id, classroom_id, None, None)
+
+    def _free_mask(self, faculty_id, classroom_id, exclude_timetable, timetable_id) -> int:
+        busy = 0
+        if faculty_id is not None:
+            busy |= self._mask(self.faculty, 0, faculty_id, exclude_timetable)
+        if classroom_id is not None:
+            busy |= self._mask(self.rooms, 1, classroom_id, exclude_timetable)
+        if timetable_id is not None:
+            # Every lecture of a timetable has a teacher, so its faculty masks cover them all
+            for mask in self._by_timetable.get(timetable_id, ({}, {}))[0].values():
+                busy |= mask
+        return self.full_mask & ~busy
+
+    def free_slots(
+        self,
+        faculty_id: Optional[int] = None,
+        classroom_id: Optional[int] = None,
+        exclude_timetable: Optional[int] = None,
+        timetable_id: Optional[int] = None,
+    ) -> list[tuple[int, int]]:
+        mask = self.free_mask(faculty_id, classroom_id, exclude_timetable, timetable_id)
+        return [divmod(slot, self.periods) for slot in iter_bits(mask)]
+
+    def busy_masks(self, exclude: Iterable[int] = ()) -> tuple[dict[int, int], dict[int, int]]:
+        """Faculty and room masks with the entries of the `exclude` timetables left out."""
+        exclude = set(exclude)
+        with self.lock:
+            if not exclude & self._by_timetable.keys():
+                return dict(self.faculty), dict(self.rooms)
+            faculty, rooms = {}, {}
+            for timetable_id, (t_faculty, t_rooms) in self._by_timetable.items():
+                if timetable_id in exclude:
+                    continue
+                for key, mask in t_faculty.items():
+                    faculty[key] = faculty.get(key, 0) | mask
+                for key, mask in t_rooms.items():
+                    rooms[key] = rooms.get(key, 0) | mask
+            return faculty, rooms
+
+    def _mask(self, merged: dict[int, int], side: int, key: int, exclude_timetable: Optional[int]) -> int:
+        if exclude_timetable is None or key not in self._by_timetable.get(exclude_timetable, ({}, {}))[side]:
+            return merged.get(key, 0)
+        mask = 0
+        for timetable_id, masks in self._by_timetable.items():
+            if timetable_id != exclude_timetable:
+                mask |= masks[side].get(key, 0)
+        return mask
+
+    def replace_timetable(self, timetable_id: int, entries: Iterable[tuple[int, int, int, int]]):
+        """Swap a timetable's (faculty_id, classroom_id, day, period) entries in place."""
+        faculty, rooms = {}, {}
+        for faculty_id, classroom_id, day, period in entries:
+            bit = 1 << self.slot(day, period)
+            faculty[faculty_id] = faculty.get(faculty_id, 0) | bit
+            rooms[classroom_id] = rooms.get(classroom_id, 0) | bit
+
+        with self.lock:
+            old_faculty, old_rooms = self._by_timetable.get(timetable_id, ({}, {}))
+            self._by_timetable[timetable_id] = (faculty, rooms)
+            self._rebuild_keys(self.faculty, 0, old_faculty.keys() | faculty.keys())
+            self._rebuild_keys(self.rooms, 1, old_rooms.keys() | rooms.keys())
+
+    def drop_timetable(self, timetable_id: int):
+        with self.lock:
+            old_faculty, old_rooms = self._by_timetable.pop(timetable_id, ({}, {}))
+            self._rebuild_keys(self.faculty, 0, old_faculty.keys())
+            self._rebuild_keys(self.rooms, 1, old_rooms.keys())
+
+    def _rebuild_keys(self, merged: dict[int, int], side: int, keys):
+        # Recomputed from the per-timetable masks rather than cleared bit by
+        # bit, so overlapping manual entries never erase each other
+        for key in keys:
+            mask = 0
+            for masks in self._by_timetable.values():
+                mask |= masks[side].get(key, 0)
+            if mask:
+                merged[key] = mask
+            else:
+                merged.pop(key, None)
+
+
+class OccupancyRegistry:
+    def __init__(self):
+        self._indexes: dict[int, dict[tuple, OccupancyIndex]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, college_id: int, term: tuple) -> Optional[OccupancyIndex]:
+        with self._lock:
+            return self._indexes.get(college_id, {}).get(term)
+
+    def put(self, college_id: int, term: tuple, index: OccupancyIndex):
+        with self._lock:
+            self._indexes.setdefault(college_id, {})[term] = index
+
+    def advance(self, college_id: int, term: tuple, index: OccupancyIndex, version: int):
+        """Mark indexes current after this worker committed `version` and applied it to `index`.
+
+        Indexes one bump behind missed only that write: the one of its term
+        took it in (if it is still the registered one), the others were not
+        touched by it. Any other stamp means another worker wrote meanwhile,
+        and the index is rebuilt on its next use.
+        """
+        with self._lock:
+            for key, other in self._indexes.get(college_id, {}).items():
+                if other.stamp == version - 1 and (key != term or other is index):
+                    other.stamp = version
+
+    def invalidate(self, college_id: int):
+        with self._lock:
+            self._indexes.pop(college_id, None)
+
+
+registry = OccupancyRegistry()
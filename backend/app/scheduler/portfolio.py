@@ -0,0 +1,95 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from itertools import cycle
+from time import perf_counter
+from typing import Optional
+from app.config import settings
+from app.scheduler.solver import STRATEGIES, Problem, Solution, solve
+
+# solve() reads a time limit of 0 as "no limit"; runs out of budget get this instead
+MIN_TIME_LIMIT = 0.001
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=settings.SOLVER_WORKERS)
+        return _executor
+
+
+def shutdown_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def portfolio_runs(size: int, seed: Optional[int] = None) -> list[tuple[str, int]]:
+    base = seed or 0
+    strategies = cycle(STRATEGIES)
+    return [(next(strategies), base + i) for i in range(size)]
+
+
+def _solve_until(problem: Problem, seed: int, deadline: float, strategy: str) -> Solution:
+    # Runs queued behind busy workers start late: they only get what is left
+    # of the portfolio's wall-clock deadline (time.time(), shared across processes)
+    return solve(problem, seed, max(deadline - time.time(), MIN_TIME_LIMIT), strategy)
+
+
+def solve_portfolio(
+    problem: Problem,
+    size: Optional[int] = None,
+    seed: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    target_penalty: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Solution:
+    """Run several strategy/seed combinations in parallel and keep the best solution.
+
+    Stops waiting as soon as a solution with no unplaced lessons and at most
+    `target_penalty` is found, or when `time_limit` runs out. Runs that have
+    not started yet are cancelled; running ones stop repairing at the same
+    deadline. If none answered in time, a greedy pass without repair is
+    returned, so the call overruns `time_limit` by at most that pass.
+    """
+    size = size or settings.SOLVER_PORTFOLIO_SIZE
+    time_limit = time_limit or settings.SOLVER_TIME_LIMIT_SECONDS
+    if target_penalty is None:
+        target_penalty = settings.SOLVER_TARGET_PENALTY
+    executor = executor or get_executor()
+
+    start = perf_counter()
+    deadline = time.time() + time_limit
+    pending = {
+        executor.submit(_solve_until, problem, run_seed, deadline, strategy)
+        for strategy, run_seed in portfolio_runs(size, seed)
+    }
+    best = None
+    try:
+        while pending:
+            remaining = time_limit - (perf_counter() - start)
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                solution = future.result()
+                if best is None or solution.score < best.score:
+                    best = solution
+            if best is not None and best.score <= (0, target_penalty):
+                break
+    finally:
+        for future in pending:
+            future.cancel()
+
+    if best is None:
+        # Deadline hit before any worker answered; fall back to a run with whatever budget is left
+        remaining = time_limit - (perf_counter() - start)
+        best = solve(problem, seed=seed, time_limit=max(remaining, MIN_TIME_LIMIT))
+    best.elapsed = perf_counter() - start
+    return best
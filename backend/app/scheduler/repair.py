@@ -0,0 +1,73 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional
+from app.scheduler.solver import Lesson, Placement, Problem, _State
+
+
+@dataclass
+class RepairResult:
+    # New (slot, classroom) per index of the input placements
+    placements: list[Placement]
+    moved: list[int]
+    unresolved: list[int]
+    elapsed: float
+
+
+def repair_placements(
+    problem: Problem,
+    current: list[Placement],
+    affected: list[int],
+    seed: Optional[int] = None,
+    time_limit: Optional[float] = None,
+) -> RepairResult:
+    """Re-place only the `affected` placements, keeping the rest of the grid fixed.
+
+    `problem.faculty_busy` / `problem.room_busy` must already include the
+    unavailable slots. Unaffected placements may still be shifted by the
+    bounded repair pass when they block an affected one; every change is
+    reported in `moved`.
+    """
+    start = time.perf_counter()
+    deadline = start + time_limit if time_limit else None
+    rng = random.Random(seed)
+
+    units = [Lesson(p.subject_id, p.faculty_id, p.group_id, 1) for p in current]
+    state = _State(problem, units)
+    affected_set = set(affected)
+    for i, p in enumerate(current):
+        if i not in affected_set:
+            state.place(i, p.day * problem.periods + p.period, p.classroom_id)
+
+    unresolved = []
+    for i in affected:
+        p = current[i]
+        slot = p.day * problem.periods + p.period
+        bit = 1 << slot
+        # Cheapest fix first: same slot, another room
+        if state.free_slots(units[i]) & bit:
+            room_id = state.free_room(units[i], slot)
+            if room_id is not None:
+                state.place(i, slot, room_id)
+                continue
+        if not state.try_place(i, rng) and not state.repair(i, rng, deadline):
+            unresolved.append(i)
+
+    placements, moved = [], []
+    for i, p in enumerate(current):
+        slot = state.slot_of[i]
+        if slot is None:
+            placements.append(p)
+            continue
+        day, period = divmod(slot, problem.periods)
+        new = Placement(p.subject_id, p.faculty_id, p.group_id, state.room_of[i], day, period)
+        if new != p:
+            moved.append(i)
+        placements.append(new)
+
+    return RepairResult(
+        placements=placements,
+        moved=moved,
+        unresolved=unresolved,
+        elapsed=time.perf_counter() - start,
+    )
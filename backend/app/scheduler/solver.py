@@ -0,0 +1,326 @@
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Weekly grids are stored as int bitmasks: bit (day * periods + period) is set
+# when the faculty / classroom / department is busy in that slot.
+
+SAME_DAY_PENALTY = 4
+MAX_REPAIR_ATTEMPTS = 200
+
+# Unit orderings the greedy pass can start from
+STRATEGIES = ("constrained", "groups", "random")
+
+
+@dataclass(frozen=True)
+class Lesson:
+    subject_id: int
+    faculty_id: int
+    group_id: int
+    count: int
+
+
+@dataclass
+class Problem:
+    days: int
+    periods: int
+    lessons: list[Lesson]
+    # Candidate classroom ids per group (department)
+    rooms: dict[int, list[int]]
+    # Slots already taken by other timetables running in the same term
+    faculty_busy: dict[int, int] = field(default_factory=dict)
+    room_busy: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def slots(self) -> int:
+        return self.days * self.periods
+
+    @property
+    def full_mask(self) -> int:
+        return (1 << self.slots) - 1
+
+
+@dataclass(frozen=True)
+class Placement:
+    subject_id: int
+    faculty_id: int
+    group_id: int
+    classroom_id: int
+    day: int
+    period: int
+
+
+@dataclass
+class Solution:
+    placements: list[Placement]
+    unplaced: list[Lesson]
+    penalty: int
+    elapsed: float
+    seed: Optional[int] = None
+    strategy: str = "constrained"
+
+    @property
+    def unplaced_count(self) -> int:
+        return sum(lesson.count for lesson in self.unplaced)
+
+    @property
+    def score(self) -> tuple[int, int]:
+        # Lower is better: hard violations first, then soft penalty
+        return (self.unplaced_count, self.penalty)
+
+
+def iter_bits(mask: int):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class _State:
+    def __init__(self, problem: Problem, units: list[Lesson]):
+        self.problem = problem
+        self.units = units
+        self.group = {}
+        self.faculty = dict(problem.faculty_busy)
+        self.room = dict(problem.room_busy)
+        self.subject_days = {}
+        self.slot_of = [None] * len(units)
+        self.room_of = [None] * len(units)
+        self.group_at = {}
+        self.faculty_at = {}
+        self.room_at = {}
+
+    def free_slots(self, unit: Lesson) -> int:
+        busy = self.group.get(unit.group_id, 0) | self.faculty.get(unit.faculty_id, 0)
+        return self.problem.full_mask & ~busy
+
+    def room_free_slots(self, unit: Lesson) -> int:
+        free = 0
+        full = self.problem.full_mask
+        for room_id in self.problem.rooms.get(unit.group_id, ()):
+            free |= full & ~self.room.get(room_id, 0)
+        return free
+
+    def free_room(self, unit: Lesson, slot: int) -> Optional[int]:
+        bit = 1 << slot
+        for room_id in self.problem.rooms.get(unit.group_id, ()):
+            if not self.room.get(room_id, 0) & bit:
+                return room_id
+        return None
+
+    def place(self, index: int, slot: int, room_id: int):
+        unit = self.units[index]
+        bit = 1 << slot
+        day = slot // self.problem.periods
+        self.group[unit.group_id] = self.group.get(unit.group_id, 0) | bit
+        self.faculty[unit.faculty_id] = self.faculty.get(unit.faculty_id, 0) | bit
+        self.room[room_id] = self.room.get(room_id, 0) | bit
+        key = (unit.group_id, unit.subject_id)
+        days = self.subject_days.setdefault(key, [0] * self.problem.days)
+        days[day] += 1
+        self.slot_of[index] = slot
+        self.room_of[index] = room_id
+        self.group_at[(unit.group_id, slot)] = index
+        self.faculty_at[(unit.faculty_id, slot)] = index
+        self.room_at[(room_id, slot)] = index
+
+    def unplace(self, index: int):
+        unit = self.units[index]
+        slot = self.slot_of[index]
+        room_id = self.room_of[index]
+        bit = 1 << slot
+        day = slot // self.problem.periods
+        self.group[unit.group_id] &= ~bit
+        self.faculty[unit.faculty_id] &= ~bit
+        self.room[room_id] &= ~bit
+        self.subject_days[(unit.group_id, unit.subject_id)][day] -= 1
+        self.slot_of[index] = None
+        self.room_of[index] = None
+        del self.group_at[(unit.group_id, slot)]
+        del self.faculty_at[(unit.faculty_id, slot)]
+        del self.room_at[(room_id, slot)]
+
+    def slot_cost(self, unit: Lesson, slot: int, rng: random.Random) -> float:
+        periods = self.problem.periods
+        day, period = divmod(slot, periods)
+        days = self.subject_days.get((unit.group_id, unit.subject_id))
+        cost = SAME_DAY_PENALTY * days[day] if days else 0
+        group_mask = self.group.get(unit.group_id, 0)
+        neighbours = 0
+        if period > 0:
+            neighbours |= group_mask & (1 << (slot - 1))
+        if period < periods - 1:
+            neighbours |= group_mask & (1 << (slot + 1))
+        if not neighbours:
+            cost += 1
+        return cost + period * 0.01 + rng.random() * 0.5
+
+    def best_slot(self, index: int, rng: random.Random, exclude: int = -1) -> Optional[int]:
+        unit = self.units[index]
+        candidates = self.free_slots(unit) & self.room_free_slots(unit)
+        if exclude >= 0:
+            candidates &= ~(1 << exclude)
+        best, best_cost = None, None
+        for slot in iter_bits(candidates):
+            cost = self.slot_cost(unit, slot, rng)
+            if best_cost is None or cost < best_cost:
+                best, best_cost = slot, cost
+        return best
+
+    def try_place(self, index: int, rng: random.Random, exclude: int = -1) -> bool:
+        slot = self.best_slot(index, rng, exclude)
+        if slot is None:
+            return False
+        self.place(index, slot, self.free_room(self.units[index], slot))
+        return True
+
+    def repair(self, index: int, rng: random.Random, deadline: Optional[float]) -> bool:
+        """Place a stuck unit by moving the lessons blocking one of its slots."""
+        unit = self.units[index]
+        problem = self.problem
+        fixed_faculty = problem.faculty_busy.get(unit.faculty_id, 0)
+        rooms = problem.rooms.get(unit.group_id, ())
+        if not rooms:
+            return False
+
+        slots = list(range(problem.slots))
+        rng.shuffle(slots)
+        for attempt, slot in enumerate(slots):
+            if attempt >= MAX_REPAIR_ATTEMPTS or (deadline and time.perf_counter() > deadline):
+                return False
+            bit = 1 << slot
+            if fixed_faculty & bit:
+                continue
+
+            blockers = set()
+            for key, table in (((unit.group_id, slot), self.group_at), ((unit.faculty_id, slot), self.faculty_at)):
+                if key in table:
+                    blockers.add(table[key])
+            if self.free_room(unit, slot) is None:
+                movable = [self.room_at[(r, slot)] for r in rooms if (r, slot) in self.room_at]
+                if not movable:
+                    continue
+                blockers.add(movable[0])
+            if not blockers:
+                continue
+
+            original = [(b, self.slot_of[b], self.room_of[b]) for b in blockers]
+            for blocker in blockers:
+                self.unplace(blocker)
+            room_id = self.free_room(unit, slot)
+            if room_id is None:
+                for blocker, b_slot, b_room in original:
+                    self.place(blocker, b_slot, b_room)
+                continue
+            self.place(index, slot, room_id)
+
+            moved = []
+            for blocker, _, _ in original:
+                if not self.try_place(blocker, rng, exclude=slot):
+                    break
+                moved.append(blocker)
+            if len(moved) == len(original):
+                return True
+
+            # Roll back this attempt
+            for blocker in moved:
+                self.unplace(blocker)
+            self.unplace(index)
+            for blocker, b_slot, b_room in original:
+                self.place(blocker, b_slot, b_room)
+        return False
+
+    def penalty(self) -> int:
+        total = 0
+        for days in self.subject_days.values():
+            total += sum(count - 1 for count in days if count > 1)
+        periods = self.problem.periods
+        day_mask = (1 << periods) - 1
+        for mask in self.group.values():
+            for day in range(self.problem.days):
+                row = (mask >> (day * periods)) & day_mask
+                if row:
+                    span = row.bit_length() - ((row & -row).bit_length() - 1)
+                    total += span - bin(row).count("1")
+        return total
+
+
+def expand_units(problem: Problem) -> list[Lesson]:
+    return [
+        Lesson(lesson.subject_id, lesson.faculty_id, lesson.group_id, 1)
+        for lesson in problem.lessons
+        for _ in range(lesson.count)
+    ]
+
+
+def solve(
+    problem: Problem,
+    seed: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    strategy: str = "constrained",
+) -> Solution:
+    """Greedy placement (most-constrained-first by default) followed by a bounded repair pass."""
+    start = time.perf_counter()
+    deadline = start + time_limit if time_limit else None
+    rng = random.Random(seed)
+
+    units = expand_units(problem)
+    faculty_load, group_load = {}, {}
+    for unit in units:
+        faculty_load[unit.faculty_id] = faculty_load.get(unit.faculty_id, 0) + 1
+        group_load[unit.group_id] = group_load.get(unit.group_id, 0) + 1
+
+    def difficulty(unit: Lesson):
+        fixed = problem.faculty_busy.get(unit.faculty_id, 0)
+        return (
+            -(faculty_load[unit.faculty_id] + bin(fixed).count("1")),
+            -group_load[unit.group_id],
+            len(problem.rooms.get(unit.group_id, ())),
+        )
+
+    def group_first(unit: Lesson):
+        return (-group_load[unit.group_id], unit.group_id, -faculty_load[unit.faculty_id])
+
+    rng.shuffle(units)
+    if strategy == "constrained":
+        units.sort(key=difficulty)
+    elif strategy == "groups":
+        units.sort(key=group_first)
+    elif strategy != "random":
+        raise ValueError(f"Unknown solver strategy: {strategy}")
+
+    state = _State(problem, units)
+    stuck = [i for i in range(len(units)) if not state.try_place(i, rng)]
+    unplaced_units = [i for i in stuck if not state.repair(i, rng, deadline)]
+
+    missing = {}
+    for i in unplaced_units:
+        unit = units[i]
+        key = (unit.subject_id, unit.faculty_id, unit.group_id)
+        missing[key] = missing.get(key, 0) + 1
+
+    placements = []
+    for i, unit in enumerate(units):
+        slot = state.slot_of[i]
+        if slot is None:
+            continue
+        day, period = divmod(slot, problem.periods)
+        placements.append(Placement(
+            subject_id=unit.subject_id,
+            faculty_id=unit.faculty_id,
+            group_id=unit.group_id,
+            classroom_id=state.room_of[i],
+            day=day,
+            period=period,
+        ))
+    placements.sort(key=lambda p: (p.group_id, p.day, p.period))
+
+    return Solution(
+        placements=placements,
+        unplaced=[Lesson(s, f, g, count) for (s, f, g), count in missing.items()],
+        penalty=state.penalty(),
+        elapsed=time.perf_counter() - start,
+        seed=seed,
+        strategy=strategy,
+    )
@@ -0,0 +1,36 @@
+from enum import Enum
+from typing import Any, Optional
+from sqlmodel import Field, SQLModel
+from app.config import settings
+
+
+class BatchEntity(str, Enum):
+    SUBJECT = "subject"
+    FACULTY = "faculty"
+    CLASSROOM = "classroom"
+    DEPARTMENT = "department"
+    TIMETABLE = "timetable"
+
+
+class BatchAction(str, Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class BatchOperation(SQLModel):
+    action: BatchAction
+    entity: BatchEntity
+    # Required for update and delete
+    id: Optional[int] = None
+    # Body of the equivalent create (POST) or update (PUT) call
+    data: dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchRequest(SQLModel):
+    operations: list[BatchOperation] = Field(min_length=1, max_length=settings.BATCH_MAX_OPERATIONS)
+
+
+class BatchResponse(SQLModel):
+    # One per operation, each the body the individual call would have returned
+    results: list[dict[str, Any]]
@@ -0,0 +1,14 @@
+from sqlmodel import SQLModel
+
+
+class ImportRowError(SQLModel):
+    # Line number in the uploaded file; the header is line 1
+    row: int
+    errors: list[str]
+
+
+class ImportReport(SQLModel):
+    created: int = 0
+    failed: int = 0
+    # At most IMPORT_MAX_ERRORS entries; `failed` counts them all
+    errors: list[ImportRowError] = []
@@ -0,0 +1,81 @@
+from sqlmodel import SQLModel
+from app.models.timetable import SemesterEnum
+
+
+class RoomUsageRead(SQLModel):
+    classroom_id: int
+    room_no: str
+    building_name: str
+    capacity: int
+    used_slots: int
+    utilization: float
+    # Seats left empty over the week: capacity x free slots
+    idle_seat_periods: int
+
+
+class BuildingUsageRead(SQLModel):
+    building_name: str
+    rooms: int
+    used_slots: int
+    utilization: float
+    seat_utilization: float
+    idle_seat_periods: int
+
+
+class PeakSlotRead(SQLModel):
+    day: int
+    period: int
+    rooms_in_use: int
+    utilization: float
+
+
+class RoomUtilizationReport(SQLModel):
+    academic_year: str
+    semester: SemesterEnum
+    rooms: int
+    slots_per_week: int
+    utilization: float
+    seat_utilization: float
+    idle_seat_periods: int
+    by_room: list[RoomUsageRead]
+    by_building: list[BuildingUsageRead]
+    # Share of rooms in use at each period of the day, averaged over the week
+    by_period: list[float]
+    peak_slots: list[PeakSlotRead]
+
+
+class FacultyLoadRead(SQLModel):
+    faculty_id: int
+    name: str
+    department_id: int
+    # Subjects assigned to the teacher, whether scheduled or not
+    subjects: int
+    weekly_hours: int
+    peak_daily_hours: int
+    # Most lectures back to back on one day
+    longest_streak: int
+    # Free periods between the first and last lecture of each day, summed
+    idle_gaps: int
+    # Extra lectures in slots where the teacher is double-booked
+    clashes: int
+
+
+class DepartmentLoadRead(SQLModel):
+    department_id: int
+    name: str
+    faculty: int
+    mean_hours: float
+    std_hours: float
+    min_hours: int
+    max_hours: int
+    # Coefficient of variation of weekly hours; 0 is perfectly even
+    imbalance: float
+
+
+class FacultyWorkloadReport(SQLModel):
+    academic_year: str
+    semester: SemesterEnum
+    faculty: int
+    total_hours: int
+    by_faculty: list[FacultyLoadRead]
+    by_department: list[DepartmentLoadRead]
@@ -0,0 +1,15 @@
+from enum import Enum
+from sqlmodel import SQLModel
+
+
+class SearchType(str, Enum):
+    SUBJECT = "subject"
+    FACULTY = "faculty"
+    DEPARTMENT = "department"
+    CLASSROOM = "classroom"
+
+
+class SearchHit(SQLModel):
+    type: SearchType
+    id: int
+    name: str
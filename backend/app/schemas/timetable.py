@@ -1,6 +1,8 @@
-from typing import Optional
-from sqlmodel import SQLModel
+from typing import Annotated, Optional
+from enum import Enum
+from sqlmodel import Field, SQLModel
 from datetime import datetime
+from app.config import settings
 from app.models.timetable import SemesterEnum
 from app.schemas.department import DepartmentRead
 from app.schemas.faculty import FacultyRead
@@ -43,3 +45,104 @@ class TimetableRead(SQLModel):
 class DeleteTimetableResponse(SQLModel):
     message: str
     data: TimetableRead | None = None
+
+
+class TimetableEntryRead(SQLModel):
+    id: int
+    day: int
+    period: int
+    subject_id: int
+    faculty_id: int
+    classroom_id: int
+
+    class Config:
+        from_attributes = True
+
+
+class TimetableEntryCreate(SQLModel):
+    subject_id: int
+    # Defaults to the subject's faculty
+    faculty_id: Optional[int] = None
+    classroom_id: int
+    day: int = Field(ge=0, lt=settings.TIMETABLE_DAYS)
+    period: int = Field(ge=0, lt=settings.TIMETABLE_PERIODS_PER_DAY)
+
+
+class SlotRead(SQLModel):
+    day: int
+    period: int
+
+
+class SolverMode(str, Enum):
+    SINGLE = "single"
+    PORTFOLIO = "portfolio"
+
+
+class TimetableGenerateRequest(SQLModel):
+    mode: SolverMode = SolverMode.SINGLE
+    lectures_per_subject: int = Field(default=3, ge=0)
+    # Per-subject override of lectures_per_subject, keyed by subject id
+    subject_lectures: dict[int, int] = {}
+    seed: Optional[int] = None
+
+
+class UnplacedLessonRead(SQLModel):
+    subject_id: int
+    faculty_id: int
+    missing: int
+
+
+class TimetableGenerateResponse(SQLModel):
+    timetable_id: int
+    entries: list[TimetableEntryRead]
+    unplaced: list[UnplacedLessonRead]
+    penalty: int
+    solve_time_ms: float
+    strategy: str
+    seed: Optional[int] = None
+
+
+class TermGenerateRequest(SQLModel):
+    academic_year: str
+    semester: SemesterEnum
+    lectures_per_subject: int = Field(default=3, ge=0)
+    subject_lectures: dict[int, int] = {}
+    seed: Optional[int] = None
+
+
+class TermTimetableSummary(SQLModel):
+    timetable_id: int
+    entries: int
+    unplaced: list[UnplacedLessonRead]
+
+
+class TermGenerateResponse(SQLModel):
+    timetables: list[TermTimetableSummary]
+    components: int
+    largest_component: int
+    penalty: int
+    solve_time_ms: float
+
+
+class TimetableRepairRequest(SQLModel):
+    faculty_id: Optional[int] = None
+    classroom_id: Optional[int] = None
+    # Unavailable days / periods; omitted means all of them
+    days: Optional[list[Annotated[int, Field(ge=0, lt=settings.TIMETABLE_DAYS)]]] = None
+    periods: Optional[list[Annotated[int, Field(ge=0, lt=settings.TIMETABLE_PERIODS_PER_DAY)]]] = None
+    seed: Optional[int] = None
+
+
+class TimetableRepairResponse(SQLModel):
+    timetable_id: int
+    affected: int
+    moved: int
+    unresolved: list[int]
+    entries: list[TimetableEntryRead]
+    repair_time_ms: float
+
+
+class PdfJobRead(SQLModel):
+    job_id: str
+    status: str
+    error: Optional[str] = None
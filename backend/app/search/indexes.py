@@ -0,0 +1,66 @@
+from sqlalchemy import DDL, Index, event, func
+from sqlmodel import SQLModel
+from app.models.classroom import Classroom
+from app.models.college import College
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.roles import Role
+from app.models.subject import Subject
+from app.models.user import User
+
+# Indexes for the name filters and /search/autocomplete. The indexed
+# expression has to be exactly the one the queries use, see search_key().
+
+
+def search_key(column):
+    return func.trim(func.lower(column))
+
+
+# Columns behind the `name` / `search_text` filters of the list endpoints:
+# B-tree on (college_id, key) with text_pattern_ops, so LIKE 'x%' can use it
+# whatever the database collation is
+PREFIX_COLUMNS = [
+    Subject.name,
+    Faculty.name,
+    Department.name,
+    Classroom.room_no,
+    Classroom.building_name,
+    User.username,
+    College.name,
+    Role.role_name,
+]
+
+# Columns searched by autocomplete, which also matches inside names
+TRIGRAM_COLUMNS = [
+    Subject.name,
+    Faculty.name,
+    Department.name,
+    Classroom.room_no,
+]
+
+for column in PREFIX_COLUMNS:
+    table = column.class_.__table__
+    label = f"{column.key}_key"
+    scope = [table.c.college_id] if "college_id" in table.c else []
+    Index(
+        f"ix_{table.name}_{column.key}_prefix",
+        *scope,
+        search_key(column).label(label),
+        postgresql_ops={label: "text_pattern_ops"},
+    )
+
+for column in TRIGRAM_COLUMNS:
+    table = column.class_.__table__
+    label = f"{column.key}_trgm"
+    Index(
+        f"ix_{table.name}_{column.key}_trgm",
+        search_key(column).label(label),
+        postgresql_using="gin",
+        postgresql_ops={label: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+
+event.listen(
+    SQLModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
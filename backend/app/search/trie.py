@@ -0,0 +1,194 @@
+import threading
+from bisect import insort
+from typing import Callable, Iterator, Optional
+
+# In-memory autocomplete for databases without trigram indexes. Names are
+# normalised like the SQL filters (trim + lower), so both paths return the
+# same matches in the same order.
+
+# Substring ("contains") matches need a query at least this long: pg_trgm
+# can't use its index for fewer characters, and neither can the gram
+# postings below. Shorter queries get prefix matches only, on both paths.
+CONTAINS_MIN_LENGTH = 3
+
+
+def normalize(text: str) -> str:
+    return text.strip().lower()
+
+
+def grams(key: str) -> set[str]:
+    return {key[i:i + CONTAINS_MIN_LENGTH] for i in range(len(key) - CONTAINS_MIN_LENGTH + 1)}
+
+
+class _Node:
+    __slots__ = ("children", "items")
+
+    def __init__(self):
+        self.children: dict[str, "_Node"] = {}
+        self.items: list[tuple] = []
+
+
+class Trie:
+    def __init__(self):
+        self.root = _Node()
+        self.size = 0
+
+    def insert(self, key: str, item: tuple):
+        node = self.root
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+        insort(node.items, item)
+        self.size += 1
+
+    def remove(self, key: str, item: tuple):
+        node = self.root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return
+        if item in node.items:
+            node.items.remove(item)
+            self.size -= 1
+
+    def _walk(self, node: _Node) -> Iterator[tuple]:
+        # Depth-first in character order yields keys in sorted order
+        yield from node.items
+        for char in sorted(node.children):
+            yield from self._walk(node.children[char])
+
+    def prefix(self, prefix: str, limit: int, keep: Callable[[tuple], bool] = lambda item: True) -> list[tuple]:
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        found = []
+        for item in self._walk(node):
+            if keep(item):
+                found.append(item)
+                if len(found) >= limit:
+                    break
+        return found
+
+
+class SearchIndex:
+    """Names of one college's searchable rows as (type, id, name) items."""
+
+    def __init__(self, rows: list[tuple[str, int, str]]):
+        self.trie = Trie()
+        self.rows: dict[tuple[str, int], tuple] = {}
+        # Trigram -> rows whose name contains it, so a contains lookup only
+        # looks at rows sharing the query's rarest trigram
+        self.postings: dict[str, set[tuple]] = {}
+        for row in rows:
+            self.add(row)
+
+    def add(self, row: tuple[str, int, str]):
+        self.remove(row[0], row[1])
+        key = normalize(row[2])
+        self.rows[row[:2]] = row
+        self.trie.insert(key, row)
+        for gram in grams(key):
+            self.postings.setdefault(gram, set()).add(row)
+
+    def remove(self, type_: str, id_: int):
+        row = self.rows.pop((type_, id_), None)
+        if row is None:
+            return
+        key = normalize(row[2])
+        self.trie.remove(key, row)
+        for gram in grams(key):
+            posting = self.postings.get(gram)
+            if posting is not None:
+                posting.discard(row)
+                if not posting:
+                    del self.postings[gram]
+
+    def contains(self, query: str, limit: int, keep: Callable[[tuple], bool]) -> list[tuple]:
+        """Rows whose name contains `query` past its start, in name order."""
+        postings = sorted((self.postings.get(gram, set()) for gram in grams(query)), key=len)
+        if not postings or not postings[0]:
+            return []
+        found = []
+        for row in postings[0].intersection(*postings[1:]):
+            key = normalize(row[2])
+            # Sharing every trigram doesn't make the query a substring
+            if query in key and not key.startswith(query) and keep(row):
+                found.append((key, row))
+        # (key, type, id) order matches the ORDER BY of the SQL path
+        found.sort()
+        return [row for _, row in found[:limit]]
+
+    def search(self, query: str, limit: int, types: Optional[set[str]] = None) -> list[tuple]:
+        """Prefix matches first, then names containing the query, each in name order."""
+        query = normalize(query)
+        wanted = (lambda row: row[0] in types) if types else (lambda row: True)
+        hits = self.trie.prefix(query, limit, wanted)
+        if len(hits) < limit and len(query) >= CONTAINS_MIN_LENGTH:
+            hits += self.contains(query, limit - len(hits), wanted)
+        return hits
+
+
+class SearchRegistry:
+    """Per-college indexes of this worker process.
+
+    Each index remembers the college_stats stamp (the sum of the searchable
+    collections' *_version columns) it reflects. Writes made through this
+    process patch the index and advance the stamp by the one bump they
+    made; a stamp that no longer matches the database means another worker
+    wrote, and the index is rebuilt.
+    """
+
+    def __init__(self):
+        self._indexes: dict[Optional[int], SearchIndex] = {}
+        self._stamps: dict[Optional[int], Optional[int]] = {}
+        self._generations: dict[Optional[int], int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, college_id: Optional[int], stamp: Optional[int] = None) -> Optional[SearchIndex]:
+        """The college's index, unless it was built from an older stamp than `stamp`."""
+        with self._lock:
+            index = self._indexes.get(college_id)
+            if index is not None and stamp is not None and self._stamps.get(college_id) != stamp:
+                return None
+            return index
+
+    def generation(self, college_id: Optional[int]) -> int:
+        with self._lock:
+            return self._generations.get(college_id, 0)
+
+    def put(self, college_id: Optional[int], index: SearchIndex, generation: int, stamp: Optional[int] = None):
+        with self._lock:
+            # A write landed while this index was being built; let the next request rebuild
+            if self._generations.get(college_id, 0) == generation:
+                self._indexes[college_id] = index
+                self._stamps[college_id] = stamp
+
+    def _written(self, college_id: Optional[int]) -> Optional[SearchIndex]:
+        # Called with the lock held, after a write that bumped one version column
+        self._generations[college_id] = self._generations.get(college_id, 0) + 1
+        if self._stamps.get(college_id) is not None:
+            self._stamps[college_id] += 1
+        return self._indexes.get(college_id)
+
+    def upsert(self, college_id: Optional[int], row: tuple[str, int, str]):
+        """Apply a single created or renamed row instead of rebuilding the index."""
+        with self._lock:
+            index = self._written(college_id)
+            if index is not None:
+                index.add(row)
+
+    def remove(self, college_id: Optional[int], type_: str, id_: int):
+        with self._lock:
+            index = self._written(college_id)
+            if index is not None:
+                index.remove(type_, id_)
+
+    def invalidate(self, college_id: Optional[int]):
+        with self._lock:
+            self._indexes.pop(college_id, None)
+            self._stamps.pop(college_id, None)
+            self._generations[college_id] = self._generations.get(college_id, 0) + 1
+
+
+registry = SearchRegistry()
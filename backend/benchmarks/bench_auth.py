@@ -0,0 +1,84 @@
+"""Per-request authentication overhead with and without the token/principal caches.
+
+Measures decode_access_token on its own, then GET /user/me end to end with
+both caches cleared before every request (the uncached path) and left warm.
+
+Run from backend/:  python -m benchmarks.bench_auth --requests 2000
+Uses a throwaway SQLite database unless DB_URL is set; whichever it is gets
+wiped first (see benchmarks/common.py).
+"""
+import argparse
+import json
+import time
+
+from benchmarks.common import use_database
+
+use_database("bench_auth.db")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from app.crud.jwt import create_access_token, decode_access_token, token_cache  # noqa: E402
+from app.crud.user import principal_cache  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from benchmarks.common import add_force_argument, register, reset_database  # noqa: E402
+
+
+def per_call_us(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def decode_overhead(calls: int) -> dict:
+    token = create_access_token({"sub": "bench@gmail.com", "token_version": 0})
+
+    def cold():
+        token_cache.clear()
+        decode_access_token(token)
+
+    return {
+        "uncached_us": round(per_call_us(cold, calls), 2),
+        "cached_us": round(per_call_us(lambda: decode_access_token(token), calls), 2),
+    }
+
+
+def request_overhead(client: TestClient, headers: dict, requests: int) -> dict:
+    def cold():
+        token_cache.clear()
+        principal_cache.clear()
+        client.get("/user/me", headers=headers).raise_for_status()
+
+    def warm():
+        client.get("/user/me", headers=headers).raise_for_status()
+
+    return {
+        "uncached_us": round(per_call_us(cold, requests), 1),
+        "cached_us": round(per_call_us(warm, requests), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--decode-calls", type=int, default=20000)
+    add_force_argument(parser)
+    args = parser.parse_args()
+
+    reset_database(engine, args.force)
+    with TestClient(app) as client:
+        headers = register(client)
+
+        decode = decode_overhead(args.decode_calls)
+        request = request_overhead(client, headers, args.requests)
+
+    print(json.dumps({
+        "benchmark": "auth",
+        "decode": decode,
+        "get_user_me": request,
+        "saved_per_request_us": round(request["uncached_us"] - request["cached_us"], 1),
+    }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Idle GET /events streams held by one worker, and fan-out latency.
+
+Starts uvicorn in a subprocess, opens `--streams` event streams from one
+asyncio client, reports the worker's resident memory before and after,
+then creates departments and times how long each event takes to reach
+every stream.
+
+Run from backend/:  python -m benchmarks.bench_events --streams 2000
+Uses a throwaway SQLite database unless DB_URL is set; whichever it is gets
+wiped first (see benchmarks/common.py).
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.common import use_database
+
+use_database("bench_events.db")
+
+import httpx  # noqa: E402
+from app.database import engine  # noqa: E402
+from benchmarks.common import add_force_argument, register, reset_database  # noqa: E402
+
+PORT = 8799
+
+
+def rss_kib(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def open_stream(token: str) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", PORT)
+    writer.write(
+        f"GET /events/?token={token} HTTP/1.1\r\nHost: bench\r\nAccept: text/event-stream\r\n\r\n".encode()
+    )
+    await writer.drain()
+    status = await reader.readline()
+    if b" 200 " not in status:
+        raise RuntimeError(status.decode().strip())
+    await reader.readuntil(b"retry: 5000")
+    return reader, writer
+
+
+async def next_event(reader: asyncio.StreamReader) -> float:
+    await reader.readuntil(b"event: department")
+    return time.perf_counter()
+
+
+async def run(args, pid: int, token: str, headers: dict) -> dict:
+    base = rss_kib(pid)
+    streams = []
+    start = time.perf_counter()
+    for i in range(0, args.streams, 200):
+        streams += await asyncio.gather(*(open_stream(token) for _ in range(min(200, args.streams - i))))
+    connect = time.perf_counter() - start
+    await asyncio.sleep(1)
+    held = rss_kib(pid)
+
+    latencies = []
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{PORT}") as client:
+        for i in range(args.events):
+            waiting = [asyncio.create_task(next_event(reader)) for reader, _ in streams]
+            sent = time.perf_counter()
+            response = await client.post(
+                "/department/", json={"name": f"Dept {i}", "year": 1},
+                headers=headers,
+            )
+            response.raise_for_status()
+            arrived = await asyncio.gather(*waiting)
+            latencies.append((max(arrived) - sent) * 1000)
+
+    for _, writer in streams:
+        writer.close()
+    return {
+        "benchmark": "event_streams",
+        "streams": args.streams,
+        "connect_s": round(connect, 3),
+        "worker_rss_mib_before": round(base / 1024, 1),
+        "worker_rss_mib_held": round(held / 1024, 1),
+        "kib_per_stream": round((held - base) / args.streams, 1),
+        "fan_out_ms_p50": round(statistics.median(latencies), 3),
+        "fan_out_ms_max": round(max(latencies), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=20)
+    add_force_argument(parser)
+    args = parser.parse_args()
+
+    reset_database(engine, args.force)
+    env = {**os.environ, "EVENTS_MAX_SUBSCRIBERS": str(args.streams + 100)}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(PORT),
+         "--log-level", "warning", "--timeout-graceful-shutdown", "1", "--backlog", "4096"],
+        env=env,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{PORT}") as client:
+            for _ in range(100):
+                try:
+                    client.get("/docs")
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.1)
+            headers = register(client)
+            college = client.post("/college/", json={"name": "Bench College"}, headers=headers).json()
+            client.patch("/user/me", json={"college_id": college["id"]}, headers=headers).raise_for_status()
+            # Streams take a short-lived events token in the URL, not the API token
+            token = client.post("/events/token", headers=headers).json()["token"]
+
+        print(json.dumps(asyncio.run(run(args, server.pid, token, headers))))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
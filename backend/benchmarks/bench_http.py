@@ -0,0 +1,285 @@
+"""HTTP load test: throughput and p50/p95/p99 latency per route.
+
+Seeds a synthetic college (benchmarks.campus) at `--scale` into a fresh
+database built through the migrations, starts uvicorn in a subprocess, and
+has `--clients` concurrent clients pick weighted requests from ROUTES
+for `--duration` seconds after a warm-up. Lists, detail pages, timetable
+entries, free slots, the dashboard and logins are read; departments and
+classrooms are created, updated and deleted.
+
+The report is JSON, written to `--output` as well as stdout. Pass the
+report of an earlier commit as `--baseline` to compare: routes whose p95
+grew by more than `--tolerance` are listed and the exit code is 1.
+
+Run from backend/:  python -m benchmarks.bench_http --scale 1 --clients 32 --duration 30
+Uses a throwaway SQLite database unless DB_URL is set; whichever it is gets
+wiped first (see benchmarks/common.py).
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import string
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from benchmarks.common import use_database
+
+use_database("bench_http.db")
+
+import httpx  # noqa: E402
+import numpy as np  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.models.classroom import Classroom  # noqa: E402
+from app.models.department import Department  # noqa: E402
+from app.models.faculty import Faculty  # noqa: E402
+from app.models.subject import Subject  # noqa: E402
+from app.models.timetable import Timetable  # noqa: E402
+from benchmarks.campus import seed_campus  # noqa: E402
+from benchmarks.common import add_force_argument, register_async, reset_database  # noqa: E402
+
+PORT = 8798
+PASSWORD = "bench-password"
+
+# (weight, method, route); {placeholders} are filled with random ids of the
+# seeded college. "cycle" routes are a create, update and delete in a row.
+ROUTES = [
+    (1, "POST", "/auth/login"),
+    (3, "GET", "/user/me"),
+    (2, "GET", "/college/{college_id}"),
+    (2, "GET", "/college/public"),
+    (5, "GET", "/department/"),
+    (4, "GET", "/department/{department_id}"),
+    (5, "GET", "/classroom/"),
+    (4, "GET", "/classroom/{classroom_id}"),
+    (5, "GET", "/faculty/"),
+    (4, "GET", "/faculty/{faculty_id}"),
+    (5, "GET", "/subject/"),
+    (4, "GET", "/subject/{subject_id}"),
+    (5, "GET", "/timetable/"),
+    (4, "GET", "/timetable/{timetable_id}"),
+    (5, "GET", "/timetable/{timetable_id}/entries"),
+    (2, "GET", "/timetable/{timetable_id}/free-slots?faculty_id={faculty_id}"),
+    (5, "GET", "/stats"),
+    (1, "cycle", "/department/"),
+    (1, "cycle", "/classroom/"),
+]
+
+
+def seed(scale: float) -> dict[str, list[int]]:
+    """Seed the college and return the ids requests are drawn from."""
+    campus = seed_campus(
+        engine,
+        rooms=max(int(500 * scale), 1),
+        timetables=max(int(300 * scale), 1),
+        faculties=max(int(600 * scale), 1),
+        name="Load Test College",
+    )
+    with Session(engine) as db:
+        def ids(model):
+            return db.exec(select(model.id).where(model.college_id == campus.college_id)).all()
+
+        return {
+            "college_id": [campus.college_id],
+            "department_id": ids(Department),
+            "classroom_id": ids(Classroom),
+            "faculty_id": ids(Faculty),
+            "subject_id": ids(Subject),
+            "timetable_id": ids(Timetable),
+        }
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.recording = False
+
+    async def request(self, client: httpx.AsyncClient, label: str, method: str, path: str, **kwargs) -> httpx.Response:
+        start = time.perf_counter()
+        response = await client.request(method, path, **kwargs)
+        if self.recording:
+            self.latencies[label].append(time.perf_counter() - start)
+            self.statuses[label][response.status_code] += 1
+        return response
+
+
+async def run_client(client, recorder: Recorder, pools: dict, headers: dict, rng: random.Random, stop: asyncio.Event, serial):
+    weights = [weight for weight, _, _ in ROUTES]
+    formatter = string.Formatter()
+    while not stop.is_set():
+        _, method, route = rng.choices(ROUTES, weights)[0]
+        if method == "cycle":
+            await cycle(client, recorder, route, pools, headers, rng, next(serial))
+            continue
+        path = route.format(**{
+            field: rng.choice(pools[field]) for _, field, _, _ in formatter.parse(route) if field
+        })
+        label = f"{method} {route}"
+        if route == "/auth/login":
+            await recorder.request(client, label, method, path, data={"username": "bench@gmail.com", "password": PASSWORD})
+        elif route == "/college/public":
+            await recorder.request(client, label, method, path)
+        else:
+            await recorder.request(client, label, method, path, headers=headers)
+
+
+async def cycle(client, recorder: Recorder, route: str, pools: dict, headers: dict, rng: random.Random, n: int):
+    if route == "/department/":
+        create = {"name": f"Load Dept {n}", "year": 1}
+        update = {"name": f"Load Dept {n} renamed"}
+    else:
+        create = {"building_name": "Load Block", "room_no": f"L{n}", "capacity": 40,
+                  "department_id": rng.choice(pools["department_id"])}
+        update = {"capacity": 60}
+    response = await recorder.request(client, f"POST {route}", "POST", route, json=create, headers=headers)
+    if response.status_code != 200:
+        return
+    path = f"{route}{response.json()['id']}"
+    await recorder.request(client, f"PUT {route}{{id}}", "PUT", path, json=update, headers=headers)
+    await recorder.request(client, f"DELETE {route}{{id}}", "DELETE", path, headers=headers)
+
+
+def summarize(recorder: Recorder, duration: float) -> dict:
+    routes = {}
+    for label in sorted(recorder.latencies):
+        latencies = np.array(recorder.latencies[label]) * 1000
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        statuses = recorder.statuses[label]
+        routes[label] = {
+            "requests": len(latencies),
+            "rps": round(len(latencies) / duration, 1),
+            "errors": sum(count for status, count in statuses.items() if status >= 400),
+            "statuses": {str(status): count for status, count in sorted(statuses.items())},
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "max_ms": round(float(latencies.max()), 2),
+        }
+    total = sum(route["requests"] for route in routes.values())
+    return {"requests": total, "rps": round(total / duration, 1), "routes": routes}
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[dict]:
+    regressions = []
+    for label, route in report["routes"].items():
+        before = baseline["routes"].get(label)
+        if before is None or before["p95_ms"] <= 0:
+            continue
+        ratio = route["p95_ms"] / before["p95_ms"]
+        if ratio > 1 + tolerance:
+            regressions.append({
+                "route": label, "p95_ms": route["p95_ms"],
+                "baseline_p95_ms": before["p95_ms"], "ratio": round(ratio, 2),
+            })
+    return regressions
+
+
+async def run(args, pools: dict) -> dict:
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{PORT}", limits=limits, timeout=60) as client:
+        headers = await register_async(client, password=PASSWORD, college_id=pools["college_id"][0])
+
+        recorder = Recorder()
+        stop = asyncio.Event()
+        serial = itertools.count()
+        clients = [
+            asyncio.create_task(run_client(
+                client, recorder, pools, headers, random.Random(args.seed + i), stop, serial
+            ))
+            for i in range(args.clients)
+        ]
+        await asyncio.sleep(args.warmup)
+        recorder.recording = True
+        start, cpu = time.perf_counter(), time.process_time()
+        await asyncio.sleep(args.duration)
+        recorder.recording = False
+        duration = time.perf_counter() - start
+        # Near 100% means the numbers measure this client, not the server
+        client_cpu = (time.process_time() - cpu) / duration
+        stop.set()
+        await asyncio.gather(*clients)
+    return {"client_cpu_pct": round(client_cpu * 100, 1), **summarize(recorder, duration)}
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0, help="1.0 = 500 rooms, 600 faculty, 300 timetables")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_http.json")
+    parser.add_argument("--baseline", help="report of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative p95 growth")
+    add_force_argument(parser)
+    args = parser.parse_args()
+
+    reset_database(engine, args.force)
+    seed_start = time.perf_counter()
+    pools = seed(args.scale)
+    seed_s = time.perf_counter() - seed_start
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(PORT), "--workers", str(args.workers),
+         "--log-level", "warning", "--no-access-log", "--timeout-graceful-shutdown", "1"],
+        env={**os.environ, "DB_MIGRATE_ON_STARTUP": "false"},
+        # TimingMiddleware logs every request at INFO; the load test doesn't need it
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{PORT}") as client:
+            for _ in range(100):
+                try:
+                    client.get("/college/public")
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.1)
+        result = asyncio.run(run(args, pools))
+    finally:
+        server.terminate()
+        server.wait()
+
+    report = {
+        "benchmark": "http_load",
+        "commit": git_commit(),
+        "database": engine.dialect.name,
+        "scale": args.scale,
+        "seeded": {name: len(ids) for name, ids in pools.items() if name != "college_id"},
+        "seed_s": round(seed_s, 2),
+        "clients": args.clients,
+        "workers": args.workers,
+        "duration_s": args.duration,
+        **result,
+    }
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        report["baseline_commit"] = baseline.get("commit")
+        report["regressions"] = compare(report, baseline, args.tolerance)
+        exit_code = 1 if report["regressions"] else 0
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(report))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""CSV import throughput against one POST per row.
+
+Imports --rows faculty and then --rows subjects through the CSV endpoints,
+and creates --baseline-rows of each through the regular POST endpoints.
+
+Run from backend/:  python -m benchmarks.bench_import --rows 50000
+Uses a throwaway SQLite database unless DB_URL is set (e.g. a local
+PostgreSQL, which the rows-per-second target refers to). Whichever it is
+gets wiped first (see benchmarks/common.py).
+"""
+import argparse
+import io
+import json
+import time
+
+from benchmarks.common import use_database
+
+use_database("bench_import.db")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from benchmarks.common import add_force_argument, register, reset_database  # noqa: E402
+
+
+def csv_upload(header: str, lines) -> dict:
+    body = io.StringIO()
+    body.write(header + "\n")
+    for line in lines:
+        body.write(line + "\n")
+    return {"file": ("bench.csv", body.getvalue().encode(), "text/csv")}
+
+
+def timed_import(client: TestClient, path: str, headers: dict, files: dict, rows: int) -> dict:
+    start = time.perf_counter()
+    response = client.post(path, files=files, headers=headers)
+    response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    report = response.json()
+    assert report["created"] == rows, report
+    return {"rows": rows, "seconds": round(elapsed, 3), "rows_per_s": round(rows / elapsed)}
+
+
+def timed_posts(client: TestClient, path: str, headers: dict, bodies: list[dict]) -> dict:
+    start = time.perf_counter()
+    for body in bodies:
+        client.post(path, json=body, headers=headers).raise_for_status()
+    elapsed = time.perf_counter() - start
+    return {"rows": len(bodies), "seconds": round(elapsed, 3), "rows_per_s": round(len(bodies) / elapsed)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--baseline-rows", type=int, default=500)
+    add_force_argument(parser)
+    args = parser.parse_args()
+
+    reset_database(engine, args.force)
+    with TestClient(app) as client:
+        headers = register(client)
+        college = client.post("/college/", json={"name": "Bench College"}, headers=headers).json()
+        client.patch("/user/me", json={"college_id": college["id"]}, headers=headers).raise_for_status()
+        department = client.post("/department/", json={"name": "D", "year": 1}, headers=headers).json()
+        department_id = department["id"]
+
+        faculty = timed_import(
+            client, "/faculty/import", headers,
+            csv_upload("name,department_id", (f"Faculty {i},{department_id}" for i in range(args.rows))),
+            args.rows,
+        )
+        faculty_id = client.get("/faculty/", params={"limit": 1}, headers=headers).json()[0]["id"]
+        subjects = timed_import(
+            client, "/subject/import", headers,
+            csv_upload(
+                "name,faculty_id,department_id",
+                (f"Subject {i},{faculty_id},{department_id}" for i in range(args.rows)),
+            ),
+            args.rows,
+        )
+
+        baseline = {
+            "faculty": timed_posts(client, "/faculty/", headers, [
+                {"name": f"Posted {i}", "department_id": department_id} for i in range(args.baseline_rows)
+            ]),
+            "subjects": timed_posts(client, "/subject/", headers, [
+                {"name": f"Posted {i}", "faculty_id": faculty_id, "department_id": department_id}
+                for i in range(args.baseline_rows)
+            ]),
+        }
+
+    print(json.dumps({
+        "benchmark": "csv_import",
+        "dialect": engine.dialect.name,
+        "import": {"faculty": faculty, "subjects": subjects},
+        "post_per_row": baseline,
+    }))
+
+
+if __name__ == "__main__":
+    main()
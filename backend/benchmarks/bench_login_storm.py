@@ -0,0 +1,147 @@
+"""Latency of a sync, non-auth endpoint while a burst of logins is in flight.
+
+Compares Argon2 verification in the request threadpool (how it used to run)
+with the dedicated hashing pool, probing GET /timetable/{id}/entries
+throughout the storm. Logins rejected by admission control are counted.
+
+Run from backend/:  python -m benchmarks.bench_login_storm --logins 200
+Uses a throwaway SQLite database unless DB_URL is set; whichever it is gets
+wiped first (see benchmarks/common.py).
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from benchmarks.common import use_database
+
+use_database("bench_login_storm.db")
+
+import httpx  # noqa: E402
+from fastapi.concurrency import run_in_threadpool  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+import app.routers.auth as auth_router  # noqa: E402
+from app.crud import passwords  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.college import College  # noqa: E402
+from app.models.department import Department  # noqa: E402
+from app.models.faculty import Faculty  # noqa: E402
+from app.models.timetable import Timetable  # noqa: E402
+from benchmarks.common import add_force_argument, register_async, reset_database  # noqa: E402
+
+
+async def verify_in_threadpool(plain_password, hashed_password):
+    return await run_in_threadpool(passwords.pwd_context.verify, plain_password, hashed_password)
+
+
+def seed() -> tuple[int, int]:
+    with Session(engine) as session:
+        college = College(name="Bench College")
+        session.add(college)
+        session.flush()
+        department = Department(name="D", year=1, college_id=college.id)
+        session.add(department)
+        session.flush()
+        faculty = Faculty(name="F", department_id=department.id, college_id=college.id)
+        session.add(faculty)
+        session.flush()
+        timetable = Timetable(
+            college_id=college.id, department_id=department.id,
+            class_coordinator_id=faculty.id, academic_year="2026", semester=1,
+        )
+        session.add(timetable)
+        session.commit()
+        return college.id, timetable.id
+
+
+def percentiles(latencies: list[float]) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000, 2),
+    }
+
+
+async def probe(client, path: str, headers: dict, stop: asyncio.Event, concurrency: int) -> list[float]:
+    latencies = []
+
+    async def worker():
+        while not stop.is_set():
+            start = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+async def storm(client, logins: int) -> dict:
+    async def login():
+        response = await client.post(
+            "/auth/login", data={"username": "bench@gmail.com", "password": "bench"}
+        )
+        return response.status_code
+
+    start = time.perf_counter()
+    codes = await asyncio.gather(*(login() for _ in range(logins)))
+    return {
+        "logins": logins,
+        "ok": codes.count(200),
+        "rejected": codes.count(503),
+        "storm_s": round(time.perf_counter() - start, 2),
+    }
+
+
+async def run_mode(client, path: str, headers: dict, logins: int, probes: int) -> dict:
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(client, path, headers, stop, probes))
+    result = await storm(client, logins)
+    stop.set()
+    return {**result, "probe": percentiles(await probe_task)}
+
+
+async def run(args):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        college_id, timetable_id = seed()
+        headers = await register_async(client, college_id=college_id)
+        path = f"/timetable/{timetable_id}/entries"
+
+        stop = asyncio.Event()
+        idle_task = asyncio.create_task(probe(client, path, headers, stop, args.probes))
+        await asyncio.sleep(args.idle_seconds)
+        stop.set()
+        idle = percentiles(await idle_task)
+
+        auth_router.verify_password = verify_in_threadpool
+        threadpool = await run_mode(client, path, headers, args.logins, args.probes)
+        auth_router.verify_password = passwords.verify_password
+        pool = await run_mode(client, path, headers, args.logins, args.probes)
+
+    passwords.shutdown_executor()
+    print(json.dumps({
+        "benchmark": "login_storm",
+        "idle": idle,
+        "threadpool_hashing": threadpool,
+        "hashing_pool": pool,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--probes", type=int, default=4, help="concurrent probe clients")
+    parser.add_argument("--idle-seconds", type=float, default=2.0)
+    add_force_argument(parser)
+    args = parser.parse_args()
+
+    reset_database(engine, args.force)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
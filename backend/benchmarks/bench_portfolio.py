@@ -0,0 +1,50 @@
+"""Wall time of portfolio solving as the process pool grows.
+
+Run from backend/:  python -m benchmarks.bench_portfolio --workers 1 2 4 8 16
+"""
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from app.scheduler.portfolio import solve_portfolio
+from benchmarks.synthetic import make_problem
+
+
+def run(problem, workers: int, size: int) -> dict:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Warm the pool so process start-up is not counted
+        list(executor.map(abs, range(workers)))
+        start = time.perf_counter()
+        # A negative target never matches, so every run is waited for
+        solution = solve_portfolio(
+            problem, size=size, seed=0, time_limit=600, target_penalty=-1, executor=executor
+        )
+        wall = time.perf_counter() - start
+    return {
+        "benchmark": "portfolio",
+        "workers": workers,
+        "runs": size,
+        "wall_s": round(wall, 4),
+        "best_unplaced": solution.unplaced_count,
+        "best_penalty": solution.penalty,
+        "best_strategy": solution.strategy,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--runs", type=int, default=16)
+    parser.add_argument("--departments", type=int, default=60)
+    args = parser.parse_args()
+    problem = make_problem(departments=args.departments)
+    baseline = None
+    for workers in args.workers:
+        result = run(problem, workers, args.runs)
+        baseline = baseline or result["wall_s"]
+        result["speedup"] = round(baseline / result["wall_s"], 2)
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
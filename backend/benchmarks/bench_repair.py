@@ -0,0 +1,54 @@
+"""Time to repair one department's grid after a faculty member takes a day off.
+
+Run from backend/:  python -m benchmarks.bench_repair --subjects 6 8 10
+"""
+import argparse
+import json
+from app.scheduler.repair import repair_placements
+from app.scheduler.solver import Problem, solve
+from benchmarks.synthetic import make_problem
+
+
+def run(subjects: int, seed: int) -> dict:
+    # One full department: every period of the week is taken
+    problem = make_problem(
+        departments=1,
+        subjects_per_department=subjects,
+        lectures_per_subject=(5 * 8) // subjects,
+        rooms_per_department=2,
+        seed=seed,
+    )
+    current = solve(problem, seed=seed).placements
+    faculty_id = current[0].faculty_id
+    day = current[0].day
+    blocked = ((1 << problem.periods) - 1) << (day * problem.periods)
+    leave = Problem(
+        days=problem.days,
+        periods=problem.periods,
+        lessons=[],
+        rooms=problem.rooms,
+        faculty_busy={faculty_id: blocked},
+    )
+    affected = [i for i, p in enumerate(current) if p.faculty_id == faculty_id and p.day == day]
+    result = repair_placements(leave, current, affected, seed=seed, time_limit=1.0)
+    return {
+        "benchmark": "repair",
+        "entries": len(current),
+        "affected": len(affected),
+        "moved": len(result.moved),
+        "unresolved": len(result.unresolved),
+        "repair_ms": round(result.elapsed * 1000, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subjects", type=int, nargs="+", default=[6, 8, 10])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for subjects in args.subjects:
+        print(json.dumps(run(subjects, args.seed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Solve time and peak memory of the timetable generator on synthetic colleges.
+
+Run from backend/:  python -m benchmarks.bench_solver --departments 10 30 60 120
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from app.scheduler.solver import solve
+from benchmarks.synthetic import make_problem
+
+
+def run(departments: int, repeat: int, seed: int) -> dict:
+    problem = make_problem(departments=departments, seed=seed)
+    timings, peak = [], 0
+    for i in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        solution = solve(problem, seed=seed + i)
+        timings.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return {
+        "benchmark": "solver",
+        "departments": departments,
+        "lessons": sum(l.count for l in problem.lessons),
+        "unplaced": solution.unplaced_count,
+        "penalty": solution.penalty,
+        "best_s": round(min(timings), 4),
+        "mean_s": round(sum(timings) / len(timings), 4),
+        "peak_mem_kb": peak // 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--departments", type=int, nargs="+", default=[10, 30, 60, 120])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for departments in args.departments:
+        print(json.dumps(run(departments, args.repeat, args.seed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Room-utilization report on a synthetic 500-room campus.
+
+Times loading the room x day x period grid, the vectorized metrics, the
+same metrics computed with Python loops over the entry rows, and
+GET /reports/rooms end to end.
+
+Run from backend/:  python -m benchmarks.bench_utilization --rooms 500
+Uses a throwaway SQLite database unless DB_URL is set; whichever it is gets
+wiped first (see benchmarks/common.py).
+"""
+import argparse
+import json
+
+from benchmarks.common import use_database
+
+use_database("bench_utilization.db")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.classroom import Classroom  # noqa: E402
+from app.models.timetable_entry import TimetableEntry  # noqa: E402
+from app.reports.utilization import load_room_grid, room_utilization  # noqa: E402
+from benchmarks.campus import seed_campus  # noqa: E402
+from benchmarks.common import add_force_argument, median_ms, register, reset_database  # noqa: E402
+
+
+def python_reference(rooms, entries, days: int, periods: int) -> dict:
+    """The headline metrics with plain loops, for comparison."""
+    slots = days * periods
+    used, in_use, by_building = {}, {}, {}
+    for classroom_id, day, period in entries:
+        used[classroom_id] = used.get(classroom_id, 0) + 1
+        in_use[(day, period)] = in_use.get((day, period), 0) + 1
+    idle = 0
+    for room_id, _, building, capacity in rooms:
+        free = slots - used.get(room_id, 0)
+        idle += capacity * free
+        stats = by_building.setdefault(building, [0, 0, 0])
+        stats[0] += 1
+        stats[1] += used.get(room_id, 0)
+        stats[2] += capacity * free
+    peaks = sorted(in_use.items(), key=lambda kv: (-kv[1], kv[0]))[:5]
+    return {"idle": idle, "buildings": by_building, "peaks": peaks}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rooms", type=int, default=500)
+    parser.add_argument("--buildings", type=int, default=20)
+    parser.add_argument("--timetables", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=20)
+    add_force_argument(parser)
+    args = parser.parse_args()
+
+    reset_database(engine, args.force)
+    campus = seed_campus(
+        engine, rooms=args.rooms, buildings=args.buildings,
+        timetables=args.timetables, faculties=2 * args.timetables,
+    )
+    days, periods = settings.TIMETABLE_DAYS, settings.TIMETABLE_PERIODS_PER_DAY
+
+    with Session(engine) as db:
+        load = median_ms(lambda: load_room_grid(db, campus.college_id, campus.academic_year, campus.semester), args.runs)
+        grid = load_room_grid(db, campus.college_id, campus.academic_year, campus.semester)
+        rooms = db.exec(
+            select(Classroom.id, Classroom.room_no, Classroom.building_name, Classroom.capacity)
+            .where(Classroom.college_id == campus.college_id)
+        ).all()
+        entries = db.exec(select(TimetableEntry.classroom_id, TimetableEntry.day, TimetableEntry.period)).all()
+
+    report = room_utilization(grid)
+    reference = python_reference(rooms, entries, days, periods)
+    assert report["idle_seat_periods"] == reference["idle"]
+    compute = median_ms(lambda: room_utilization(grid), args.runs)
+    loops = median_ms(lambda: python_reference(rooms, entries, days, periods), args.runs)
+
+    with TestClient(app) as client:
+        headers = register(client, college_id=campus.college_id)
+        params = {"academic_year": campus.academic_year, "semester": campus.semester}
+        client.get("/reports/rooms", params=params, headers=headers).raise_for_status()
+        endpoint = median_ms(
+            lambda: client.get("/reports/rooms", params=params, headers=headers).raise_for_status(), args.runs
+        )
+
+    print(json.dumps({
+        "benchmark": "room_utilization",
+        "dialect": engine.dialect.name,
+        "rooms": campus.rooms,
+        "entries": campus.entries,
+        "utilization": report["utilization"],
+        "load_grid_ms": load,
+        "vectorized_metrics_ms": compute,
+        "python_loops_ms": loops,
+        "endpoint_ms": endpoint,
+    }))
+
+
+if __name__ == "__main__":
+    main()
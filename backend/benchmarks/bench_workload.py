@@ -0,0 +1,113 @@
+"""Faculty-workload report on synthetic colleges of thousands of teachers.
+
+Seeds one college per `--faculty` size into the same database, then times
+loading the faculty x day x period matrix, the vectorized metrics, the same
+metrics computed with Python loops over the entry rows, and
+GET /reports/faculty-workload end to end.
+
+Run from backend/:  python -m benchmarks.bench_workload --faculty 1000 2000 5000
+Uses a throwaway SQLite database unless DB_URL is set; whichever it is gets
+wiped first (see benchmarks/common.py).
+"""
+import argparse
+import json
+
+from benchmarks.common import use_database
+
+use_database("bench_workload.db")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.timetable_entry import TimetableEntry  # noqa: E402
+from app.reports.workload import faculty_workload, load_matrix  # noqa: E402
+from benchmarks.campus import seed_campus  # noqa: E402
+from benchmarks.common import add_force_argument, median_ms, register, reset_database  # noqa: E402
+
+
+def python_reference(entries, days: int, periods: int) -> dict:
+    """Weekly hours, daily peak, longest streak and idle gaps per teacher with plain loops."""
+    slots = {}
+    for faculty_id, day, period in entries:
+        slots.setdefault(faculty_id, {}).setdefault(day, []).append(period)
+    result = {}
+    for faculty_id, week in slots.items():
+        weekly = peak = streak = gaps = 0
+        for day_periods in week.values():
+            weekly += len(day_periods)
+            peak = max(peak, len(day_periods))
+            taught = set(day_periods)
+            run = 0
+            for period in range(periods):
+                run = run + 1 if period in taught else 0
+                streak = max(streak, run)
+            gaps += max(taught) - min(taught) + 1 - len(taught)
+        result[faculty_id] = (weekly, peak, streak, gaps)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--faculty", type=int, nargs="+", default=[1000, 2000, 5000])
+    parser.add_argument("--runs", type=int, default=10)
+    add_force_argument(parser)
+    args = parser.parse_args()
+
+    reset_database(engine, args.force)
+    days, periods = settings.TIMETABLE_DAYS, settings.TIMETABLE_PERIODS_PER_DAY
+
+    # Half as many class timetables (and rooms) as teachers keeps everyone teaching
+    campuses = [
+        seed_campus(
+            engine, rooms=size // 2, buildings=20, timetables=size // 2,
+            faculties=size, seed=i, name=f"Synthetic Campus {size}",
+        )
+        for i, size in enumerate(args.faculty)
+    ]
+
+    with TestClient(app) as client:
+        for campus in campuses:
+            with Session(engine) as db:
+                load = median_ms(
+                    lambda: load_matrix(db, campus.college_id, campus.academic_year, campus.semester), args.runs
+                )
+                matrix = load_matrix(db, campus.college_id, campus.academic_year, campus.semester)
+                entries = db.exec(
+                    select(TimetableEntry.faculty_id, TimetableEntry.day, TimetableEntry.period)
+                    .where(TimetableEntry.college_id == campus.college_id)
+                ).all()
+
+            report = faculty_workload(matrix)
+            reference = python_reference(entries, days, periods)
+            for row in report["by_faculty"]:
+                expected = reference.get(row["faculty_id"], (0, 0, 0, 0))
+                got = (row["weekly_hours"], row["peak_daily_hours"], row["longest_streak"], row["idle_gaps"])
+                assert got == expected, (row["faculty_id"], got, expected)
+            compute = median_ms(lambda: faculty_workload(matrix), args.runs)
+            loops = median_ms(lambda: python_reference(entries, days, periods), args.runs)
+
+            headers = register(client, f"bench{campus.college_id}@gmail.com", college_id=campus.college_id)
+            params = {"academic_year": campus.academic_year, "semester": campus.semester}
+            client.get("/reports/faculty-workload", params=params, headers=headers).raise_for_status()
+            endpoint = median_ms(
+                lambda: client.get("/reports/faculty-workload", params=params, headers=headers).raise_for_status(),
+                args.runs,
+            )
+
+            print(json.dumps({
+                "benchmark": "faculty_workload",
+                "dialect": engine.dialect.name,
+                "faculty": campus.faculties,
+                "departments": len(report["by_department"]),
+                "entries": campus.entries,
+                "load_matrix_ms": load,
+                "vectorized_metrics_ms": compute,
+                "python_loops_ms": loops,
+                "endpoint_ms": endpoint,
+            }))
+
+
+if __name__ == "__main__":
+    main()
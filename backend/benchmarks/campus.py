@@ -0,0 +1,131 @@
+"""Synthetic college for the report benchmarks.
+
+Every timetable of the term is filled for `periods_used` periods a day.
+Rooms are dealt out per slot so that no room or teacher is double-booked.
+"""
+from dataclasses import dataclass
+import numpy as np
+from sqlalchemy import insert
+from sqlmodel import Session, select
+from app.config import settings
+from app.models.classroom import Classroom
+from app.models.college import College
+from app.models.college_stats import CollegeStats
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.subject import Subject
+from app.models.timetable import Timetable
+from app.models.timetable_entry import TimetableEntry
+
+
+@dataclass
+class Campus:
+    college_id: int
+    academic_year: str
+    semester: int
+    rooms: int
+    faculties: int
+    timetables: int
+    entries: int
+
+
+def seed_campus(
+    engine,
+    rooms: int = 500,
+    buildings: int = 20,
+    timetables: int = 300,
+    faculties: int = 600,
+    periods_used: int = 6,
+    seed: int = 0,
+    name: str = "Synthetic Campus",
+) -> Campus:
+    rng = np.random.default_rng(seed)
+    days, periods = settings.TIMETABLE_DAYS, settings.TIMETABLE_PERIODS_PER_DAY
+    periods_used = min(periods_used, periods)
+    if timetables > rooms or timetables > faculties:
+        raise ValueError("every timetable needs its own room and teacher in each slot")
+
+    with Session(engine) as db:
+        college = College(name=name)
+        db.add(college)
+        db.flush()
+        college_id = college.id
+        department_ids = []
+        for i in range(timetables):
+            department = Department(name=f"Dept {i}", year=1, college_id=college_id)
+            db.add(department)
+            db.flush()
+            department_ids.append(department.id)
+
+        db.exec(insert(Classroom), params=[
+            {
+                "building_name": f"Block {i % buildings}",
+                "room_no": f"R{i}",
+                "capacity": int(rng.integers(20, 121)),
+                "department_id": department_ids[i % timetables],
+                "college_id": college_id,
+            }
+            for i in range(rooms)
+        ])
+        db.exec(insert(Faculty), params=[
+            {"name": f"Teacher {i}", "department_id": department_ids[i % timetables], "college_id": college_id}
+            for i in range(faculties)
+        ])
+        room_ids = np.array(db.exec(select(Classroom.id).where(Classroom.college_id == college_id).order_by(Classroom.id)).all())
+        faculty_ids = np.array(db.exec(select(Faculty.id).where(Faculty.college_id == college_id).order_by(Faculty.id)).all())
+
+        db.exec(insert(Timetable), params=[
+            {
+                "college_id": college_id, "department_id": department_ids[i],
+                "class_coordinator_id": int(faculty_ids[i % faculties]),
+                "academic_year": "2026", "semester": 1,
+            }
+            for i in range(timetables)
+        ])
+        timetable_ids = db.exec(
+            select(Timetable.id).where(Timetable.college_id == college_id).order_by(Timetable.id)
+        ).all()
+
+        rows, subjects = [], {}
+        for day in range(days):
+            for period in range(periods_used):
+                room_deal = rng.permutation(room_ids)[:timetables]
+                teacher_deal = rng.permutation(faculty_ids)[:timetables]
+                for t, timetable_id in enumerate(timetable_ids):
+                    rows.append((timetable_id, int(teacher_deal[t]), int(room_deal[t]), day, period))
+                    subjects.setdefault((department_ids[t], int(teacher_deal[t])), None)
+
+        # One subject per (department, teacher) pairing dealt above
+        db.exec(insert(Subject), params=[
+            {"name": f"Course {i}", "faculty_id": f, "department_id": d, "college_id": college_id}
+            for i, (d, f) in enumerate(subjects)
+        ])
+        subject_of = {
+            (d, f): s for s, f, d in db.exec(
+                select(Subject.id, Subject.faculty_id, Subject.department_id).where(Subject.college_id == college_id)
+            ).all()
+        }
+        department_of = dict(zip(timetable_ids, department_ids))
+        db.exec(
+            insert(TimetableEntry),
+            params=[
+                {
+                    "timetable_id": timetable_id, "college_id": college_id,
+                    "subject_id": subject_of[(department_of[timetable_id], faculty_id)],
+                    "faculty_id": faculty_id, "classroom_id": classroom_id,
+                    "day": day, "period": period,
+                }
+                for timetable_id, faculty_id, classroom_id, day, period in rows
+            ],
+            execution_options={"insertmanyvalues_page_size": settings.BULK_INSERT_BATCH_SIZE},
+        )
+        db.add(CollegeStats(
+            college_id=college_id, subjects=len(subjects), faculties=faculties,
+            classrooms=rooms, departments=timetables,
+        ))
+        db.commit()
+
+    return Campus(
+        college_id=college_id, academic_year="2026", semester=1, rooms=rooms,
+        faculties=faculties, timetables=timetables, entries=len(rows),
+    )
@@ -0,0 +1,15 @@
+"""Fails when a list endpoint's SQL statement count grows with the number of rows.
+
+Run from backend/:  python -m benchmarks.check_n_plus_one
+Same as `pytest tests/test_n_plus_one.py`, on a throwaway SQLite database
+unless TEST_DB_URL is set.
+"""
+import os
+import sys
+
+import pytest
+
+TESTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", os.path.join(TESTS, "test_n_plus_one.py"), *sys.argv[1:]]))
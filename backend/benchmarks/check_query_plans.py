@@ -0,0 +1,15 @@
+"""Fails when a tenant-scoped query stops using the index migration 0005 built for it.
+
+Run from backend/:  python -m benchmarks.check_query_plans
+Same as `pytest tests/test_query_plans.py`, on a throwaway SQLite database
+unless TEST_DB_URL is set.
+"""
+import os
+import sys
+
+import pytest
+
+TESTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", os.path.join(TESTS, "test_query_plans.py"), *sys.argv[1:]]))
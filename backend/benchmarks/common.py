@@ -0,0 +1,76 @@
+"""Setup shared by the benchmarks that use a database.
+
+Call use_database() before importing anything from app: app.database
+builds its engines from DB_URL at import time.
+
+Benchmarks drop and rebuild the schema of the database they run against,
+so reset_database() only wipes one whose name says it is for benchmarks
+(contains "bench", like the default bench_*.db files) unless --force is
+passed.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+BENCH_MARKER = "bench"
+
+
+def use_database(filename: str):
+    """Default DB_URL to a throwaway SQLite file in the working directory."""
+    os.environ.setdefault("DB_URL", f"sqlite:///{filename}")
+    os.environ.setdefault("SQL_ECHO", "false")
+
+
+def add_force_argument(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--force", action="store_true",
+        help=f"wipe the target database even if its name does not contain {BENCH_MARKER!r}",
+    )
+
+
+def reset_database(engine, force: bool = False):
+    """Drop every table and rebuild the schema through the migrations."""
+    url = engine.url
+    if not force and BENCH_MARKER not in os.path.basename(url.database or ""):
+        sys.exit(
+            f"Refusing to wipe {url.render_as_string(hide_password=True)}: its database name "
+            f"does not contain {BENCH_MARKER!r}. Pass --force to wipe it anyway."
+        )
+    import app.main  # noqa: F401  (every table in the metadata drop_all works from)
+    from app.database import rebuild_schema
+    rebuild_schema(engine)
+
+
+def _registration(email: str, password: str, college_id: int | None) -> tuple[dict, dict]:
+    account = {
+        "username": email.split("@")[0], "email": email, "phone_number": None,
+        "password": password, "college_id": college_id,
+    }
+    return account, {"username": email, "password": password}
+
+
+def register(client, email: str = "bench@gmail.com", password: str = "bench", college_id: int | None = None) -> dict:
+    """Register and log in through a TestClient or httpx.Client; returns the auth headers."""
+    account, credentials = _registration(email, password, college_id)
+    client.post("/auth/register", json=account).raise_for_status()
+    token = client.post("/auth/login", data=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def register_async(client, email: str = "bench@gmail.com", password: str = "bench", college_id: int | None = None) -> dict:
+    """register() for an httpx.AsyncClient."""
+    account, credentials = _registration(email, password, college_id)
+    (await client.post("/auth/register", json=account)).raise_for_status()
+    token = (await client.post("/auth/login", data=credentials)).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def median_ms(fn, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return round(statistics.median(times) * 1000, 3)
@@ -0,0 +1,35 @@
+"""Synthetic college inputs shared by the benchmark scripts."""
+import random
+from app.scheduler.solver import Lesson, Problem
+
+
+def make_problem(
+    departments: int = 60,
+    subjects_per_department: int = 6,
+    lectures_per_subject: int = 3,
+    subjects_per_faculty: int = 2,
+    cross_department_ratio: float = 0.2,
+    rooms_per_department: int = 2,
+    days: int = 5,
+    periods: int = 8,
+    seed: int = 0,
+) -> Problem:
+    rng = random.Random(seed)
+    faculty_per_department = max(1, subjects_per_department // subjects_per_faculty)
+    lessons, rooms = [], {}
+    next_room = 1
+    for dept in range(1, departments + 1):
+        rooms[dept] = list(range(next_room, next_room + rooms_per_department))
+        next_room += rooms_per_department
+        for s in range(subjects_per_department):
+            owner = dept
+            if departments > 1 and rng.random() < cross_department_ratio:
+                owner = rng.randint(1, departments)
+            faculty_id = owner * 1000 + (s % faculty_per_department)
+            lessons.append(Lesson(
+                subject_id=dept * 1000 + s,
+                faculty_id=faculty_id,
+                group_id=dept,
+                count=lectures_per_subject,
+            ))
+    return Problem(days=days, periods=periods, lessons=lessons, rooms=rooms)
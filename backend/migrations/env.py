@@ -0,0 +1,93 @@
+import logging
+import time
+from logging.config import fileConfig
+from alembic import context
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect
+from sqlmodel import SQLModel
+from app.config import settings
+import app.models.classroom  # noqa: F401  (every table, for --autogenerate)
+import app.models.college  # noqa: F401
+import app.models.college_stats  # noqa: F401
+import app.models.department  # noqa: F401
+import app.models.faculty  # noqa: F401
+import app.models.roles  # noqa: F401
+import app.models.subject  # noqa: F401
+import app.models.timetable  # noqa: F401
+import app.models.timetable_entry  # noqa: F401
+import app.models.user  # noqa: F401
+import app.search.indexes  # noqa: F401
+
+config = context.config
+target_metadata = SQLModel.metadata
+
+# Concurrent `upgrade`s (one per worker at startup) queue up on this lock
+MIGRATION_LOCK = 7_424_001
+LOCK_POLL_SECONDS = 0.5
+
+
+def run_migrations_offline():
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def lock(connection):
+    # Polled rather than blocking in pg_advisory_lock(): a waiting statement
+    # holds a snapshot, which an index built CONCURRENTLY by the lock holder
+    # would wait on in turn
+    while not connection.exec_driver_sql(f"SELECT pg_try_advisory_lock({MIGRATION_LOCK})").scalar():
+        connection.commit()
+        time.sleep(LOCK_POLL_SECONDS)
+    # Session-level, so it outlives the commits of autocommit_block()
+    connection.commit()
+
+
+def stamp_legacy(connection, baseline: str):
+    """Stamp a schema built by the create_all() that migrations replaced: tables, no alembic_version."""
+    inspector = inspect(connection)
+    if inspector.has_table("alembic_version") or not inspector.has_table("college"):
+        return
+    logging.getLogger("alembic.env").warning("Stamping a create_all() schema as migration %s", baseline)
+    context.get_context().stamp(ScriptDirectory.from_config(config), baseline)
+
+
+def run_migrations(connection):
+    postgresql = connection.dialect.name == "postgresql"
+    if postgresql:
+        lock(connection)
+    try:
+        context.configure(connection=connection, target_metadata=target_metadata, render_as_batch=True)
+        with context.begin_transaction():
+            # Under the lock, so two workers can't both find the schema unstamped
+            baseline = config.attributes.get("baseline")
+            if baseline:
+                stamp_legacy(connection, baseline)
+            context.run_migrations()
+    finally:
+        if postgresql:
+            connection.rollback()
+            connection.exec_driver_sql(f"SELECT pg_advisory_unlock({MIGRATION_LOCK})")
+            connection.commit()
+
+
+def run_migrations_online():
+    # app.database.migrate() lends the app's connection; the CLI opens its own
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations(connection)
+        return
+    fileConfig(config.config_file_name)
+    with create_engine(settings.DATABASE_URL).connect() as connection:
+        run_migrations(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
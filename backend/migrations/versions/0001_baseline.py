@@ -0,0 +1,127 @@
+"""baseline: the original schema, as create_all() built it at startup
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+Databases created by create_all() are stamped with this revision on first
+start instead of being created again (see app.database.migrate). Tables
+and indexes that create_all() went on to build as models were added come
+in 0002-0004, which skip whatever such a database already has.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('college',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('address', sa.String(), nullable=True),
+    sa.Column('contact', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_college_name', 'college', ['name'], unique=True)
+
+    op.create_table('roles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('role_name', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_roles_role_name', 'roles', ['role_name'], unique=True)
+
+    op.create_table('department',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('college_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['college_id'], ['college.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('username', sa.String(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('phone_number', sa.String(), nullable=True),
+    sa.Column('hashed_password', sa.String(), nullable=False),
+    sa.Column('token_version', sa.Integer(), nullable=False),
+    sa.Column('role_id', sa.Integer(), nullable=True),
+    sa.Column('college_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['college_id'], ['college.id'], ),
+    sa.ForeignKeyConstraint(['role_id'], ['roles.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_index('ix_users_phone_number', 'users', ['phone_number'], unique=False)
+    op.create_index('ix_users_username', 'users', ['username'], unique=True)
+
+    op.create_table('classroom',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('building_name', sa.String(), nullable=False),
+    sa.Column('room_no', sa.String(), nullable=False),
+    sa.Column('capacity', sa.Integer(), nullable=False),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.Column('college_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['college_id'], ['college.id'], ),
+    sa.ForeignKeyConstraint(['department_id'], ['department.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('faculty',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.Column('college_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['college_id'], ['college.id'], ),
+    sa.ForeignKeyConstraint(['department_id'], ['department.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('subject',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('faculty_id', sa.Integer(), nullable=False),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.Column('college_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['college_id'], ['college.id'], ),
+    sa.ForeignKeyConstraint(['department_id'], ['department.id'], ),
+    sa.ForeignKeyConstraint(['faculty_id'], ['faculty.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('timetable',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('college_id', sa.Integer(), nullable=True),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.Column('class_coordinator_id', sa.Integer(), nullable=False),
+    sa.Column('academic_year', sa.String(), nullable=False),
+    sa.Column('semester', sa.Enum('SEMESTER_1', 'SEMESTER_2', 'SEMESTER_3', 'SEMESTER_4', 'SEMESTER_5', 'SEMESTER_6', 'SEMESTER_7', 'SEMESTER_8', name='semesterenum'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['class_coordinator_id'], ['faculty.id'], ),
+    sa.ForeignKeyConstraint(['college_id'], ['college.id'], ),
+    sa.ForeignKeyConstraint(['department_id'], ['department.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('department_id', 'academic_year', 'semester', name='uq_department_academic_year_semester')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('timetable')
+    op.drop_table('subject')
+    op.drop_table('faculty')
+    op.drop_table('classroom')
+    op.drop_table('users')
+    op.drop_table('department')
+    op.drop_table('roles')
+    op.drop_table('college')
+    if op.get_bind().dialect.name == 'postgresql':
+        sa.Enum(name='semesterenum').drop(op.get_bind(), checkfirst=True)
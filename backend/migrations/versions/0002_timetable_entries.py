@@ -0,0 +1,48 @@
+"""timetable entries: the slots of a timetable, filled by the generator
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+create_all() built this table once the model existed, so a stamped
+database may have it already; it is left as it is.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('timetable_entry',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('timetable_id', sa.Integer(), nullable=False),
+    sa.Column('college_id', sa.Integer(), nullable=True),
+    sa.Column('subject_id', sa.Integer(), nullable=False),
+    sa.Column('faculty_id', sa.Integer(), nullable=False),
+    sa.Column('classroom_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Integer(), nullable=False),
+    sa.Column('period', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['classroom_id'], ['classroom.id'], ),
+    sa.ForeignKeyConstraint(['college_id'], ['college.id'], ),
+    sa.ForeignKeyConstraint(['faculty_id'], ['faculty.id'], ),
+    sa.ForeignKeyConstraint(['subject_id'], ['subject.id'], ),
+    sa.ForeignKeyConstraint(['timetable_id'], ['timetable.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('timetable_id', 'day', 'period', name='uq_timetable_entry_slot'),
+    if_not_exists=True,
+    )
+    op.create_index('ix_timetable_entry_timetable_id', 'timetable_entry', ['timetable_id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('timetable_entry')
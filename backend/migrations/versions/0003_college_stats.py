@@ -0,0 +1,51 @@
+"""college stats: per-college row counts and collection versions
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+create_all() built this table once the model existed, but never added
+the *_version columns that came later; a stamped database gets whichever
+of them it lacks. Rows are created lazily by the dashboard, so the table
+starts empty.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSION_COLUMNS = ['subjects_version', 'faculties_version', 'classrooms_version', 'departments_version']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('college_stats'):
+        existing = {column['name'] for column in inspector.get_columns('college_stats')}
+        for name in VERSION_COLUMNS:
+            if name not in existing:
+                op.add_column('college_stats', sa.Column(name, sa.Integer(), nullable=False, server_default='0'))
+        return
+
+    op.create_table('college_stats',
+    sa.Column('college_id', sa.Integer(), nullable=False),
+    sa.Column('subjects', sa.Integer(), nullable=False),
+    sa.Column('faculties', sa.Integer(), nullable=False),
+    sa.Column('classrooms', sa.Integer(), nullable=False),
+    sa.Column('departments', sa.Integer(), nullable=False),
+    *(sa.Column(name, sa.Integer(), nullable=False) for name in VERSION_COLUMNS),
+    sa.ForeignKeyConstraint(['college_id'], ['college.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('college_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('college_stats')
@@ -0,0 +1,71 @@
+"""search indexes: name prefix and trigram indexes, see app/search/indexes.py
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+create_all() built these once app.search.indexes declared them, so a
+stamped database may have them already; existing ones are skipped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, scoped to college_id) behind the name filters
+PREFIX_INDEXES = [
+    ('subject', 'name', True),
+    ('faculty', 'name', True),
+    ('department', 'name', True),
+    ('classroom', 'room_no', True),
+    ('classroom', 'building_name', True),
+    ('users', 'username', True),
+    ('college', 'name', False),
+    ('roles', 'role_name', False),
+]
+TRIGRAM_INDEXES = [
+    ('subject', 'name'),
+    ('faculty', 'name'),
+    ('department', 'name'),
+    ('classroom', 'room_no'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    postgresql = op.get_bind().dialect.name == 'postgresql'
+    if postgresql:
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Same expressions as search_key(); text_pattern_ops keeps LIKE 'x%' indexable under any collation
+    ops = ' text_pattern_ops' if postgresql else ''
+    for table, column, scoped in PREFIX_INDEXES:
+        op.create_index(
+            f'ix_{table}_{column}_prefix', table,
+            [*(['college_id'] if scoped else []), sa.text(f'trim(lower({column})){ops}')],
+            if_not_exists=True,
+        )
+    if postgresql:
+        for table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                f'ix_{table}_{column}_trgm', table,
+                [sa.text(f'trim(lower({column})) gin_trgm_ops')],
+                postgresql_using='gin',
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        for table, column in reversed(TRIGRAM_INDEXES):
+            op.drop_index(f'ix_{table}_{column}_trgm', table_name=table)
+    for table, column, _ in reversed(PREFIX_INDEXES):
+        op.drop_index(f'ix_{table}_{column}_prefix', table_name=table)
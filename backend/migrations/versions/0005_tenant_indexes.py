@@ -0,0 +1,68 @@
+"""composite (college_id, ...) indexes for the tenant-scoped queries
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+The startup migration builds them with plain CREATE INDEX. On a large
+PostgreSQL database, run this revision by hand before deploying to build
+them CONCURRENTLY, so writes carry on meanwhile:
+
+    alembic -x concurrently=true upgrade 0005
+
+CONCURRENTLY waits out every open transaction, including those of app
+workers queued on the migration lock, so it is never used at startup.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    # Every list endpoint: WHERE college_id = ? [AND id > after] ORDER BY id
+    ('ix_subject_college_id_id', 'subject', ['college_id', 'id']),
+    ('ix_faculty_college_id_id', 'faculty', ['college_id', 'id']),
+    ('ix_classroom_college_id_id', 'classroom', ['college_id', 'id']),
+    ('ix_department_college_id_id', 'department', ['college_id', 'id']),
+    ('ix_timetable_college_id_id', 'timetable', ['college_id', 'id']),
+    ('ix_users_college_id_id', 'users', ['college_id', 'id']),
+    # concurrent_timetable_ids(): a college's timetables of one term
+    ('ix_timetable_college_id_term', 'timetable', ['college_id', 'academic_year', 'semester']),
+    # Faculty workload report: subjects per teacher
+    ('ix_subject_college_id_faculty_id', 'subject', ['college_id', 'faculty_id']),
+    # build_problem(): subjects and rooms of the departments being scheduled
+    ('ix_subject_department_id', 'subject', ['department_id']),
+    ('ix_classroom_department_id', 'classroom', ['department_id']),
+]
+
+
+def concurrently() -> bool:
+    return context.get_x_argument(as_dictionary=True).get('concurrently', '').lower() == 'true'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not concurrently():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True)
+        return
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not concurrently():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
+        return
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,43 @@
+"""timetables version: occupancy indexes check it instead of scanning the term
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+Also seeds the stats row of every college that has none yet, so the
+version exists for every college from here on.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTED = [('subjects', 'subject'), ('faculties', 'faculty'), ('classrooms', 'classroom'), ('departments', 'department')]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('college_stats')}
+    if 'timetables_version' not in existing:
+        op.add_column('college_stats', sa.Column('timetables_version', sa.Integer(), nullable=False, server_default='0'))
+
+    counts = ', '.join(f'(SELECT count(*) FROM {table} WHERE {table}.college_id = college.id)' for _, table in COUNTED)
+    # The *_version columns of a stamped database may have no server default
+    versions = ['subjects_version', 'faculties_version', 'classrooms_version', 'departments_version', 'timetables_version']
+    op.execute(
+        f"INSERT INTO college_stats (college_id, {', '.join(column for column, _ in COUNTED)}, {', '.join(versions)}) "
+        f"SELECT college.id, {counts}, {', '.join('0' for _ in versions)} FROM college "
+        "WHERE NOT EXISTS (SELECT 1 FROM college_stats WHERE college_stats.college_id = college.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('college_stats', 'timetables_version')
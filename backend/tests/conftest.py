@@ -0,0 +1,66 @@
+import os
+import tempfile
+
+# Settings are read at import time: point them at a throwaway database
+# before anything imports the app. TEST_DB_URL runs the suite against a
+# real server instead; its tables are dropped and rebuilt.
+_database = os.path.join(tempfile.mkdtemp(prefix="timetable-tests-"), "test.db")
+os.environ["DB_URL"] = os.environ.get("TEST_DB_URL", f"sqlite:///{_database}")
+os.environ["SQL_ECHO"] = "false"
+for name, value in {"POSTGRES_USER": "test", "POSTGRES_PASSWORD": "test", "POSTGRES_DB": "test", "SECRET_KEY": "test"}.items():
+    os.environ.setdefault(name, value)
+
+import pytest  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+from app.database import engine, rebuild_schema  # noqa: E402
+import app.main  # noqa: E402,F401  (every model mapped before tests build any)
+from app.models.classroom import Classroom  # noqa: E402
+from app.models.college import College  # noqa: E402
+from app.models.department import Department  # noqa: E402
+from app.models.faculty import Faculty  # noqa: E402
+from app.models.subject import Subject  # noqa: E402
+from app.models.timetable import SemesterEnum, Timetable  # noqa: E402
+
+
+def _seed_rows(college_id: int, start: int, count: int):
+    """One department, faculty, subject, classroom and timetable per i.
+
+    Every row gets its own related rows, so lazy loads cannot be served
+    from the identity map.
+    """
+    with Session(engine) as session:
+        for i in range(start, start + count):
+            department = Department(name=f"D{i}", year=1, college_id=college_id)
+            session.add(department)
+            session.flush()
+            faculty = Faculty(name=f"F{i}", department_id=department.id, college_id=college_id)
+            session.add(faculty)
+            session.flush()
+            session.add(Subject(name=f"S{i}", faculty_id=faculty.id, department_id=department.id, college_id=college_id))
+            session.add(Classroom(building_name="B", room_no=str(i), capacity=60, department_id=department.id, college_id=college_id))
+            session.add(Timetable(
+                college_id=college_id, department_id=department.id,
+                class_coordinator_id=faculty.id, academic_year="2026", semester=SemesterEnum.SEMESTER_1,
+            ))
+        session.commit()
+
+
+@pytest.fixture(scope="session")
+def seed_rows():
+    return _seed_rows
+
+
+@pytest.fixture(scope="module")
+def schema():
+    """A fresh schema for the module, built through the migrations like a deployment's."""
+    rebuild_schema(engine)
+
+
+@pytest.fixture(scope="module")
+def college_ids(schema) -> list[int]:
+    # Several tenants, so college_id filters are selective
+    with Session(engine) as session:
+        colleges = [College(name=f"Test College {i}") for i in range(5)]
+        session.add_all(colleges)
+        session.commit()
+        return [college.id for college in colleges]
@@ -0,0 +1,51 @@
+"""A list endpoint's SQL statement count must not grow with the number of rows."""
+import pytest
+from fastapi.testclient import TestClient
+from app.database import QueryCounter
+from app.main import app
+
+LIST_ENDPOINTS = [
+    "/subject/",
+    "/faculty/",
+    "/classroom/",
+    "/department/",
+    "/timetable/",
+    "/user/",
+    "/college/",
+    "/roles/",
+]
+
+
+def count_statements(client: TestClient, headers: dict) -> dict[str, int]:
+    counts = {}
+    for path in LIST_ENDPOINTS:
+        with QueryCounter() as counter:
+            response = client.get(path, headers=headers)
+        response.raise_for_status()
+        counts[path] = counter.count
+    return counts
+
+
+@pytest.fixture(scope="module")
+def statement_counts(college_ids, seed_rows) -> tuple[dict, dict]:
+    """Statements per endpoint with 2 rows of everything, then with 20."""
+    college_id = college_ids[0]
+    with TestClient(app) as client:
+        client.post("/auth/register", json={
+            "username": "checker", "email": "checker@gmail.com",
+            "phone_number": None, "password": "checker", "college_id": college_id,
+        }).raise_for_status()
+        token = client.post("/auth/login", data={"username": "checker@gmail.com", "password": "checker"}).json()
+        headers = {"Authorization": f"Bearer {token['access_token']}"}
+
+        seed_rows(college_id, 0, 2)
+        small = count_statements(client, headers)
+        seed_rows(college_id, 2, 18)
+        large = count_statements(client, headers)
+    return small, large
+
+
+@pytest.mark.parametrize("path", LIST_ENDPOINTS)
+def test_statements_do_not_grow_with_rows(statement_counts, path):
+    small, large = statement_counts
+    assert large[path] <= small[path], f"{path}: {small[path]} statements for 2 rows, {large[path]} for 20"
@@ -0,0 +1,77 @@
+"""Tenant-scoped queries must use the indexes migration 0005 built for them.
+
+Plans come from EXPLAIN QUERY PLAN on SQLite, or from EXPLAIN with
+sequential scans disabled on PostgreSQL.
+"""
+import pytest
+from sqlmodel import func, select
+from app.database import engine
+from app.crud.timetable import concurrent_timetable_ids
+from app.models.classroom import Classroom
+from app.models.department import Department
+from app.models.faculty import Faculty
+from app.models.subject import Subject
+from app.models.timetable import SemesterEnum, Timetable
+from app.models.user import User
+
+
+def query_shapes(college_id: int) -> dict[str, tuple[str, object]]:
+    """label -> (index expected in the plan, statement) for the queries behind the endpoints."""
+    shapes = {}
+    # fetch_page(): WHERE college_id = ? AND id > after ORDER BY id LIMIT n
+    for model, table in [
+        (Subject, "subject"), (Faculty, "faculty"), (Classroom, "classroom"),
+        (Department, "department"), (Timetable, "timetable"), (User, "users"),
+    ]:
+        shapes[f"list {table}"] = (
+            f"ix_{table}_college_id_id",
+            select(model).where(model.college_id == college_id, model.id > 10).order_by(model.id).limit(51),
+        )
+    term = Timetable(college_id=college_id, academic_year="2026", semester=SemesterEnum.SEMESTER_1)
+    shapes["concurrent timetables"] = ("ix_timetable_college_id_term", concurrent_timetable_ids(term))
+    shapes["subjects per faculty"] = (
+        "ix_subject_college_id_faculty_id",
+        select(Subject.faculty_id, func.count(Subject.id))
+        .where(Subject.college_id == college_id)
+        .group_by(Subject.faculty_id),
+    )
+    shapes["subjects of departments"] = (
+        "ix_subject_department_id",
+        select(Subject).where(Subject.department_id.in_([1, 2, 3])),
+    )
+    shapes["classrooms of departments"] = (
+        "ix_classroom_department_id",
+        select(Classroom.id, Classroom.department_id).where(Classroom.department_id.in_([1, 2, 3])),
+    )
+    return shapes
+
+
+def plan(connection, statement) -> str:
+    sql = str(statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    if engine.dialect.name == "sqlite":
+        return "\n".join(row[3] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+    return "\n".join(row[0] for row in connection.exec_driver_sql(f"EXPLAIN {sql}"))
+
+
+@pytest.fixture(scope="module")
+def plans(college_ids, seed_rows) -> dict[str, tuple[str, str]]:
+    """label -> (expected index, plan)."""
+    for college_id in college_ids:
+        seed_rows(college_id, 0, 40)
+    found = {}
+    with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            # A few hundred rows fit in one page; ask whether the index *can* serve the query
+            connection.exec_driver_sql("SET enable_seqscan = off")
+        else:
+            connection.exec_driver_sql("ANALYZE")
+        for label, (index, statement) in query_shapes(college_ids[0]).items():
+            found[label] = (index, plan(connection, statement))
+        connection.rollback()
+    return found
+
+
+@pytest.mark.parametrize("label", list(query_shapes(0)))
+def test_query_uses_tenant_index(plans, label):
+    index, found = plans[label]
+    assert index in found, f"{label}: expected {index} in\n{found}"